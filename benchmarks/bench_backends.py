@@ -0,0 +1,74 @@
+"""
+Benchmark of the call latency of the ctypes and cffi binding backends.
+
+update_domains, diag_manager.send_data and horiz_interp.interp are
+timed with each backend bound to the stand-in cFMS library built by
+benchmarks/stub/build_stub.py, so the measured time is the python and
+binding overhead of the call.
+
+Usage:
+    python benchmarks/bench_backends.py [--ncalls N] [--libpath PATH]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+
+import pyfms
+from pyfms.utils.backends import backends
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "stub"))
+import build_stub  # noqa: E402
+
+
+def get_cases() -> dict:
+
+    nx, ny, nz = 32, 32, 10
+    domain = pyfms.mpp_domains.define_domains(
+        [0, nx - 1, 0, ny - 1], [1, 1], whalo=2, ehalo=2, shalo=2, nhalo=2
+    )
+    field2d = np.zeros((nx + 4, ny + 4), dtype=np.float64)
+    field3d = np.zeros((nx + 4, ny + 4, nz), dtype=np.float64)
+    data_in = np.zeros((nx, ny), dtype=np.float64)
+    out = np.zeros((8, 8), dtype=np.float64)
+
+    update_domains = pyfms.mpp_domains.update_domains
+    send_data = pyfms.diag_manager.send_data
+    interp = pyfms.horiz_interp.interp
+
+    return {
+        "update_domains(2d)": lambda: update_domains(field2d, domain.domain_id),
+        "update_domains(3d)": lambda: update_domains(field3d, domain.domain_id),
+        "send_data": lambda: send_data(1, field3d),
+        "interp": lambda: interp(0, data_in),
+        "interp(out)": lambda: interp(0, data_in, out=out),
+    }
+
+
+def main(ncalls: int, libpath: str):
+
+    if libpath is None:
+        libpath = build_stub.build()
+
+    results = {}
+    for backend in backends:
+        pyfms.cfms.init(libpath=libpath, lazy=False, backend=backend)
+        for name, case in get_cases().items():
+            seconds = min(timeit.repeat(case, number=ncalls, repeat=5))
+            results.setdefault(name, {})[backend] = seconds / ncalls * 1.0e6
+
+    print(f"{'wrapper':<24s}" + "".join(f"{b + ' (us)':>14s}" for b in backends))
+    for name, times in results.items():
+        print(f"{name:<24s}" + "".join(f"{times[b]:>14.2f}" for b in backends))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ncalls", type=int, default=5000)
+    parser.add_argument("--libpath", default=None, help="stub library to use")
+    args = parser.parse_args()
+    main(args.ncalls, args.libpath)
@@ -0,0 +1,121 @@
+"""
+Microbenchmark for the per-call overhead of building cFMS arguments.
+
+Compares the arglist construction used before call plans
+(set_list/set_array/set_c_* on every call) with
+pyfms.utils.ctypes_utils.CallPlan for mpp_domains.update_domains.
+
+Usage:
+    touch input.nml
+    python benchmarks/bench_call_plan.py [--ncalls N]
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+
+import pyfms
+from pyfms.utils.ctypes_utils import (
+    CallPlan,
+    set_array,
+    set_c_bool,
+    set_c_int,
+    set_c_str,
+    set_list,
+)
+
+
+def legacy_arglist(field, domain_id, whalo, ehalo, shalo, nhalo):
+
+    arglist = []
+    set_list(field.shape, np.int32, arglist)
+    set_array(field, arglist)
+    set_c_int(domain_id, arglist)
+    set_c_int(None, arglist)
+    set_c_bool(None, arglist)
+    set_c_int(None, arglist)
+    set_c_int(whalo, arglist)
+    set_c_int(ehalo, arglist)
+    set_c_int(shalo, arglist)
+    set_c_int(nhalo, arglist)
+    set_c_str(None, arglist)
+    set_c_int(None, arglist)
+    set_c_bool(True, arglist)
+    return arglist
+
+
+def report(name: str, seconds: float, ncalls: int):
+    print(f"{name:<40s} {seconds / ncalls * 1.0e6:10.3f} us/call")
+
+
+def main(ncalls: int):
+
+    pyfms.fms.init()
+
+    halo = 1
+    global_indices = [0, 7, 0, 7]
+    layout = pyfms.mpp_domains.define_layout(global_indices, pyfms.mpp.npes())
+    domain = pyfms.mpp_domains.define_domains(
+        global_indices,
+        layout,
+        whalo=halo,
+        ehalo=halo,
+        shalo=halo,
+        nhalo=halo,
+    )
+    field = np.zeros((domain.xsize_d, domain.ysize_d), dtype=np.float64)
+    args = (domain.domain_id, halo, halo, halo, halo)
+
+    function = pyfms.mpp_domains._lib.cFMS_update_domains_double_2d
+
+    # argument marshalling only, the cFMS function is not called
+    plan = CallPlan(function)
+    plan.function = lambda *arglist: None
+    seconds = timeit.timeit(lambda: legacy_arglist(field, *args), number=ncalls)
+    report("marshalling: set_c_* arglist", seconds, ncalls)
+    seconds = timeit.timeit(
+        lambda: plan(
+            field.shape,
+            field,
+            domain.domain_id,
+            None,
+            None,
+            None,
+            halo,
+            halo,
+            halo,
+            halo,
+            None,
+            None,
+            True,
+        ),
+        number=ncalls,
+    )
+    report("marshalling: CallPlan", seconds, ncalls)
+
+    # full call including the halo update in FMS
+    seconds = timeit.timeit(
+        lambda: function(*legacy_arglist(field, *args)), number=ncalls
+    )
+    report("update_domains: set_c_* arglist", seconds, ncalls)
+    seconds = timeit.timeit(
+        lambda: pyfms.mpp_domains.update_domains(
+            field,
+            domain_id=domain.domain_id,
+            whalo=halo,
+            ehalo=halo,
+            shalo=halo,
+            nhalo=halo,
+        ),
+        number=ncalls,
+    )
+    report("update_domains: CallPlan", seconds, ncalls)
+
+    pyfms.fms.end()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ncalls", type=int, default=100000)
+    main(parser.parse_args().ncalls)
@@ -0,0 +1,88 @@
+"""
+Benchmark of gathering a 3D field to the root PE.
+
+The field is gathered with one mpp.gather call per vertical level,
+and with a single mpp.gather call moving all levels in one collective
+into a contiguous receiving array.
+
+The benchmark is run with cFMS under MPI at increasing PE counts,
+for example
+    for n in 4 8 16 32 64; do
+        mpirun -n $n python benchmarks/bench_gather_levels.py
+    done
+
+Usage:
+    python benchmarks/bench_gather_levels.py [--nx NX] [--nz NZ]
+        [--nsteps N] [--stub]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+
+import pyfms
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "stub"))
+import build_stub  # noqa: E402
+
+
+def main(nx: int, nz: int, nsteps: int, stub: bool):
+
+    if stub:
+        pyfms.cfms.init(libpath=build_stub.build())
+
+    mpp, mpp_domains = pyfms.mpp, pyfms.mpp_domains
+
+    pyfms.fms.init()
+
+    global_indices = [0, nx - 1, 0, nx - 1]
+    domain = mpp_domains.define_domains(
+        global_indices, mpp_domains.define_layout(global_indices, mpp.npes())
+    )
+    is_root_pe = mpp.pe() == mpp.root_pe()
+
+    field = np.random.random((domain.xsize_c, domain.ysize_c, nz))
+    shape = [nx, nx, nz] if is_root_pe else None
+    gathered = np.zeros(shape) if is_root_pe else None
+
+    def per_level():
+        for k in range(nz):
+            level = mpp.gather(
+                field[:, :, k], rbuf_shape=shape and shape[:2], domain=domain
+            )
+            if is_root_pe:
+                gathered[:, :, k] = level
+
+    def single():
+        mpp.gather(field, domain=domain, out=gathered)
+
+    per_level()
+    answer = None if gathered is None else gathered.copy()
+    single()
+    if is_root_pe:
+        assert np.array_equal(gathered, answer)
+
+    results = {}
+    for name, case in [("per level", per_level), ("single", single)]:
+        results[name] = min(timeit.repeat(case, number=nsteps, repeat=3)) / nsteps
+
+    if is_root_pe:
+        print(f"global field of shape {tuple(shape)} on {mpp.npes()} PEs")
+        for name, seconds in results.items():
+            print(f"{name:<16s}{seconds * 1.0e3:>10.3f} ms/gather")
+
+    pyfms.fms.end()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nx", type=int, default=192)
+    parser.add_argument("--nz", type=int, default=64)
+    parser.add_argument("--nsteps", type=int, default=20)
+    parser.add_argument("--stub", action="store_true", help="use the stub library")
+    args = parser.parse_args()
+    main(args.nx, args.nz, args.nsteps, args.stub)
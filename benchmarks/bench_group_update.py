@@ -0,0 +1,89 @@
+"""
+Benchmark of halo updates of many fields: one update_domains call
+per field against a single group update of all fields.
+
+The benchmark is run with cFMS under MPI, for example
+    mpirun -n 4 python benchmarks/bench_group_update.py
+
+With --stub, the stand-in cFMS library built by
+benchmarks/stub/build_stub.py is used on a single PE to measure
+the python overhead of both approaches.
+
+Usage:
+    python benchmarks/bench_group_update.py [--nfields N] [--nz NZ]
+        [--nx NX] [--halo H] [--nsteps N] [--stub]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+
+import pyfms
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "stub"))
+import build_stub  # noqa: E402
+
+
+def main(nfields: int, nz: int, nx: int, halo: int, nsteps: int, stub: bool):
+
+    if stub:
+        pyfms.cfms.init(libpath=build_stub.build())
+
+    mpp, mpp_domains = pyfms.mpp, pyfms.mpp_domains
+
+    pyfms.fms.init()
+
+    global_indices = [0, nx - 1, 0, nx - 1]
+    domain = mpp_domains.define_domains(
+        global_indices,
+        mpp_domains.define_layout(global_indices, mpp.npes()),
+        whalo=halo,
+        ehalo=halo,
+        shalo=halo,
+        nhalo=halo,
+        xflags=mpp_domains.CYCLIC_GLOBAL_DOMAIN,
+        yflags=mpp_domains.CYCLIC_GLOBAL_DOMAIN,
+    )
+    halos = dict(whalo=halo, ehalo=halo, shalo=halo, nhalo=halo)
+
+    shape = (domain.xsize_d, domain.ysize_d, nz)
+    fields = [np.random.random(shape) for _ in range(nfields)]
+
+    def per_field():
+        for field in fields:
+            mpp_domains.update_domains(field, domain.domain_id, **halos)
+
+    group = mpp_domains.create_group_update(domain, fields, **halos)
+
+    def grouped():
+        mpp_domains.do_group_update(group)
+
+    results = {}
+    for name, case in [("update_domains loop", per_field), ("group update", grouped)]:
+        case()
+        results[name] = min(timeit.repeat(case, number=nsteps, repeat=3)) / nsteps
+
+    mpp_domains.clear_group_update(group)
+
+    if mpp.pe() == mpp.root_pe():
+        print(f"{nfields} fields of shape {shape} on {mpp.npes()} PEs")
+        for name, seconds in results.items():
+            print(f"{name:<24s}{seconds * 1.0e3:>10.3f} ms/step")
+
+    pyfms.fms.end()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nfields", type=int, default=20)
+    parser.add_argument("--nz", type=int, default=10)
+    parser.add_argument("--nx", type=int, default=96)
+    parser.add_argument("--halo", type=int, default=3)
+    parser.add_argument("--nsteps", type=int, default=50)
+    parser.add_argument("--stub", action="store_true", help="use the stub library")
+    args = parser.parse_args()
+    main(args.nfields, args.nz, args.nx, args.halo, args.nsteps, args.stub)
@@ -0,0 +1,57 @@
+"""
+Benchmark for the time taken to import pyfms.
+
+Each case is timed in a fresh interpreter.  The lazy cases load
+the cFMS library and bind the cFMS functions only for the modules
+that are used, while the eager case binds every module as
+pyfms did before lazy binding.
+
+Usage:
+    python benchmarks/bench_import_time.py [--repeat N]
+"""
+
+import argparse
+import subprocess
+import sys
+
+
+cases = {
+    "python": "pass",
+    "import pyfms (lazy)": "import pyfms",
+    "import pyfms; pyfms.mpp (lazy)": "import pyfms; pyfms.mpp",
+    "import pyfms; pyfms.mpp_domains (lazy)": "import pyfms; pyfms.mpp_domains",
+    "import pyfms (eager)": "import pyfms; pyfms.cfms.init(lazy=False)",
+}
+
+timer = """
+from time import perf_counter
+start = perf_counter()
+{code}
+print(perf_counter() - start)
+"""
+
+
+def run(code: str) -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", timer.format(code=code)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return float(result.stdout.split()[-1])
+
+
+def main(repeat: int):
+
+    for name, code in cases.items():
+        times = [run(code) for _ in range(repeat)]
+        print(
+            f"{name:<45s} min {min(times) * 1.0e3:8.2f} ms"
+            f"  mean {sum(times) / repeat * 1.0e3:8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=10)
+    main(parser.parse_args().repeat)
@@ -0,0 +1,118 @@
+"""
+Benchmark of overlapping a halo update with computation.
+
+A 5-point Laplacian is applied to the compute domain of a 3D field
+after a blocking update_domains, and with the update started by
+start_update_domains while the interior, which does not read the
+halos, is computed.  The cells next to the halos are computed once
+the update completes.
+
+The benchmark is run with cFMS under MPI, for example
+    mpirun -n 4 python benchmarks/bench_overlap.py
+
+Usage:
+    python benchmarks/bench_overlap.py [--nx NX] [--nz NZ]
+        [--halo H] [--nsteps N] [--stub]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+
+import pyfms
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "stub"))
+import build_stub  # noqa: E402
+
+
+def laplacian(field: np.ndarray, out: np.ndarray, i: slice, j: slice):
+
+    """
+    Computes the 5-point Laplacian of field in out[i, j]
+    """
+
+    out[i, j] = (
+        field[i.start - 1 : i.stop - 1, j]
+        + field[i.start + 1 : i.stop + 1, j]
+        + field[i, j.start - 1 : j.stop - 1]
+        + field[i, j.start + 1 : j.stop + 1]
+        - 4.0 * field[i, j]
+    )
+
+
+def main(nx: int, nz: int, halo: int, nsteps: int, stub: bool):
+
+    if stub:
+        pyfms.cfms.init(libpath=build_stub.build())
+
+    mpp, mpp_domains = pyfms.mpp, pyfms.mpp_domains
+
+    pyfms.fms.init()
+
+    global_indices = [0, nx - 1, 0, nx - 1]
+    domain = mpp_domains.define_domains(
+        global_indices,
+        mpp_domains.define_layout(global_indices, mpp.npes()),
+        whalo=halo,
+        ehalo=halo,
+        shalo=halo,
+        nhalo=halo,
+        xflags=mpp_domains.CYCLIC_GLOBAL_DOMAIN,
+        yflags=mpp_domains.CYCLIC_GLOBAL_DOMAIN,
+    )
+    halos = dict(whalo=halo, ehalo=halo, shalo=halo, nhalo=halo)
+
+    field = np.random.random((domain.xsize_d, domain.ysize_d, nz))
+    out = np.zeros_like(field)
+
+    # compute domain, its interior and the cells next to the halos
+    ie, je = halo + domain.xsize_c, halo + domain.ysize_c
+    compute = (slice(halo, ie), slice(halo, je))
+    interior = (slice(halo + 1, ie - 1), slice(halo + 1, je - 1))
+    edges = [
+        (slice(halo, halo + 1), slice(halo, je)),
+        (slice(ie - 1, ie), slice(halo, je)),
+        (slice(halo + 1, ie - 1), slice(halo, halo + 1)),
+        (slice(halo + 1, ie - 1), slice(je - 1, je)),
+    ]
+
+    def blocking():
+        mpp_domains.update_domains(field, domain.domain_id, **halos)
+        laplacian(field, out, *compute)
+
+    def overlapped():
+        with mpp_domains.start_update_domains(field, domain, **halos):
+            laplacian(field, out, *interior)
+        for edge in edges:
+            laplacian(field, out, *edge)
+
+    overlapped()
+    answer = out.copy()
+    blocking()
+    assert np.array_equal(out, answer)
+
+    results = {}
+    for name, case in [("blocking", blocking), ("overlapped", overlapped)]:
+        results[name] = min(timeit.repeat(case, number=nsteps, repeat=3)) / nsteps
+
+    if mpp.pe() == mpp.root_pe():
+        print(f"field of shape {field.shape} on {mpp.npes()} PEs")
+        for name, seconds in results.items():
+            print(f"{name:<16s}{seconds * 1.0e3:>10.3f} ms/step")
+
+    pyfms.fms.end()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nx", type=int, default=192)
+    parser.add_argument("--nz", type=int, default=32)
+    parser.add_argument("--halo", type=int, default=3)
+    parser.add_argument("--nsteps", type=int, default=20)
+    parser.add_argument("--stub", action="store_true", help="use the stub library")
+    args = parser.parse_args()
+    main(args.nx, args.nz, args.halo, args.nsteps, args.stub)
@@ -0,0 +1,247 @@
+"""
+Benchmark of the per-call python overhead of every public pyfms wrapper.
+
+The wrappers are bound to the stand-in cFMS library built by
+benchmarks/stub/build_stub.py, whose functions do no work, so the
+measured time is the time spent in python and ctypes.  Wrappers
+without a benchmark case are listed at the end of the report.
+
+Usage:
+    python benchmarks/bench_wrappers.py [--ncalls N] [--libpath PATH] [--filter STR]
+                                      [--backend ctypes|cffi]
+"""
+
+import argparse
+import importlib
+import inspect
+import os
+import sys
+import timeit
+
+import numpy as np
+
+import pyfms
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "stub"))
+import build_stub  # noqa: E402
+
+
+modules = [
+    "pyfms.py_fms.fms",
+    "pyfms.py_mpp.mpp",
+    "pyfms.py_mpp.mpp_domains",
+    "pyfms.py_horiz_interp.horiz_interp",
+    "pyfms.utils.grid_utils",
+    "pyfms.py_data_override.data_override",
+    "pyfms.py_diag_manager.diag_manager",
+]
+
+
+def get_cases() -> dict:
+
+    """
+    Returns the benchmark cases keyed by module.function.
+    Each case calls the wrapper once
+    """
+
+    fms = pyfms.fms
+    mpp = pyfms.mpp
+    mpp_domains = pyfms.mpp_domains
+    horiz_interp = pyfms.horiz_interp
+    grid_utils = pyfms.grid_utils
+    data_override = pyfms.data_override
+    diag_manager = pyfms.diag_manager
+
+    nx, ny, nz = 32, 32, 10
+    global_indices = [0, nx - 1, 0, ny - 1]
+    domain = mpp_domains.define_domains(global_indices, [1, 1], whalo=2, ehalo=2)
+    domain_id = domain.domain_id
+
+    field2d = np.zeros((nx + 4, ny), dtype=np.float64)
+    field3d = np.zeros((nx + 4, ny, nz), dtype=np.float64)
+    lon, lat = np.meshgrid(np.linspace(0, 1, nx + 1), np.linspace(0, 1, ny + 1))
+    lon_out, lat_out = np.meshgrid(np.linspace(0, 1, 9), np.linspace(0, 1, 9))
+    data_in = np.zeros((nx, ny), dtype=np.float64)
+    mask = np.ones((nx, ny), dtype=np.float64)
+    out = np.zeros((8, 8), dtype=np.float64)
+    sbuf = np.zeros(100, dtype=np.float64)
+    axis = np.arange(nx, dtype=np.float64)
+
+    c = {}
+
+    c["fms.init"] = lambda: fms.init()
+    c["fms.end"] = lambda: fms.end()
+    c["fms.module_is_initialized"] = lambda: fms.module_is_initialized()
+
+    c["mpp.clock"] = lambda: mpp.clock("bench")
+    c["mpp.declare_pelist"] = lambda: mpp.declare_pelist([0], name="bench")
+    c["mpp.error"] = lambda: mpp.error(fms.NOTE, "bench")
+    c["mpp.gather"] = lambda: mpp.gather(sbuf, rbuf_size=100)
+    c["mpp.gather(2d)"] = lambda: mpp.gather(
+        data_in, rbuf_shape=[nx, ny], domain=domain
+    )
+    c["mpp.gatherv"] = lambda: mpp.gatherv(sbuf, ssize=100, rsize=[100])
+    c["mpp.get_current_pelist"] = lambda: mpp.get_current_pelist(1)
+    c["mpp.npes"] = lambda: mpp.npes()
+    c["mpp.pe"] = lambda: mpp.pe()
+    c["mpp.root_pe"] = lambda: mpp.root_pe()
+    c["mpp.set_current_pelist"] = lambda: mpp.set_current_pelist([0])
+
+    c["mpp_domains.define_cubic_mosaic"] = lambda: mpp_domains.define_cubic_mosaic(
+        [nx] * 6, [ny] * 6, global_indices, [1, 1], 6, halo=2
+    )
+    c["mpp_domains.define_domains"] = lambda: mpp_domains.define_domains(
+        global_indices, [1, 1], whalo=2, ehalo=2
+    )
+    c["mpp_domains.define_io_domain"] = lambda: mpp_domains.define_io_domain(
+        [1, 1], domain_id
+    )
+    c["mpp_domains.define_layout"] = lambda: mpp_domains.define_layout(
+        global_indices, 1
+    )
+    c["mpp_domains.define_nest_domains"] = lambda: mpp_domains.define_nest_domains(
+        1, 2, [1], [2], [1], [1], [4], [1], [4], [1, 1], [2], [2], domain_id
+    )
+    c["mpp_domains.domain_is_initialized"] = lambda: mpp_domains.domain_is_initialized(
+        domain_id
+    )
+    c["mpp_domains.get_compute_domain"] = lambda: mpp_domains.get_compute_domain(
+        domain_id
+    )
+    c["mpp_domains.get_data_domain"] = lambda: mpp_domains.get_data_domain(domain_id)
+    c["mpp_domains.get_domain_name"] = lambda: mpp_domains.get_domain_name(domain_id)
+    c["mpp_domains.get_domain_pelist"] = lambda: mpp_domains.get_domain_pelist(
+        domain_id
+    )
+    c["mpp_domains.get_layout"] = lambda: mpp_domains.get_layout(domain_id)
+    c["mpp_domains.set_compute_domain"] = lambda: mpp_domains.set_compute_domain(
+        domain_id, xbegin=0, xend=nx - 1
+    )
+    c["mpp_domains.set_current_domain"] = lambda: mpp_domains.set_current_domain(
+        domain_id
+    )
+    c["mpp_domains.set_data_domain"] = lambda: mpp_domains.set_data_domain(
+        domain_id, xbegin=0, xend=nx - 1
+    )
+    c["mpp_domains.set_global_domain"] = lambda: mpp_domains.set_global_domain(
+        domain_id, xbegin=0, xend=nx - 1
+    )
+    c["mpp_domains.update_domains"] = lambda: mpp_domains.update_domains(
+        field2d, domain_id, whalo=2, ehalo=2
+    )
+    c["mpp_domains.update_domains(3d)"] = lambda: mpp_domains.update_domains(
+        field3d, domain_id, whalo=2, ehalo=2
+    )
+    c["mpp_domains.vector_update_domains"] = lambda: mpp_domains.vector_update_domains(
+        field2d, field2d, domain_id, whalo=2, ehalo=2
+    )
+
+    c[
+        "horiz_interp.create_xgrid_2dx2d_order1"
+    ] = lambda: horiz_interp.create_xgrid_2dx2d_order1(lon, lat, lon, lat, mask)
+    c["horiz_interp.end"] = lambda: horiz_interp.end()
+    c["horiz_interp.get_area_frac_dst"] = lambda: horiz_interp.get_area_frac_dst(0)
+    c["horiz_interp.get_i_dst"] = lambda: horiz_interp.get_i_dst(0)
+    c["horiz_interp.get_i_src"] = lambda: horiz_interp.get_i_src(0)
+    c["horiz_interp.get_interp_method"] = lambda: horiz_interp.get_interp_method(0)
+    c["horiz_interp.get_j_dst"] = lambda: horiz_interp.get_j_dst(0)
+    c["horiz_interp.get_j_src"] = lambda: horiz_interp.get_j_src(0)
+    c["horiz_interp.get_maxxgrid"] = lambda: horiz_interp.get_maxxgrid()
+    c["horiz_interp.get_nlat_dst"] = lambda: horiz_interp.get_nlat_dst(0)
+    c["horiz_interp.get_nlat_src"] = lambda: horiz_interp.get_nlat_src(0)
+    c["horiz_interp.get_nlon_dst"] = lambda: horiz_interp.get_nlon_dst(0)
+    c["horiz_interp.get_nlon_src"] = lambda: horiz_interp.get_nlon_src(0)
+    c["horiz_interp.get_nxgrid"] = lambda: horiz_interp.get_nxgrid(0)
+    c["horiz_interp.get_weights"] = lambda: horiz_interp.get_weights(
+        lon, lat, lon_out, lat_out, interp_method="conservative"
+    )
+    c["horiz_interp.init"] = lambda: horiz_interp.init(1)
+    c["horiz_interp.interp"] = lambda: horiz_interp.interp(0, data_in)
+    c["horiz_interp.interp(out)"] = lambda: horiz_interp.interp(0, data_in, out=out)
+    c[
+        "horiz_interp.module_is_initialized"
+    ] = lambda: horiz_interp.module_is_initialized()
+
+    c["grid_utils.get_grid_area"] = lambda: grid_utils.get_grid_area(lon, lat)
+
+    c["data_override.init"] = lambda: data_override.init(atm_domain_id=domain_id)
+    c["data_override.override"] = lambda: data_override.override("OCN", "sst", data_in)
+    c["data_override.override_scalar"] = lambda: data_override.override_scalar(
+        "OCN", "co2", "float64"
+    )
+    c["data_override.set_time"] = lambda: data_override.set_time(year=1, month=1, day=1)
+
+    c["diag_manager.advance_field_time"] = lambda: diag_manager.advance_field_time(1)
+    c["diag_manager.axis_init"] = lambda: diag_manager.axis_init(
+        "x", axis, "degrees", "X", domain_id=domain_id
+    )
+    c["diag_manager.end"] = lambda: diag_manager.end()
+    c["diag_manager.init"] = lambda: diag_manager.init()
+    c[
+        "diag_manager.module_is_initialized"
+    ] = lambda: diag_manager.module_is_initialized()
+    c["diag_manager.register_field_array"] = lambda: diag_manager.register_field_array(
+        "atm", "field", "float64", axes=[1, 2]
+    )
+    c[
+        "diag_manager.register_field_scalar"
+    ] = lambda: diag_manager.register_field_scalar("atm", "scalar", "float64")
+    c["diag_manager.send_complete"] = lambda: diag_manager.send_complete(1)
+    c["diag_manager.send_data"] = lambda: diag_manager.send_data(1, data_in)
+    c["diag_manager.set_field_init_time"] = lambda: diag_manager.set_field_init_time(
+        1, 1, 1, 0, 0
+    )
+    c["diag_manager.set_field_timestep"] = lambda: diag_manager.set_field_timestep(
+        1, 3600
+    )
+    c["diag_manager.set_time_end"] = lambda: diag_manager.set_time_end(
+        year=2, month=1, day=1
+    )
+
+    return c
+
+
+def get_wrappers() -> list:
+
+    """
+    Returns the names of all public wrapper functions
+    """
+
+    names = []
+    for modname in modules:
+        module = importlib.import_module(modname)
+        for name, function in inspect.getmembers(module, inspect.isfunction):
+            if function.__module__ == modname and not name.startswith("_"):
+                names.append(f"{modname.split('.')[-1]}.{name}")
+    return names
+
+
+def main(ncalls: int, libpath: str, pattern: str, backend: str = "ctypes"):
+
+    if libpath is None:
+        libpath = build_stub.build()
+    pyfms.cfms.init(libpath=libpath, lazy=False, backend=backend)
+
+    cases = get_cases()
+
+    print(f"{'wrapper':<48s}{'us/call':>10s}")
+    for name, case in cases.items():
+        if pattern is not None and pattern not in name:
+            continue
+        seconds = min(timeit.repeat(case, number=ncalls, repeat=3))
+        print(f"{name:<48s}{seconds / ncalls * 1.0e6:>10.2f}")
+
+    missing = [name for name in get_wrappers() if name not in cases]
+    if missing:
+        print("wrappers without a benchmark case:", ", ".join(missing))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ncalls", type=int, default=2000)
+    parser.add_argument("--libpath", default=None, help="stub library to use")
+    parser.add_argument("--filter", default=None, help="run cases containing STR")
+    parser.add_argument("--backend", default="ctypes", choices=["ctypes", "cffi"])
+    args = parser.parse_args()
+    main(args.ncalls, args.libpath, args.filter, args.backend)
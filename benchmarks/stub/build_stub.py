@@ -0,0 +1,234 @@
+"""
+Builds a stand-in cFMS library for measuring the python overhead
+of the pyfms wrappers without the FMS/cFMS Fortran build.
+
+The stub exports every cFMS function bound in pyfms, with the
+signature recorded by the define functions of pyfms, and every
+constant read by pyfms.  Function bodies are no-ops, except for
+the queries that report a single PE, fixed interpolation sizes,
+and the domain given to cFMS_define_domains, so that the wrappers
+can be called in the same sequence as with cFMS, and the gathers,
+which copy the array passed.
+
+Usage:
+    python benchmarks/stub/build_stub.py [--cc CC] [--output PATH]
+
+The library is written to benchmarks/stub/build/libcFMS_stub.so by
+default and is used with pyfms.cfms.init(libpath=path_to_stub)
+"""
+
+import argparse
+import glob
+import importlib
+import os
+import re
+import subprocess
+
+import numpy as np
+
+from pyfms.utils.backends import c_type
+
+
+stubdir = os.path.dirname(os.path.abspath(__file__))
+pyfmsdir = os.path.join(stubdir, "..", "..", "pyfms")
+libpath = os.path.join(stubdir, "build", "libcFMS_stub.so")
+
+# modules defining the restype and argtypes of the cFMS functions
+definitions = [
+    "pyfms.py_data_override._functions",
+    "pyfms.py_diag_manager._functions",
+    "pyfms.py_fms._functions",
+    "pyfms.py_horiz_interp._functions",
+    "pyfms.py_mpp._mpp_domains_functions",
+    "pyfms.py_mpp._mpp_functions",
+    "pyfms.utils._grid_utils_functions",
+]
+
+# constants with values pyfms relies on.  Other integer
+# constants are numbered and other real constants are zero
+constants = {
+    "NOTE": 0,
+    "WARNING": 1,
+    "FATAL": 2,
+    "cFMS_pelist_npes": 1,
+    "PI": np.pi,
+    "RAD_TO_DEG": 180.0 / np.pi,
+    "DEG_TO_RAD": np.pi / 180.0,
+    "RADIAN": 180.0 / np.pi,
+}
+
+prelude = """
+#include <stdbool.h>
+#include <string.h>
+
+#define STUB_NDOMAINS 64
+#define STUB_NXGRID 16
+#define STUB_NLON 8
+#define STUB_NLAT 8
+
+/* isc, iec, jsc, jec, whalo, ehalo, shalo, nhalo of each domain */
+static int stub_domains[STUB_NDOMAINS][8];
+static int stub_ndomains = 0;
+"""
+
+define_domains = """
+    int id = stub_ndomains++ % STUB_NDOMAINS;
+    int *d = stub_domains[id];
+    int xhalo = a6 ? *a6 : 0, yhalo = a7 ? *a7 : 0;
+    for (int i = 0; i < 4; i++) d[i] = a0[i];
+    d[4] = a14 ? *a14 : xhalo;
+    d[5] = a15 ? *a15 : xhalo;
+    d[6] = a16 ? *a16 : yhalo;
+    d[7] = a17 ? *a17 : yhalo;
+    return id;
+"""
+
+get_domain = """
+    int *d = stub_domains[*a0 % STUB_NDOMAINS];
+    int h = {halo};
+    *a1 = d[0] - h * d[4];
+    *a2 = d[1] + h * d[5];
+    *a3 = d[2] - h * d[6];
+    *a4 = d[3] + h * d[7];
+    *a5 = *a6 = *a2 - *a1 + 1;
+    *a7 = *a8 = *a4 - *a3 + 1;
+    *a9 = *a10 = true;
+"""
+
+# function bodies that are not no-ops
+bodies = {
+    "cFMS_npes": "return 1;",
+    "cFMS_pe": "return 0;",
+    "cFMS_root_pe": "return 0;",
+    "cFMS_get_current_pelist": "if (a1) a1[0] = 0;\n    if (a3) *a3 = 0;",
+    "cFMS_define_layout": "a2[0] = *a1;\n    a2[1] = 1;",
+    "cFMS_define_domains": define_domains,
+    "cFMS_get_compute_domain": get_domain.format(halo=0),
+    "cFMS_get_data_domain": get_domain.format(halo=1),
+    "cFMS_get_layout": "a0[0] = a0[1] = 1;",
+    "cFMS_get_domain_pelist": "a0[0] = 0;",
+    "cFMS_domain_is_initialized": "return true;",
+    "get_maxxgrid": "return STUB_NXGRID;",
+    "cFMS_get_nxgrid": "*a1 = STUB_NXGRID;",
+    "cFMS_get_nlon_src": "*a1 = STUB_NLON;",
+    "cFMS_get_nlat_src": "*a1 = STUB_NLAT;",
+    "cFMS_get_nlon_dst": "*a1 = STUB_NLON;",
+    "cFMS_get_nlat_dst": "*a1 = STUB_NLAT;",
+    "cFMS_get_interp_method": "*a1 = 1;",
+}
+for ctype in ["cint", "cfloat", "cdouble"]:
+    bodies[f"cFMS_gather_1d_{ctype}"] = "if (a2) memcpy(a2, a1, *a0 * sizeof(*a1));"
+    bodies[f"cFMS_gatherv_1d_{ctype}"] = "if (a3) memcpy(a3, a1, *a2 * sizeof(*a1));"
+    bodies[
+        f"cFMS_gather_pelist_2d_{ctype}"
+    ] = "if (a7) memcpy(a7, a6, (*a1 - *a0 + 1) * (*a3 - *a2 + 1) * sizeof(*a6));"
+
+
+class _Function:
+    def __init__(self, name: str):
+        self.__name__ = name
+        self.argtypes = []
+        self.restype = None
+
+
+class _Library:
+
+    """
+    Records the functions defined by the pyfms define functions
+    """
+
+    def __init__(self):
+        self.functions = {}
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self.functions.setdefault(name, _Function(name))
+
+
+def get_functions() -> dict:
+
+    """
+    Returns the cFMS functions bound in pyfms
+    """
+
+    lib = _Library()
+    for name in definitions:
+        importlib.import_module(name).define(lib)
+    return lib.functions
+
+
+def get_constants() -> dict:
+
+    """
+    Returns the integer and real constants read by pyfms
+    """
+
+    found = {}
+    for path in glob.glob(os.path.join(pyfmsdir, "**", "*.py"), recursive=True):
+        with open(path) as f:
+            source = f.read()
+        for kind, name in re.findall(
+            r'get_constant_(int|double)\(_lib, "(\w+)"\)', source
+        ):
+            found[name] = kind
+
+    values = {}
+    for i, (name, kind) in enumerate(sorted(found.items())):
+        if kind == "int":
+            values[name] = ("int", int(constants.get(name, i + 1)))
+        else:
+            values[name] = ("double", float(constants.get(name, 0.0)))
+    return values
+
+
+def generate() -> str:
+
+    """
+    Returns the C source of the stub library
+    """
+
+    lines = [prelude]
+
+    for name, (kind, value) in get_constants().items():
+        lines.append(f"{kind} {name} = {value!r};")
+    lines.append("")
+
+    for name, function in get_functions().items():
+        args = ", ".join(
+            f"{c_type(argtype)} a{i}"
+            for i, argtype in enumerate(function.argtypes or [])
+        )
+        restype = c_type(function.restype)
+        body = bodies.get(name)
+        if body is None:
+            body = "" if restype == "void" else "return 0;"
+        lines.append(
+            f"{restype} {name}({args or 'void'})\n{{\n    {body.strip()}\n}}\n"
+        )
+
+    return "\n".join(lines)
+
+
+def build(output: str = libpath, cc: str = "cc") -> str:
+
+    """
+    Generates and compiles the stub library.
+    Returns the path to the library
+    """
+
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    source = os.path.splitext(output)[0] + ".c"
+    with open(source, "w") as f:
+        f.write(generate())
+
+    subprocess.run([cc, "-shared", "-fPIC", "-O2", "-o", output, source], check=True)
+    return output
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cc", default="cc")
+    parser.add_argument("--output", default=libpath)
+    args = parser.parse_args()
+    print(build(args.output, args.cc))
@@ -1,13 +1,50 @@
+import importlib
+
 from . import cfms
-from .py_data_override import data_override
-from .py_diag_manager import diag_manager
-from .py_field_manager.py_field_manager import FieldTable
-from .py_fms import fms
-from .py_horiz_interp import horiz_interp
-from .py_horiz_interp.interp import Interp
-from .py_mpp import mpp, mpp_domains
-from .py_mpp.domain import Domain
-from .utils import constants, grid_utils
-
-
-cfms.init()
+
+
+# public modules and classes, imported and bound to cFMS on first access
+_attributes = {
+    "buffers": ("pyfms.utils.buffers", None),
+    "constants": ("pyfms.utils.constants", None),
+    "Clock": ("pyfms.py_mpp.clock", "Clock"),
+    "CollectiveHandle": ("pyfms.py_mpp.collective_handle", "CollectiveHandle"),
+    "data_override": ("pyfms.py_data_override.data_override", None),
+    "diag_manager": ("pyfms.py_diag_manager.diag_manager", None),
+    "Domain": ("pyfms.py_mpp.domain", "Domain"),
+    "DomainArray": ("pyfms.py_mpp.domain", "DomainArray"),
+    "FieldTable": ("pyfms.py_field_manager.py_field_manager", "FieldTable"),
+    "fms": ("pyfms.py_fms.fms", None),
+    "grid_utils": ("pyfms.utils.grid_utils", None),
+    "GroupUpdate": ("pyfms.py_mpp.group_update", "GroupUpdate"),
+    "horiz_interp": ("pyfms.py_horiz_interp.horiz_interp", None),
+    "imbalance": ("pyfms.utils.imbalance", None),
+    "Interp": ("pyfms.py_horiz_interp.interp", "Interp"),
+    "mpp": ("pyfms.py_mpp.mpp", None),
+    "mpp_domains": ("pyfms.py_mpp.mpp_domains", None),
+    "profile": ("pyfms.utils.profile", None),
+    "UpdateHandle": ("pyfms.py_mpp.update_handle", "UpdateHandle"),
+}
+
+
+def __getattr__(name: str):
+
+    """
+    Imports the public pyfms modules and classes on first access.
+    Importing a module binds its cFMS functions and constants
+    """
+
+    if name not in _attributes:
+        raise AttributeError(f"module 'pyfms' has no attribute '{name}'")
+
+    modname, attribute = _attributes[name]
+    value = importlib.import_module(modname)
+    if attribute is not None:
+        value = getattr(value, attribute)
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_attributes))
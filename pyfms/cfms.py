@@ -1,62 +1,98 @@
 import ctypes
+import importlib
 import os
-
-import pyfms
+import sys
 
 
 _libpath = None
 _lib = None
+_backend = "ctypes"
+
+# wrapper modules binding cFMS functions and constants
+_modules = [
+    "pyfms.utils.constants",
+    "pyfms.utils.grid_utils",
+    "pyfms.py_data_override.data_override",
+    "pyfms.py_fms.fms",
+    "pyfms.py_diag_manager.diag_manager",
+    "pyfms.py_horiz_interp.horiz_interp",
+    "pyfms.py_mpp.mpp",
+    "pyfms.py_mpp.mpp_domains",
+]
+
+# _init functions of imported wrapper modules
+_inits: dict = {}
+
+# wrapper modules bound to the current library
+_bound: set = set()
 
+# True if loading the default library failed
+_missing = False
 
-def init(libpath: str = None):
+
+def init(libpath: str = None, lazy: bool = True, backend: str = "ctypes"):
 
     """
-    Initializes the pyfms package by
-    setting the cFMS library in all modules
-    and initializing all constants in each
-    module.  pyFMS will use the library
-    compiled during installation.  Users can override
-    this default library by specifying a cFMS library path
+    Sets the cFMS library used by pyfms.  pyFMS will use the library
+    compiled during installation.  Users can override this default
+    library by specifying a cFMS library path.
+
+    The library is loaded, and the functions and constants of each pyfms
+    module are bound, the first time the module is used (e.g., on the first
+    access of pyfms.mpp).  Modules that are already in use are rebound
+    to the new library immediately.  If lazy is False, the library is loaded
+    and all modules are bound immediately.
+
+    backend selects how the cFMS functions are called: "ctypes"
+    (default) or "cffi", which calls the functions through cffi
+    in ABI mode and requires the cffi package
     """
 
-    global _libpath, _lib
+    global _libpath, _lib, _missing, _backend
+
+    from pyfms.utils import backends
+
+    if backend not in backends.backends:
+        raise RuntimeError(f"backend must be one of {backends.backends}")
 
     if _lib is not None:
-        ctypes.CDLL(None).dlclose(_lib._handle)
-    # todo reset all _function parameters to None
+        dlclose = ctypes.CDLL(None).dlclose
+        dlclose.argtypes = [ctypes.c_void_p]
+        dlclose(_lib._handle)
 
-    if libpath is None:
-        _libpath = os.path.dirname(__file__) + "/lib/cFMS/lib/libcFMS.so"
-        try:
-            _lib = ctypes.cdll.LoadLibrary(_libpath)
-        except OSError:
-            print(
-                f"{_libpath} does not exist.  Please provide a path to cFMS with\
-                pyfms.cfms.init(libpath=path_to_cfms)"
-            )
-            return
-    else:
-        _libpath = libpath
-        _lib = ctypes.cdll.LoadLibrary(_libpath)
+    _libpath = libpath
+    _lib = None
+    _missing = False
+    _backend = backend
+    _bound.clear()
 
-    pyfms.utils.constants._init(_libpath, _lib)
-    pyfms.utils.grid_utils._init(_libpath, _lib)
-    pyfms.py_data_override.data_override._init(_libpath, _lib)
-    pyfms.py_fms.fms._init(_libpath, _lib)
-    pyfms.py_diag_manager.diag_manager._init(_libpath, _lib)
-    pyfms.py_horiz_interp.horiz_interp._init(_libpath, _lib)
-    pyfms.py_mpp.mpp._init(_libpath, _lib)
-    pyfms.py_mpp.mpp_domains._init(_libpath, _lib)
+    names = list(_inits) if lazy else _modules
+    for name in names:
+        module = importlib.import_module(name)
+        if name not in _bound:
+            _bind(name, module._init)
 
 
 def lib() -> type[ctypes.CDLL]:
 
     """
     returns the currently used ctypes.CDLL
-    cFMS object
+    cFMS object, or the CffiLibrary object for the
+    cffi backend.  The library is loaded
+    if it has not been loaded
     """
 
-    return _lib
+    return _load()
+
+
+def backend() -> str:
+
+    """
+    returns the binding backend used to
+    call the cFMS functions
+    """
+
+    return _backend
 
 
 def libpath() -> str:
@@ -67,3 +103,58 @@ def libpath() -> str:
     """
 
     return _libpath
+
+
+def _load() -> type[ctypes.CDLL]:
+
+    """
+    Loads the cFMS library if it has not been loaded.
+    Returns None if the default library does not exist
+    """
+
+    global _libpath, _lib, _missing
+
+    if _lib is not None or _missing:
+        return _lib
+
+    from pyfms.utils import backends
+
+    if _libpath is None:
+        _libpath = os.path.dirname(__file__) + "/lib/cFMS/lib/libcFMS.so"
+        try:
+            _lib = backends.load(_libpath, _backend)
+        except OSError:
+            print(
+                f"{_libpath} does not exist.  Please provide a path to cFMS with\
+                pyfms.cfms.init(libpath=path_to_cfms)"
+            )
+            _libpath = None
+            _missing = True
+    else:
+        _lib = backends.load(_libpath, _backend)
+
+    return _lib
+
+
+def _bind(name: str, init):
+
+    """
+    Binds the functions and constants of the wrapper module name
+    to the cFMS library by calling its _init function.  Every
+    wrapper module calls _bind when it is imported.  This
+    function is to be used internally in pyfms
+    """
+
+    _inits[name] = init
+
+    lib = _load()
+    if lib is None:
+        return
+
+    init(_libpath, lib)
+    _bound.add(name)
+
+    # profile the newly bound functions
+    profile = sys.modules.get("pyfms.utils.profile")
+    if profile is not None and profile.is_enabled():
+        profile._wrap_namespace(sys.modules[name].__dict__, nested=False)
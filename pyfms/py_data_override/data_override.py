@@ -3,13 +3,16 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 
+from pyfms import cfms
 from pyfms.py_data_override import _functions
 from pyfms.utils.ctypes_utils import (
+    copy_back,
     get_constant_int,
     set_array,
     set_c_bool,
     set_c_int,
     set_c_str,
+    set_cf_arrays,
     set_list,
 )
 
@@ -161,6 +164,9 @@ def override(
             )
         )
 
+    copyback = []
+    (data,), convert_cf_order = set_cf_arrays([data], convert_cf_order, copyback)
+
     arglist = []
     set_c_str(gridname, arglist)
     set_c_str(fieldname, arglist)
@@ -175,6 +181,8 @@ def override(
 
     _cFMS_data_override(*arglist)
 
+    copy_back(copyback)
+
     return override.value
 
 
@@ -249,3 +257,6 @@ def _init(libpath: str, lib: Any):
 
     _init_constants()
     _init_functions()
+
+
+cfms._bind(__name__, _init)
@@ -1,10 +1,13 @@
+from ctypes import create_string_buffer
 from typing import Any
 
 import numpy as np
 from numpy.typing import NDArray
 
+from pyfms import cfms
 from pyfms.py_diag_manager import _functions
 from pyfms.utils.ctypes_utils import (
+    CallPlan,
     check_str,
     get_constant_int,
     set_array,
@@ -13,6 +16,7 @@ from pyfms.utils.ctypes_utils import (
     set_c_float,
     set_c_int,
     set_c_str,
+    set_cf_arrays,
     set_list,
 )
 
@@ -55,6 +59,9 @@ _cFMS_register_diag_field_arrays = {}
 _cFMS_register_diag_field_scalars = {}
 _cFMS_diag_send_datas = {}
 
+# reusable err_msg buffer for send_data
+_err_msg = create_string_buffer(256)
+
 
 def end():
 
@@ -426,14 +433,11 @@ def send_data(
             )
         )
 
-    arglist = []
-    set_c_int(diag_field_id, arglist)
-    set_list([*field.shape], np.int32, arglist)
-    set_array(field, arglist)
-    err_msg = set_c_str(" ", arglist)
-    set_c_bool(convert_cf_order, arglist)
+    (field,), convert_cf_order = set_cf_arrays([field], convert_cf_order)
 
-    return cfms_diag_send_data(*arglist)
+    return cfms_diag_send_data(
+        diag_field_id, field.shape, field, _err_msg, convert_cf_order
+    )
 
 
 def _init_constants():
@@ -532,19 +536,19 @@ def _init_functions():
 
     _cFMS_diag_send_datas = {
         2: {
-            "int32": _cFMS_diag_send_data_2d_cint,
-            "float32": _cFMS_diag_send_data_2d_cfloat,
-            "float64": _cFMS_diag_send_data_2d_cdouble,
+            "int32": CallPlan(_cFMS_diag_send_data_2d_cint),
+            "float32": CallPlan(_cFMS_diag_send_data_2d_cfloat),
+            "float64": CallPlan(_cFMS_diag_send_data_2d_cdouble),
         },
         3: {
-            "int32": _cFMS_diag_send_data_3d_cint,
-            "float32": _cFMS_diag_send_data_3d_cfloat,
-            "float64": _cFMS_diag_send_data_3d_cdouble,
+            "int32": CallPlan(_cFMS_diag_send_data_3d_cint),
+            "float32": CallPlan(_cFMS_diag_send_data_3d_cfloat),
+            "float64": CallPlan(_cFMS_diag_send_data_3d_cdouble),
         },
         4: {
-            "int32": _cFMS_diag_send_data_4d_cint,
-            "float32": _cFMS_diag_send_data_4d_cfloat,
-            "float64": _cFMS_diag_send_data_4d_cdouble,
+            "int32": CallPlan(_cFMS_diag_send_data_4d_cint),
+            "float32": CallPlan(_cFMS_diag_send_data_4d_cfloat),
+            "float64": CallPlan(_cFMS_diag_send_data_4d_cdouble),
         },
     }
 
@@ -564,3 +568,6 @@ def _init(libpath: str, lib: Any):
 
     _init_constants()
     _init_functions()
+
+
+cfms._bind(__name__, _init)
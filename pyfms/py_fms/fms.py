@@ -1,6 +1,8 @@
 from typing import Any
 
+from pyfms import cfms
 from pyfms.py_fms import _functions
+from pyfms.utils import profile
 from pyfms.utils.ctypes_utils import check_str, get_constant_int, set_c_int, set_c_str
 
 
@@ -19,10 +21,13 @@ _cFMS_init = None
 _cFMS_end = None
 _c_fms_is_initialized = None
 
+# number of domains cFMS was initialized with
+_ndomain = None
+
 
 def init(
     alt_input_nml_path: str = None,
-    localcomm: int = None,
+    localcomm: Any = None,
     ndomain: int = None,
     nnest_domain: int = None,
     calendar_type: int = None,
@@ -35,10 +40,18 @@ def init(
 
     if ndomain and/or nnest_domain is/are not specified, cFMS will only with
     1 domain2D and/or 1 nest domain
+
+    localcomm is the Fortran handle of the MPI communicator
+    or an mpi4py communicator
     """
 
+    global _ndomain
+
     check_str(alt_input_nml_path, 64, "fms.init")
 
+    if hasattr(localcomm, "py2f"):
+        localcomm = localcomm.py2f()
+
     arglist = []
     set_c_int(localcomm, arglist)
     set_c_str(alt_input_nml_path, arglist)
@@ -47,6 +60,7 @@ def init(
     set_c_int(calendar_type, arglist)
 
     _cFMS_init(*arglist)
+    _ndomain = 1 if ndomain is None else ndomain
 
 
 def end():
@@ -55,8 +69,16 @@ def end():
     Calls mpp_error
     Termination routine for the fms module. It also calls destructor routines
     for the mpp, mpp_domains, and mpp_io modules.
+    The report of the pyfms.mpp clocks and, if pyfms.profile
+    is enabled, the profile report are printed on the root pe
+    before FMS terminates
     """
 
+    from pyfms.py_mpp import mpp
+
+    mpp._clock_end()
+    profile._end()
+
     _cFMS_end()
 
 
@@ -115,8 +137,11 @@ def _init(libpath: str, lib: Any):
 
     global _libpath, _lib
 
-    _lib_path = libpath
+    _libpath = libpath
     _lib = lib
 
     _init_constants()
     _init_functions()
+
+
+cfms._bind(__name__, _init)
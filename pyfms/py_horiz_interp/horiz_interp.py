@@ -3,14 +3,17 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 
+from pyfms import cfms
 from pyfms.py_horiz_interp import _functions
+from pyfms.utils.buffers import get_buffer
 from pyfms.utils.ctypes_utils import (
+    CallPlan,
+    copy_back,
     set_array,
     set_c_bool,
-    set_c_double,
-    set_c_float,
     set_c_int,
     set_c_str,
+    set_cf_arrays,
 )
 
 
@@ -61,14 +64,19 @@ def create_xgrid_2dx2d_order1(
     lon_tgt: npt.NDArray[np.float64],
     lat_tgt: npt.NDArray[np.float64],
     mask_src: npt.NDArray[np.float64],
+    out: dict = None,
 ) -> dict:
 
     """
     Creates the exchange grid that can be used
-    for first order conservative interpolation
+    for first order conservative interpolation.
+    out can provide the arrays i_src, j_src, i_tgt,
+    j_tgt, and xarea of size get_maxxgrid()
     """
 
     maxxgrid = get_maxxgrid()
+    out = {} if out is None else out
+    whoami = "horiz_interp.create_xgrid_2dx2d_order1"
 
     arglist = []
     set_c_int(lon_src.shape[0], arglist)
@@ -81,11 +89,21 @@ def create_xgrid_2dx2d_order1(
     set_array(lat_tgt, arglist)
     set_array(mask_src, arglist)
     set_c_int(maxxgrid, arglist)
-    i_src = set_array(np.zeros(maxxgrid, dtype=np.int32), arglist)
-    j_src = set_array(np.zeros(maxxgrid, dtype=np.int32), arglist)
-    i_tgt = set_array(np.zeros(maxxgrid, dtype=np.int32), arglist)
-    j_tgt = set_array(np.zeros(maxxgrid, dtype=np.int32), arglist)
-    xarea = set_array(np.zeros(maxxgrid, dtype=np.float64), arglist)
+    i_src = set_array(
+        get_buffer((maxxgrid,), np.int32, out.get("i_src"), whoami), arglist
+    )
+    j_src = set_array(
+        get_buffer((maxxgrid,), np.int32, out.get("j_src"), whoami), arglist
+    )
+    i_tgt = set_array(
+        get_buffer((maxxgrid,), np.int32, out.get("i_tgt"), whoami), arglist
+    )
+    j_tgt = set_array(
+        get_buffer((maxxgrid,), np.int32, out.get("j_tgt"), whoami), arglist
+    )
+    xarea = set_array(
+        get_buffer((maxxgrid,), np.float64, out.get("xarea"), whoami), arglist
+    )
 
     nxgrid = _cFMS_create_xgrid_2dx2d_order1(*arglist)
 
@@ -195,110 +213,101 @@ def get_weights(
 
 def get_nxgrid(interp_id: int):
 
-    arglist = []
-    set_c_int(interp_id, arglist)
-    nxgrid = set_c_int(0, arglist)
-
-    _cFMS_get_nxgrid(*arglist)
-    return nxgrid.value
+    _cFMS_get_nxgrid(interp_id, 0)
+    return _cFMS_get_nxgrid.value(1)
 
 
 def get_nlon_src(interp_id: int):
 
-    arglist = []
-    set_c_int(interp_id, arglist)
-    nlon_src = set_c_int(0, arglist)
-
-    _cFMS_get_nlon_src(*arglist)
-    return nlon_src.value
+    _cFMS_get_nlon_src(interp_id, 0)
+    return _cFMS_get_nlon_src.value(1)
 
 
 def get_nlat_src(interp_id: int):
 
-    arglist = []
-    set_c_int(interp_id, arglist)
-    nlat_src = set_c_int(0, arglist)
-
-    _cFMS_get_nlat_src(*arglist)
-    return nlat_src.value
+    _cFMS_get_nlat_src(interp_id, 0)
+    return _cFMS_get_nlat_src.value(1)
 
 
 def get_nlon_dst(interp_id: int):
 
-    arglist = []
-    set_c_int(interp_id, arglist)
-    nlon_dst = set_c_int(0, arglist)
-
-    _cFMS_get_nlon_dst(*arglist)
-    return nlon_dst.value
+    _cFMS_get_nlon_dst(interp_id, 0)
+    return _cFMS_get_nlon_dst.value(1)
 
 
 def get_nlat_dst(interp_id: int):
 
-    arglist = []
-    set_c_int(interp_id, arglist)
-    nlat_dst = set_c_int(0, arglist)
-
-    _cFMS_get_nlat_dst(*arglist)
-    return nlat_dst.value
+    _cFMS_get_nlat_dst(interp_id, 0)
+    return _cFMS_get_nlat_dst.value(1)
 
 
-def get_i_src(interp_id: int):
+def get_i_src(interp_id: int, out: npt.NDArray = None):
 
     nxgrid = get_nxgrid(interp_id)
 
     arglist = []
     set_c_int(interp_id, arglist)
-    i_src = set_array(np.zeros(nxgrid, dtype=np.int32), arglist)
+    i_src = set_array(
+        get_buffer((nxgrid,), np.int32, out, "horiz_interp.get_i_src"), arglist
+    )
 
     _cFMS_get_i_src(*arglist)
 
     return i_src
 
 
-def get_j_src(interp_id: int):
+def get_j_src(interp_id: int, out: npt.NDArray = None):
 
     nxgrid = get_nxgrid(interp_id)
 
     arglist = []
     set_c_int(interp_id, arglist)
-    j_src = set_array(np.zeros(nxgrid, dtype=np.int32), arglist)
+    j_src = set_array(
+        get_buffer((nxgrid,), np.int32, out, "horiz_interp.get_j_src"), arglist
+    )
 
     _cFMS_get_j_src(*arglist)
     return j_src
 
 
-def get_i_dst(interp_id: int):
+def get_i_dst(interp_id: int, out: npt.NDArray = None):
 
     nxgrid = get_nxgrid(interp_id)
 
     arglist = []
     set_c_int(interp_id, arglist)
-    i_dst = set_array(np.zeros(nxgrid, dtype=np.int32), arglist)
+    i_dst = set_array(
+        get_buffer((nxgrid,), np.int32, out, "horiz_interp.get_i_dst"), arglist
+    )
 
     _cFMS_get_i_dst(*arglist)
     return i_dst
 
 
-def get_j_dst(interp_id: int):
+def get_j_dst(interp_id: int, out: npt.NDArray = None):
 
     nxgrid = get_nxgrid(interp_id)
 
     arglist = []
     set_c_int(interp_id, arglist)
-    j_dst = set_array(np.zeros(nxgrid, dtype=np.int32), arglist)
+    j_dst = set_array(
+        get_buffer((nxgrid,), np.int32, out, "horiz_interp.get_j_dst"), arglist
+    )
 
     _cFMS_get_j_dst(*arglist)
     return j_dst
 
 
-def get_area_frac_dst(interp_id: int):
+def get_area_frac_dst(interp_id: int, out: npt.NDArray = None):
 
     nxgrid = get_nxgrid(interp_id)
 
     arglist = []
     set_c_int(interp_id, arglist)
-    area_frac_dst = set_array(np.zeros(nxgrid, dtype=np.float64), arglist)
+    area_frac_dst = set_array(
+        get_buffer((nxgrid,), np.float64, out, "horiz_interp.get_area_frac_dst"),
+        arglist,
+    )
 
     _cFMS_get_area_frac_dst_double(*arglist)
     return area_frac_dst
@@ -332,8 +341,15 @@ def interp(
     missing_permit: int = None,
     new_missing_handle: bool = None,
     convert_cf_order: bool = True,
+    out: npt.NDArray[np.float32 | np.float64] = None,
 ) -> npt.NDArray[np.float32 | np.float64]:
 
+    """
+    Interpolates data_in with the weights of interp_id.
+    The result is written to out if provided.  out must
+    have the shape and memory order of the returned array
+    """
+
     datatype = data_in.dtype
     try:
         _cFMS_horiz_interp_base = _cFMS_horiz_interp_base_dict[datatype.name]
@@ -342,29 +358,40 @@ def interp(
             f"horiz_interp.interp: grid of type {datatype} not supported"
         )
 
-    arglist = []
-
     nlon_dst = get_nlon_dst(interp_id)
     nlat_dst = get_nlat_dst(interp_id)
 
-    set_c_real = set_c_float if datatype == np.float32 else set_c_double
+    copyback = []
+    (data_in, mask_in, mask_out), cf_order = set_cf_arrays(
+        [data_in, mask_in, mask_out], convert_cf_order, copyback
+    )
 
-    set_c_int(interp_id, arglist)
-    set_array(data_in, arglist)
-    if convert_cf_order:
-        data_out = set_array(np.zeros((nlon_dst, nlat_dst), dtype=datatype), arglist)
+    if cf_order:
+        shape = (nlon_dst, nlat_dst)
     else:
-        data_out = set_array(np.zeros((nlat_dst, nlon_dst), dtype=datatype), arglist)
-    set_array(mask_in, arglist)
-    set_array(mask_out, arglist)
-    set_c_int(verbose, arglist)
-    set_c_real(missing_value, arglist)
-    set_c_int(missing_permit, arglist)
-    set_c_bool(new_missing_handle, arglist)
-    set_c_bool(convert_cf_order, arglist)
-
-    _cFMS_horiz_interp_base(*arglist)
-
+        shape = (nlat_dst, nlon_dst)
+    if out is not None and cf_order != convert_cf_order:
+        out = out.T
+    data_out = get_buffer(shape, datatype, out, "horiz_interp.interp")
+
+    _cFMS_horiz_interp_base(
+        interp_id,
+        data_in,
+        data_out,
+        mask_in,
+        mask_out,
+        verbose,
+        missing_value,
+        missing_permit,
+        new_missing_handle,
+        cf_order,
+    )
+
+    copy_back(copyback)
+
+    # Fortran ordered input returns Fortran ordered output
+    if cf_order != convert_cf_order:
+        return data_out.T
     return data_out
 
 
@@ -397,6 +424,8 @@ def _init_functions():
     global _cFMS_get_area_frac_dst_double
     global _cFMS_get_nxgrid
 
+    _functions.define(_lib)
+
     _c_horiz_interp_is_initialized = _lib.c_horiz_interp_is_initialized
 
     _cFMS_create_xgrid_2dx2d_order1 = _lib.cFMS_create_xgrid_2dx2d_order1
@@ -419,11 +448,11 @@ def _init_functions():
     _cFMS_get_j_src = _lib.cFMS_get_j_src
     _cFMS_get_i_dst = _lib.cFMS_get_i_dst
     _cFMS_get_j_dst = _lib.cFMS_get_j_dst
-    _cFMS_get_nlon_src = _lib.cFMS_get_nlon_src
-    _cFMS_get_nlat_src = _lib.cFMS_get_nlat_src
-    _cFMS_get_nlon_dst = _lib.cFMS_get_nlon_dst
-    _cFMS_get_nlat_dst = _lib.cFMS_get_nlat_dst
-    _cFMS_get_nxgrid = _lib.cFMS_get_nxgrid
+    _cFMS_get_nlon_src = CallPlan(_lib.cFMS_get_nlon_src)
+    _cFMS_get_nlat_src = CallPlan(_lib.cFMS_get_nlat_src)
+    _cFMS_get_nlon_dst = CallPlan(_lib.cFMS_get_nlon_dst)
+    _cFMS_get_nlat_dst = CallPlan(_lib.cFMS_get_nlat_dst)
+    _cFMS_get_nxgrid = CallPlan(_lib.cFMS_get_nxgrid)
     _cFMS_get_interp_method = _lib.cFMS_get_interp_method
     _cFMS_get_area_frac_dst_double = _lib.cFMS_get_area_frac_dst_cdouble
 
@@ -433,12 +462,10 @@ def _init_functions():
     }
 
     _cFMS_horiz_interp_base_dict = {
-        "float32": _cFMS_horiz_interp_base_2d_cfloat,
-        "float64": _cFMS_horiz_interp_base_2d_cdouble,
+        "float32": CallPlan(_cFMS_horiz_interp_base_2d_cfloat),
+        "float64": CallPlan(_cFMS_horiz_interp_base_2d_cdouble),
     }
 
-    _functions.define(_lib)
-
 
 def _init(libpath: str, lib: Any):
 
@@ -454,3 +481,6 @@ def _init(libpath: str, lib: Any):
     _lib = lib
 
     _init_functions()
+
+
+cfms._bind(__name__, _init)
@@ -0,0 +1,82 @@
+from functools import wraps
+from time import perf_counter
+from typing import Callable
+
+from pyfms.utils import profile
+
+
+class Clock:
+    """
+    Clock timing a region of python code.  pyfms.mpp.clock
+    returns an instance of Clock.  The region is timed in calls
+    and total seconds, reported across PEs by pyfms.mpp.clock_report
+    at fms.end and, when pyfms.profile is enabled, in the pyfms
+    profile.  A Clock is used as a context manager or as a decorator:
+
+        with mpp.clock("physics"):
+            compute physics
+
+        @mpp.clock("radiation")
+        def radiation():
+            ...
+    """
+
+    def __init__(self, name: str):
+        self.name = name  # name of the clock
+        self.calls = 0  # number of regions timed
+        self.total = 0.0  # seconds spent in the regions timed
+        self._key = f"clock {name}"
+        self._starts = []
+
+        # the key is registered on every PE creating the clock
+        profile._register(self._key)
+
+    def begin(self):
+
+        """
+        Starts the clock
+        """
+
+        self._starts.append(perf_counter())
+
+    def end(self):
+
+        """
+        Stops the clock
+        """
+
+        if self._starts:
+            elapsed = perf_counter() - self._starts.pop()
+            self.calls += 1
+            self.total += elapsed
+            if profile._enabled:
+                profile._record(self._key, elapsed)
+
+    def __enter__(self):
+        self.begin()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.end()
+        return False
+
+    def __call__(self, function: Callable) -> Callable:
+        @wraps(function)
+        def timed(*args, **kwargs):
+            self.begin()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.end()
+
+        return timed
+
+    def __repr__(self):
+
+        repr_str = f"""
+            name: {self.name}
+            calls: {self.calls}
+            total: {self.total}
+        """
+
+        return repr_str
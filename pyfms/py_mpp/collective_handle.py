@@ -0,0 +1,70 @@
+from typing import Any, Callable
+
+
+class CollectiveHandle:
+    """
+    Collective in flight.  pyfms.mpp.igather, pyfms.mpp.igatherv,
+    pyfms.mpp.isum, pyfms.mpp.imax and pyfms.mpp.imin return an
+    instance of CollectiveHandle.  The arrays passed to the collective
+    must not be used until wait has returned or test has returned
+    True.  Used as a context manager, the collective is waited for
+    when the with block exits:
+
+        with mpp.isum(array) as handle:
+            compute without array
+        total = handle.result
+    """
+
+    def __init__(self, request: Any, result: Any = None, finish: Callable = None):
+        self.request = request  # mpi4py request of the collective
+        self.result = result  # result, valid once completed
+        self._finish = finish
+
+    @property
+    def completed(self) -> bool:
+        return self.request is None
+
+    def test(self) -> bool:
+
+        """
+        Returns True if the collective has completed,
+        without waiting for it
+        """
+
+        if self.request is not None and self.request.Test():
+            self._complete()
+        return self.completed
+
+    def wait(self) -> Any:
+
+        """
+        Waits for the collective to complete and returns its
+        result, which is None on the PEs receiving no data.
+        Calling wait again returns the result
+        """
+
+        if self.request is not None:
+            self.request.Wait()
+            self._complete()
+        return self.result
+
+    def _complete(self):
+        self.request = None
+        if self._finish is not None:
+            finish, self._finish = self._finish, None
+            self.result = finish(self.result)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.wait()
+        return False
+
+    def __repr__(self):
+
+        repr_str = f"""
+            completed: {self.completed}
+        """
+
+        return repr_str
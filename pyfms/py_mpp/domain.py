@@ -1,3 +1,81 @@
+import numpy as np
+import numpy.typing as npt
+
+from pyfms.utils.buffers import empty_aligned
+
+
+# compute, data and global domain indices and sizes returned by Domain.bounds
+_bounds = [
+    "isc",
+    "iec",
+    "jsc",
+    "jec",
+    "xsize_c",
+    "ysize_c",
+    "xmax_size_c",
+    "ymax_size_c",
+    "x_is_global_c",
+    "y_is_global_c",
+    "isd",
+    "ied",
+    "jsd",
+    "jed",
+    "xsize_d",
+    "ysize_d",
+    "xmax_size_d",
+    "ymax_size_d",
+    "x_is_global_d",
+    "y_is_global_d",
+    "isg",
+    "ieg",
+    "jsg",
+    "jeg",
+    "xsize_g",
+    "ysize_g",
+]
+
+
+class DomainArray(np.ndarray):
+    """
+    Data domain array returned by Domain.empty and Domain.zeros.
+    The array is Fortran ordered, with the x and y dimensions first.
+    compute is a view of the compute domain and halo is a dictionary
+    of views of the west, east, south and north halos.  The west and
+    east halos span the full y extent of the data domain, including
+    the corners, and the south and north halos span the compute domain
+    in x.  Fortran ordered arrays derived from a DomainArray with the
+    same x and y extents, such as a + 1 or a[:, :, 0], keep the views
+    """
+
+    def __array_finalize__(self, obj):
+        self._slices = getattr(obj, "_slices", None)
+        self._extents = getattr(obj, "_extents", None)
+
+    @property
+    def compute(self) -> npt.NDArray:
+        i, j = self._compute_slices()
+        return self[i, j]
+
+    @property
+    def halo(self) -> dict:
+        (i, j), array = self._compute_slices(), self
+        return dict(
+            west=array[: i.start],
+            east=array[i.stop :],
+            south=array[i, : j.start],
+            north=array[i, j.stop :],
+        )
+
+    def _compute_slices(self) -> tuple[slice, slice]:
+        if (
+            self._slices is None
+            or self.shape[:2] != self._extents
+            or not self.flags["F"]
+        ):
+            raise RuntimeError("DomainArray: array is not laid out on a data domain")
+        return self._slices
+
+
 class Domain:
     """
     Carries useful information about the domain
@@ -66,10 +144,149 @@ class Domain:
         self.ysize_g = ysize_g  # size of the global domain in the y direction
         self.x_is_global_d = x_is_global_d  # x_is_global in data domain
         self.y_is_global_d = y_is_global_d  # y_is_global in data domain
+        self.xflags = None  # x flags of a single tile domain
+        self.yflags = None  # y flags of a single tile domain
+        self._bounds = {}  # bounds keyed by (position, tile_count)
+        self._slices = {}  # compute slices keyed by (position, tile_count)
+
+    def bounds(self, position: int = None, tile_count: int = None) -> dict:
+
+        """
+        Returns a dictionary of the compute, data and global domain
+        indices and sizes for fields at position on tile tile_count.
+        The bounds are queried from cFMS once per position and
+        tile_count, and cached until update is called
+        """
+
+        key = (position, tile_count)
+        bounds = self._bounds.get(key)
+        if bounds is None:
+            bounds = self._bounds[key] = self._query_bounds(position, tile_count)
+        return bounds
+
+    def compute_slices(
+        self, position: int = None, tile_count: int = None
+    ) -> tuple[slice, slice]:
+
+        """
+        Returns the x and y slices of the compute
+        domain in a data domain array
+        """
+
+        key = (position, tile_count)
+        slices = self._slices.get(key)
+        if slices is None:
+            bounds = self.bounds(position, tile_count)
+            isd, jsd = bounds["isd"], bounds["jsd"]
+            slices = self._slices[key] = (
+                slice(bounds["isc"] - isd, bounds["iec"] - isd + 1),
+                slice(bounds["jsc"] - jsd, bounds["jec"] - jsd + 1),
+            )
+        return slices
+
+    def compute_view(
+        self,
+        array: npt.NDArray,
+        position: int = None,
+        tile_count: int = None,
+    ) -> npt.NDArray:
+
+        """
+        Returns a view of the compute domain of array, a data
+        domain array with x and y as its first two dimensions
+        """
+
+        bounds = self.bounds(position, tile_count)
+        if array.shape[:2] != (bounds["xsize_d"], bounds["ysize_d"]):
+            raise RuntimeError(
+                f"Domain.compute_view: array of shape {array.shape} is not "
+                "on the data domain"
+            )
+        i, j = self.compute_slices(position, tile_count)
+        return array[i, j]
+
+    def empty(
+        self,
+        nz: int = None,
+        position: int = None,
+        dtype: npt.DTypeLike = np.float64,
+    ) -> DomainArray:
+
+        """
+        Returns an uninitialized DomainArray of shape
+        (xsize_d, ysize_d) or (xsize_d, ysize_d, nz) for fields
+        at position.  The array is Fortran ordered and 64 byte
+        aligned, so cFMS updates its halos without a copy
+        """
+
+        bounds = self.bounds(position)
+
+        shape = (bounds["xsize_d"], bounds["ysize_d"])
+        if nz is not None:
+            shape += (nz,)
+
+        array = empty_aligned(shape, dtype, order="F").view(DomainArray)
+        array._slices = self.compute_slices(position)
+        array._extents = shape[:2]
+        return array
+
+    def zeros(
+        self,
+        nz: int = None,
+        position: int = None,
+        dtype: npt.DTypeLike = np.float64,
+    ) -> DomainArray:
+
+        """
+        Returns a DomainArray of zeros as Domain.empty
+        """
+
+        array = self.empty(nz, position, dtype)
+        array.fill(0)
+        return array
+
+    def _query_bounds(self, position: int = None, tile_count: int = None) -> dict:
+
+        """
+        Returns the bounds of the domain for fields at position on
+        tile tile_count.  The bounds of centered fields on the default
+        tile are set by define_domains and are not queried
+        """
+
+        from pyfms.py_mpp import mpp_domains
+
+        center = position is None or position == mpp_domains.CENTER
+        if center and tile_count is None and self.isc is not None:
+            return {key: getattr(self, key) for key in _bounds}
+
+        bounds = dict.fromkeys(_bounds)
+        for get_domain in [mpp_domains.get_compute_domain, mpp_domains.get_data_domain]:
+            bounds.update(
+                get_domain(self.domain_id, position=position, tile_count=tile_count)
+            )
+        bounds.pop("domain_id")
+
+        # the global domain extends by the extra points of the data domain
+        if self.isg is not None:
+            centered = bounds if center else self.bounds(tile_count=tile_count)
+            ishift = bounds["ied"] - centered["ied"]
+            jshift = bounds["jed"] - centered["jed"]
+            bounds.update(
+                isg=self.isg,
+                ieg=self.ieg + ishift,
+                jsg=self.jsg,
+                jeg=self.jeg + jshift,
+                xsize_g=self.xsize_g + ishift,
+                ysize_g=self.ysize_g + jshift,
+            )
+
+        return bounds
 
     def update(self, domain_dict: dict):
         for key in domain_dict:
             setattr(self, key, domain_dict[key])
+        self._bounds.clear()
+        self._slices.clear()
         return self
 
     def __repr__(self):
@@ -0,0 +1,28 @@
+class GroupUpdate:
+    """
+    Fields registered for a group halo update.
+    pyfms.mpp_domains.create_group_update returns an instance of
+    GroupUpdate, which is passed to pyfms.mpp_domains.do_group_update
+    to update the halos of all registered fields in one exchange.
+    The messages for each PE of the domain are packed into one
+    buffer, kept with the group and reused by every update
+    """
+
+    def __init__(self, domain: object = None, dtype: str = None):
+        self.domain = domain  # Domain the fields are registered with
+        self.dtype = dtype  # dtype name of the registered fields
+        self.fields = []  # registered arrays and their exchange plans
+        self._buffers = {}  # message buffers keyed by direction and rank
+
+    def __len__(self):
+        return len(self.fields)
+
+    def __repr__(self):
+
+        repr_str = f"""
+            domain_id: {getattr(self.domain, "domain_id", None)}
+            dtype: {self.dtype}
+            nfields: {len(self.fields)}
+        """
+
+        return repr_str
@@ -1,16 +1,24 @@
+import builtins
+from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
 import numpy.typing as npt
 
-from pyfms.py_fms.fms import FATAL
+from pyfms import cfms
+from pyfms.py_fms import fms
 from pyfms.py_mpp import _mpp_functions
+from pyfms.py_mpp.clock import Clock
+from pyfms.py_mpp.collective_handle import CollectiveHandle
+from pyfms.utils.buffers import get_buffer
 from pyfms.utils.ctypes_utils import (
     check_str,
+    count_copy,
     set_array,
     set_c_bool,
     set_c_int,
     set_c_str,
+    set_cf_arrays,
     set_list,
 )
 
@@ -37,37 +45,79 @@ _cFMS_pe = None
 _cFMS_root_pe = None
 _cFMS_set_current_pelist = None
 
+# pe, npes, root_pe and current pelist, valid until
+# the current pelist is set or a pelist is declared
+_pelist_cache: dict = {}
+
+# clocks keyed by name
+_clocks: dict = {}
+
+# pelists declared with declare_pelist, as (read-only int32 pelist,
+# commID) keyed by the PEs of the pelist, the names of the declared
+# pelists, and the numbers of declarations made and avoided
+_declared_pelists: dict = {}
+_pelist_names: dict = {}
+_pelist_stats: dict = {"declared": 0, "avoided": 0}
+
+# mpi4py communicators of the pelists used by
+# the collectives, keyed by pelist
+_pelist_comms: dict = {}
+
 
 def gather(
     sbuf: npt.NDArray,
     rbuf_size: int = None,  # for 1d
-    rbuf_shape: list[int, int] = None,  # for 2d
+    rbuf_shape: list[int] = None,  # for 2d, 3d and 4d
     domain: dict = None,  # mpp_gather_2d argument
     pelist: list = None,
     is_root_pe: bool = None,
     ishift: int = None,  # mpp_gather_pelist_2d argument
     jshift: int = None,  # mpp_gather_pelist_2d argument
     convert_cf_order: bool = True,
+    out: npt.NDArray = None,
 ) -> npt.NDArray:
 
+    """
+    Gathers sbuf from all PEs to the root PE.  On the root PE,
+    the gathered data is written to out if provided.  The size
+    or shape of the receiving array defaults to that of out.
+    3D and 4D arrays are gathered over the compute domain of
+    domain with all levels in a single collective
+    """
+
     datatype = sbuf.dtype
     if is_root_pe is None:
         is_root_pe = pe() == root_pe()
     dim = sbuf.ndim
 
+    if dim in (3, 4):
+        return _gather_levels(
+            sbuf,
+            rbuf_shape,
+            domain,
+            pelist,
+            is_root_pe,
+            ishift,
+            jshift,
+            convert_cf_order,
+            out,
+        )
+
     try:
         cFMS_gather = _cFMS_gathers[dim][datatype.name]
     except Exception:
-        error(FATAL, f"mpp.gather {datatype.name} not supported for dim={dim}")
+        error(fms.FATAL, f"mpp.gather {datatype.name} not supported for dim={dim}")
 
     arglist = []
 
     if dim == 1:
 
         if is_root_pe:
+            if rbuf_size is None and out is not None:
+                rbuf_size = out.size
             if rbuf_size is None:
                 raise RuntimeError("Must specify size of receiving array")
-            rbuf = np.zeros(rbuf_size, dtype=datatype)
+            rbuf = get_buffer((rbuf_size,), datatype, out, "mpp.gather")
         else:
             rbuf_size, rbuf = None, None
 
@@ -83,28 +133,42 @@ def gather(
 
     elif dim == 2:
 
+        (sbuf,), cf_order = set_cf_arrays([sbuf], convert_cf_order)
+
         if is_root_pe:
+            if rbuf_shape is None and out is not None:
+                rbuf_shape = list(out.shape)
             if rbuf_shape is None:
                 raise RuntimeError("Must specify shape of receiving array")
-            rbuf = np.zeros(rbuf_shape, dtype=datatype)
+            if cf_order != convert_cf_order:
+                rbuf_shape = rbuf_shape[::-1]
+                out = None if out is None else out.T
+            rbuf = get_buffer(rbuf_shape, datatype, out, "mpp.gather")
         else:
             rbuf_shape, rbuf = None, None
 
-        pelist = get_current_pelist(npes()) if pelist is None else pelist
-
         set_c_int(domain.isc, arglist)
         set_c_int(domain.iec, arglist)
         set_c_int(domain.jsc, arglist)
         set_c_int(domain.jec, arglist)
-        set_c_int(len(pelist), arglist)
-        set_list(pelist, np.int32, arglist)
+        if pelist is None:
+            pelist = get_current_pelist_array()
+            set_c_int(len(pelist), arglist)
+            arglist.append(pelist)
+        else:
+            set_c_int(len(pelist), arglist)
+            set_list(pelist, np.int32, arglist)
         set_array(sbuf, arglist)
         set_array(rbuf, arglist)
         set_c_bool(is_root_pe, arglist)
         set_list(rbuf_shape, np.int32, arglist)
         set_c_int(ishift, arglist)
         set_c_int(jshift, arglist)
-        set_c_bool(convert_cf_order, arglist)
+        set_c_bool(cf_order, arglist)
+
+        # Fortran ordered sbuf returns a Fortran ordered rbuf
+        if is_root_pe and cf_order != convert_cf_order:
+            rbuf = rbuf.T
 
     cFMS_gather(*arglist)
 
@@ -113,26 +177,322 @@ def gather(
     return None
 
 
-def gatherv(
-    sbuf: npt.NDArray, ssize: int, rsize: int = None, pelist: list[int] = None
+def _gather_levels(
+    sbuf: npt.NDArray,
+    rbuf_shape: list[int],
+    domain: Any,
+    pelist: list,
+    is_root_pe: bool,
+    ishift: int,
+    jshift: int,
+    convert_cf_order: bool,
+    out: npt.NDArray,
 ) -> npt.NDArray:
 
+    """
+    Gathers a 3D or 4D sbuf with one 2D gather.  The C ordered
+    (x, y, levels...) array is viewed as (x, y * nlevels) without
+    a copy, and the segment of each PE remains a rectangle of the
+    gathered array viewed the same way.  A Fortran ordered sbuf is
+    viewed as (x, nlevels * y) and gathered in Fortran order without
+    a copy; the segment of each PE is then ordered by level, and the
+    root PE reorders the gathered array into a Fortran ordered rbuf
+    """
+
+    whoami = "mpp.gather"
+
+    if not convert_cf_order:
+        raise RuntimeError(f"{whoami}: convert_cf_order must be True for 3D and 4D")
+
+    fortran = sbuf.flags.f_contiguous and not sbuf.flags.c_contiguous
+    if not (fortran or sbuf.flags.c_contiguous):
+        sbuf = np.ascontiguousarray(sbuf)
+        count_copy(sbuf.nbytes, whoami)
+
+    levels = sbuf.shape[2:]
+    nlevels = int(np.prod(levels))
+
+    rbuf, rbuf_2d, shape_2d = None, None, None
+    if is_root_pe:
+        if rbuf_shape is None and out is not None:
+            rbuf_shape = list(out.shape)
+        if rbuf_shape is None:
+            raise RuntimeError("Must specify shape of receiving array")
+        if tuple(rbuf_shape[2:]) != levels:
+            raise RuntimeError(
+                f"{whoami}: rbuf_shape {tuple(rbuf_shape)} does not "
+                f"match the levels {levels} of sbuf"
+            )
+        shape_2d = [rbuf_shape[0], rbuf_shape[1] * nlevels]
+        if not fortran:
+            rbuf = get_buffer(rbuf_shape, sbuf.dtype, out, whoami)
+            rbuf_2d = rbuf.reshape(shape_2d)
+
+    # y index j of level k is (j + jshift) * nlevels + k, or
+    # (jsc + jshift) * nlevels + k * ny + j - jsc in Fortran order
+    jshift = 0 if jshift is None else jshift
+    stacked = _Segment(
+        isc=domain.isc,
+        iec=domain.iec,
+        jsc=(domain.jsc + jshift) * nlevels,
+        jec=(domain.jec + jshift + 1) * nlevels - 1,
+    )
+
+    if fortran:
+        comm, _ = _get_comm(pelist)
+        segments = (
+            []
+            if comm is None
+            else comm.allgather((domain.jsc + jshift, domain.jec + jshift))
+        )
+
+    # gather passes a Fortran ordered 2D view to cFMS as its C ordered
+    # transpose without conversion, and returns a Fortran ordered rbuf
+    gathered = gather(
+        sbuf.reshape(sbuf.shape[0], -1, order="F" if fortran else "C"),
+        rbuf_shape=shape_2d,
+        domain=stacked,
+        pelist=pelist,
+        is_root_pe=is_root_pe,
+        ishift=ishift,
+        jshift=0,
+        convert_cf_order=True,
+        out=rbuf_2d,
+    )
+
+    if not is_root_pe:
+        return None
+    if not fortran:
+        return rbuf
+
+    if out is None:
+        rbuf = get_buffer(rbuf_shape[::-1], sbuf.dtype, None, whoami).T
+    else:
+        rbuf = out
+    count_copy(rbuf.nbytes, whoami)
+    for jsc, jec in set(segments):
+        rbuf[:, jsc : jec + 1] = gathered[
+            :, jsc * nlevels : (jec + 1) * nlevels
+        ].reshape((rbuf.shape[0], jec - jsc + 1) + levels, order="F")
+    return rbuf
+
+
+@dataclass
+class _Segment:
+
+    """
+    Compute domain bounds of a segment passed to gather
+    """
+
+    isc: int
+    iec: int
+    jsc: int
+    jec: int
+
+
+def gather_to_file(
+    sbuf: npt.NDArray,
+    domain: Any,
+    path: str,
+    chunk_bytes: int = 64 * 1024**2,
+    name: str = "data",
+    dimensions: list[str] = None,
+    pelist: list[int] = None,
+) -> str:
+
+    """
+    Gathers the compute domain segments sbuf of all PEs into the
+    global array of the 2D to 4D field, written to path by the root
+    PE without holding the global array in memory.  The global array
+    is gathered in bands of rows of the first dimension of at most
+    chunk_bytes, each gathered with one collective and written before
+    the next.  path is written as a netCDF variable name with
+    dimensions if it ends in .nc, and as a .npy file otherwise.
+    Returns path on the root PE and None on the other PEs
+    """
+
+    whoami = "mpp.gather_to_file"
+
+    if sbuf.ndim not in (2, 3, 4):
+        raise RuntimeError(f"{whoami}: sbuf must be a 2D to 4D array")
+    if not sbuf.flags.c_contiguous:
+        sbuf = np.ascontiguousarray(sbuf)
+        count_copy(sbuf.nbytes, whoami)
+
+    # bounds relative to the start of the global domain
+    isg = domain.isg or 0
+    jsg = domain.jsg or 0
+    shape = (domain.ieg - isg + 1, domain.jeg - jsg + 1) + sbuf.shape[2:]
+    isc, iec = domain.isc - isg, domain.iec - isg
+    jsc, jec = domain.jsc - jsg, domain.jec - jsg
+
+    if sbuf.shape[:2] != (iec - isc + 1, jec - jsc + 1):
+        raise RuntimeError(
+            f"{whoami}: sbuf of shape {sbuf.shape} is not the compute domain"
+        )
+
+    if pelist is None:
+        pelist = get_current_pelist_array()
+    pelist = [int(ipe) for ipe in pelist]
+    mype, root = pe(), root_pe()
+    is_root_pe = mype == root
+
+    # first and last rows of every PE
+    rows = np.zeros((len(pelist), 2), dtype=np.int32)
+    rows[pelist.index(mype)] = isc, iec
+    rows = sum(rows, pelist=pelist)
+
+    row_bytes = int(np.prod(shape[1:])) * sbuf.dtype.itemsize
+    nrows = builtins.max(1, chunk_bytes // row_bytes)
+
+    band, writer = None, None
+    if is_root_pe:
+        band = np.empty((builtins.min(nrows, shape[0]),) + shape[1:], sbuf.dtype)
+        writer = _FileWriter(path, shape, sbuf.dtype, name, dimensions)
+
+    for i0 in range(0, shape[0], nrows):
+        i1 = builtins.min(i0 + nrows, shape[0])
+
+        band_pelist = [
+            ipe
+            for ipe, (first, last) in zip(pelist, rows)
+            if ipe == root or (first < i1 and last >= i0)
+        ]
+        if mype not in band_pelist:
+            continue
+
+        # the root PE sends no rows if it is outside of the band
+        first, last = builtins.max(isc, i0), builtins.min(iec, i1 - 1)
+        if last < first:
+            first, last = i0, i0 - 1
+
+        gather(
+            sbuf[first - isc : last - isc + 1],
+            domain=_Segment(isc=first - i0, iec=last - i0, jsc=jsc, jec=jec),
+            pelist=band_pelist,
+            is_root_pe=is_root_pe,
+            out=None if band is None else band[: i1 - i0],
+        )
+
+        if is_root_pe:
+            writer.write(i0, band[: i1 - i0])
+
+    if is_root_pe:
+        writer.close()
+        return path
+    return None
+
+
+class _FileWriter:
+
+    """
+    Writes bands of rows of an array of shape and dtype
+    to a netCDF file if path ends in .nc, and to a .npy
+    file through a numpy memmap otherwise
+    """
+
+    def __init__(
+        self,
+        path: str,
+        shape: tuple,
+        dtype: npt.DTypeLike,
+        name: str,
+        dimensions: list[str] = None,
+    ):
+
+        if path.endswith(".nc"):
+            import netCDF4
+
+            if dimensions is None:
+                dimensions = ["x", "y", "z", "t"][: len(shape)]
+            self.dataset = netCDF4.Dataset(path, "w")
+            for dimension, size in zip(dimensions, shape):
+                self.dataset.createDimension(dimension, size)
+            self.array = self.dataset.createVariable(name, dtype, dimensions)
+        else:
+            self.dataset = None
+            self.array = np.lib.format.open_memmap(
+                path, mode="w+", dtype=dtype, shape=shape
+            )
+
+    def write(self, start: int, rows: npt.NDArray):
+        self.array[start : start + rows.shape[0]] = rows
+
+    def close(self):
+        if self.dataset is not None:
+            self.dataset.close()
+        else:
+            self.array.flush()
+        self.array = None
+
+
+def gatherv(
+    sbuf: npt.NDArray,
+    ssize: int = None,
+    rsize: list[int] = None,
+    pelist: list[int] = None,
+    out: npt.NDArray = None,
+    exchange_sizes: bool = False,
+    get_views: bool = False,
+    get_offsets: bool = False,
+) -> Any:
+
+    """
+    Gathers ssize elements of sbuf from all PEs to the root PE.
+    On the root PE, the gathered data is written to out if provided.
+    For 2D to 4D arrays, ssize and rsize count rows of the first
+    dimension, and the rows of all PEs are gathered in a single
+    collective into an array of shape (sum(rsize), *sbuf.shape[1:]).
+    ssize defaults to the length of sbuf.  If exchange_sizes is True,
+    rsize is gathered from the ssize of every PE before the data.
+    With get_views and get_offsets, the per-PE views of the gathered
+    array and the npes + 1 offsets of the per-PE rows are returned
+    after it, as None on the other PEs
+    """
+
     datatype = sbuf.dtype
 
     try:
         cFMS_gather = _cFMS_gathers["v"][datatype.name]
     except Exception:
-        error(FATAL, f"mpp.gather {datatype.name} not supported for gatherv")
+        error(fms.FATAL, f"mpp.gather {datatype.name} not supported for gatherv")
 
     is_root_pe = pe() == root_pe()
 
+    if ssize is None:
+        ssize = sbuf.shape[0]
+
+    if exchange_sizes:
+        nsizes = len(get_current_pelist_array() if pelist is None else pelist)
+        rsize = gather(
+            np.array([ssize], dtype=np.int32),
+            rbuf_size=nsizes,
+            pelist=pelist,
+            is_root_pe=is_root_pe,
+        )
+
+    # elements per row of the first dimension
+    row_shape = sbuf.shape[1:]
+    row_size = int(np.prod(row_shape))
+    if sbuf.ndim > 1:
+        if not sbuf.flags.c_contiguous:
+            sbuf = np.ascontiguousarray(sbuf)
+            count_copy(sbuf.nbytes, "mpp.gatherv")
+        sbuf = sbuf.reshape(-1)
+
     sbuf_size = sbuf.shape[0]
 
+    offsets = None
     if is_root_pe:
         if rsize is None:
             raise RuntimeError("must specify receiving sizes for root pe")
-        rbuf = np.zeros(np.sum(rsize), dtype=datatype)
+        offsets = np.zeros(len(rsize) + 1, dtype=np.int64)
+        np.cumsum(rsize, out=offsets[1:])
+        shape = (int(offsets[-1]),) + row_shape
+        rbuf = get_buffer(shape, datatype, out, "mpp.gatherv")
         npes = len(rsize)
+        if row_size != 1:
+            rsize = [n * row_size for n in rsize]
     else:
         rbuf, rsize = None, None
         npes = None if pelist is None else len(pelist)
@@ -140,16 +500,504 @@ def gatherv(
     arglist = []
     set_c_int(sbuf_size, arglist)
     set_array(sbuf, arglist)
-    set_c_int(ssize, arglist)
-    set_array(rbuf, arglist)
+    set_c_int(ssize * row_size, arglist)
+    set_array(None if rbuf is None else rbuf.reshape(-1), arglist)
     set_list(rsize, np.int32, arglist)
     set_list(pelist, np.int32, arglist)
     set_c_int(npes, arglist)
 
     cFMS_gather(*arglist)
+
+    returns = []
+    if get_views:
+        views = None
+        if is_root_pe:
+            views = [rbuf[offsets[i] : offsets[i + 1]] for i in range(npes)]
+        returns.append(views)
+    if get_offsets:
+        returns.append(offsets)
+
+    if len(returns) > 0:
+        return (rbuf, *returns)
+    return rbuf
+
+
+def scatter(
+    sbuf: npt.NDArray = None,
+    domain: Any = None,
+    dtype: npt.DTypeLike = None,
+    pelist: list[int] = None,
+    is_root_pe: bool = None,
+    ishift: int = None,
+    jshift: int = None,
+    out: npt.NDArray = None,
+) -> npt.NDArray:
+
+    """
+    Scatters the 2D array sbuf on the root PE to all PEs in pelist
+    or in the current pelist, the counterpart of gather for 2D
+    arrays.  Each PE receives the segment of sbuf in the compute
+    domain of domain, written to out if provided.  sbuf is only read
+    on the root PE; other PEs give the dtype of the segment with
+    dtype or out.  The segment is Fortran ordered if sbuf or out is
+    """
+
+    whoami = "mpp.scatter"
+
+    if is_root_pe is None:
+        is_root_pe = pe() == root_pe()
+    if not is_root_pe:
+        sbuf = None
+
+    if sbuf is not None:
+        dtype = sbuf.dtype
+    elif out is not None:
+        dtype = out.dtype
+    if dtype is None:
+        raise RuntimeError(f"{whoami}: must specify the dtype of the segment")
+    dtype = np.dtype(dtype)
+
+    comm, _ = _get_comm(pelist)
+    if comm is None:
+        return None
+
+    # Fortran ordered segments are received as their C ordered transpose
+    given = [array for array in [sbuf, out] if array is not None]
+    fortran = len(given) > 0 and all(
+        array.flags["F"] and not array.flags["C"] for array in given
+    )
+
+    ishift = 0 if ishift is None else ishift
+    jshift = 0 if jshift is None else jshift
+    bounds = (
+        domain.isc + ishift,
+        domain.iec + ishift + 1,
+        domain.jsc + jshift,
+        domain.jec + jshift + 1,
+    )
+
+    shape = [bounds[1] - bounds[0], bounds[3] - bounds[2]]
+    if fortran:
+        shape = shape[::-1]
+        out = None if out is None else out.T
+    rbuf = get_buffer(shape, dtype, out, whoami)
+
+    # the root PE packs the segment of every PE in its order
+    segments = comm.allgather((is_root_pe, bounds, fortran))
+    root = [is_root for is_root, _, _ in segments].index(True)
+
+    send = None
     if is_root_pe:
-        return rbuf
-    return None
+        packed = [
+            sbuf[i0:i1, j0:j1].T if transpose else sbuf[i0:i1, j0:j1]
+            for _, (i0, i1, j0, j1), transpose in segments
+        ]
+        counts = [segment.size for segment in packed]
+        send = np.empty(np.sum(counts, dtype=np.int64), dtype=dtype)
+        displs = np.zeros(len(counts), dtype=np.int64)
+        np.cumsum(counts[:-1], out=displs[1:])
+        for segment, displ in zip(packed, displs):
+            send[displ : displ + segment.size].reshape(segment.shape)[...] = segment
+        count_copy(send.nbytes, whoami)
+        send = [send, (counts, displs.tolist())]
+
+    comm.Scatterv(send, rbuf, root=root)
+
+    if fortran:
+        rbuf = rbuf.T
+    return rbuf
+
+
+def broadcast(
+    array: npt.NDArray,
+    from_pe: int = None,
+    pelist: list[int] = None,
+) -> npt.NDArray:
+
+    """
+    Broadcasts array from from_pe, by default the root PE,
+    to all PEs in pelist or in the current pelist.  array is
+    overwritten in place on the receiving PEs and returned
+    """
+
+    if pelist is None:
+        pelist = get_current_pelist_array()
+    if from_pe is None:
+        from_pe = root_pe()
+
+    comm, _ = _get_comm(pelist)
+    if comm is None:
+        return array
+
+    flat, finish = _flatten(array, "mpp.broadcast")
+    comm.Bcast(flat, root=list(pelist).index(from_pe))
+    return finish()
+
+
+def sum(array: npt.NDArray, pelist: list[int] = None) -> npt.NDArray:
+
+    """
+    Sums array elementwise over all PEs in pelist or in the
+    current pelist.  array is overwritten in place with the
+    result and returned.  The sum of a scalar is returned
+    as a numpy scalar
+    """
+
+    return _reduce("SUM", array, pelist)
+
+
+def max(array: npt.NDArray, pelist: list[int] = None) -> npt.NDArray:
+
+    """
+    Returns the elementwise maximum of array
+    over all PEs, in place as sum
+    """
+
+    return _reduce("MAX", array, pelist)
+
+
+def min(array: npt.NDArray, pelist: list[int] = None) -> npt.NDArray:
+
+    """
+    Returns the elementwise minimum of array
+    over all PEs, in place as sum
+    """
+
+    return _reduce("MIN", array, pelist)
+
+
+def _reduce(op: str, array: Any, pelist: list[int]) -> Any:
+
+    """
+    Reduces array with op over all PEs in place with one
+    MPI_Allreduce.  PEs outside of pelist return array unchanged
+    """
+
+    from mpi4py import MPI
+
+    comm, _ = _get_comm(pelist)
+    if comm is None:
+        return array
+
+    flat, finish = _flatten(array, f"mpp.{op.lower()}")
+    comm.Allreduce(MPI.IN_PLACE, flat, op=getattr(MPI, op))
+    return finish()
+
+
+def _flatten(array: Any, whoami: str) -> tuple:
+
+    """
+    Returns array flattened for a collective in place and the
+    function returning the result once the collective completes.
+    Scalars are passed as arrays of one element and returned as
+    numpy scalars.  Arrays that are neither C nor Fortran contiguous
+    are copied and the result is copied back
+    """
+
+    scalar = not isinstance(array, np.ndarray)
+    if scalar:
+        array = np.array([array])
+
+    if array.flags["C"] or array.flags["F"]:
+        flat = array.ravel(order="K")
+    else:
+        flat = array.flatten()
+        count_copy(flat.nbytes, whoami)
+
+    def finish(result: Any = None) -> Any:
+        if scalar:
+            return flat[0]
+        if not np.shares_memory(flat, array):
+            array[...] = flat.reshape(array.shape)
+        return array
+
+    return flat, finish
+
+
+def igather(
+    sbuf: npt.NDArray,
+    rbuf_size: int = None,
+    pelist: list[int] = None,
+    out: npt.NDArray = None,
+) -> CollectiveHandle:
+
+    """
+    Starts gathering the 1D array sbuf from all PEs to the root PE
+    without blocking, as gather does for 1D arrays.  Returns a
+    CollectiveHandle whose wait returns the gathered array on the
+    root PE and None on the other PEs.  Only 1D arrays are gathered;
+    2D to 4D arrays on a domain are gathered with gather, and arrays
+    of any rank can be gathered by rows with igatherv
+    """
+
+    if sbuf.ndim != 1:
+        raise RuntimeError(
+            f"mpp.igather: sbuf must be a 1D array, not {sbuf.ndim}D; "
+            "use gather for domain arrays or igatherv to gather rows"
+        )
+
+    comm, is_root_pe = _get_comm(pelist)
+    if comm is None:
+        return CollectiveHandle(None)
+
+    rbuf = None
+    if is_root_pe:
+        if rbuf_size is None and out is not None:
+            rbuf_size = out.size
+        if rbuf_size is None:
+            raise RuntimeError("Must specify size of receiving array")
+        rbuf = get_buffer((rbuf_size,), sbuf.dtype, out, "mpp.igather")
+
+    sbuf = np.ascontiguousarray(sbuf)
+    request = comm.Igather(sbuf, rbuf, root=0)
+    return CollectiveHandle(request, rbuf)
+
+
+def igatherv(
+    sbuf: npt.NDArray,
+    ssize: int = None,
+    rsize: list[int] = None,
+    pelist: list[int] = None,
+    out: npt.NDArray = None,
+) -> CollectiveHandle:
+
+    """
+    Starts gathering ssize rows of the first dimension of sbuf from
+    all PEs to the root PE without blocking, as gatherv does.
+    Returns a CollectiveHandle whose wait returns the gathered
+    array on the root PE and None on the other PEs
+    """
+
+    comm, is_root_pe = _get_comm(pelist)
+    if comm is None:
+        return CollectiveHandle(None)
+
+    if ssize is None:
+        ssize = sbuf.shape[0]
+
+    row_shape = sbuf.shape[1:]
+    row_size = int(np.prod(row_shape))
+
+    recv = rbuf = None
+    if is_root_pe:
+        if rsize is None:
+            raise RuntimeError("must specify receiving sizes for root pe")
+        offsets = np.zeros(len(rsize) + 1, dtype=np.int64)
+        np.cumsum(rsize, out=offsets[1:])
+        shape = (int(offsets[-1]),) + row_shape
+        rbuf = get_buffer(shape, sbuf.dtype, out, "mpp.igatherv")
+        counts = np.asarray(rsize, dtype=np.int64) * row_size
+        recv = [rbuf, (counts.tolist(), (offsets[:-1] * row_size).tolist())]
+
+    sbuf = np.ascontiguousarray(sbuf[:ssize])
+    request = comm.Igatherv(sbuf, recv, root=0)
+    return CollectiveHandle(request, rbuf)
+
+
+def isum(array: npt.NDArray, pelist: list[int] = None) -> CollectiveHandle:
+
+    """
+    Starts summing array elementwise over all PEs without blocking,
+    as sum does.  Returns a CollectiveHandle whose wait returns
+    array overwritten with the result
+    """
+
+    return _icollective("SUM", array, pelist)
+
+
+def imax(array: npt.NDArray, pelist: list[int] = None) -> CollectiveHandle:
+
+    """
+    Starts the elementwise maximum of array over all PEs
+    without blocking, as isum
+    """
+
+    return _icollective("MAX", array, pelist)
+
+
+def imin(array: npt.NDArray, pelist: list[int] = None) -> CollectiveHandle:
+
+    """
+    Starts the elementwise minimum of array over all PEs
+    without blocking, as isum
+    """
+
+    return _icollective("MIN", array, pelist)
+
+
+def _icollective(op: str, array: Any, pelist: list[int]) -> CollectiveHandle:
+
+    """
+    Starts the reduction op of array over all PEs in place with
+    MPI_Iallreduce, as _reduce.  The result of arrays that are
+    not contiguous is copied back on completion
+    """
+
+    from mpi4py import MPI
+
+    comm, _ = _get_comm(pelist)
+    if comm is None:
+        return CollectiveHandle(None, array)
+
+    flat, finish = _flatten(array, f"mpp.i{op.lower()}")
+    request = comm.Iallreduce(MPI.IN_PLACE, flat, op=getattr(MPI, op))
+    return CollectiveHandle(request, array, finish)
+
+
+def _get_comm(pelist: list[int] = None) -> tuple:
+
+    """
+    Returns the mpi4py communicator of pelist, or of the current
+    pelist if pelist is None, and whether this PE is the root PE,
+    the first PE of the pelist.  Pelists other than the current
+    pelist must have been declared with declare_pelist, which
+    needs all PEs.  PEs outside of pelist return None
+    """
+
+    if pelist is None:
+        pelist = get_current_pelist_array()
+    key = tuple(int(ipe) for ipe in pelist)
+
+    comm = _pelist_comms.get(key)
+    if comm is None:
+        if key == tuple(get_current_pelist_array()):
+            comm = get_comm()
+        elif key not in _declared_pelists:
+            raise RuntimeError(
+                f"mpp: pelist {list(key)} must be declared with declare_pelist "
+                "before its collectives"
+            )
+        elif pe() not in key:
+            return None, False
+        else:
+            comm = get_comm(_declared_pelists[key][1])
+        _pelist_comms[key] = comm
+
+    return comm, pe() == key[0]
+
+
+def get_comm(commID: Any = None) -> Any:
+
+    """
+    Returns the mpi4py communicator of the cFMS communicator
+    commID, as returned by declare_pelist or get_current_pelist,
+    or of the current pelist if commID is None.  The communicator
+    is shared with cFMS and must not be freed
+    """
+
+    from mpi4py import MPI
+
+    if commID is None:
+        _, commID = get_current_pelist(npes(), get_commID=True)
+    return MPI.Comm.f2py(getattr(commID, "value", commID))
+
+
+def clock(name: str) -> Clock:
+
+    """
+    Returns the Clock timing python regions under name,
+    created on first use.  The clocks are reported across
+    the PEs of the current pelist by clock_report
+    """
+
+    value = _clocks.get(name)
+    if value is None:
+        check_str(name, 32, "mpp.clock")
+        value = _clocks[name] = Clock(name)
+    return value
+
+
+def clock_report() -> str | None:
+
+    """
+    Gathers the clocks of all PEs in the current pelist to the
+    root PE and returns a report of the number of PEs timing each
+    clock, their calls and the min, max and average time per PE
+    on the root PE.  Returns None on all other PEs, and on the
+    root PE when no PE has created a clock.  This function must
+    be called by all PEs in the current pelist.  fms.end prints
+    the report before FMS terminates
+    """
+
+    # PEs may have created different clocks
+    comm, is_root_pe = _get_comm()
+    gathered = comm.gather(
+        {name: (value.calls, value.total) for name, value in _clocks.items()},
+        root=0,
+    )
+
+    if not is_root_pe:
+        return None
+
+    names = sorted(set().union(*gathered))
+    if not names:
+        return None
+
+    lines = [
+        f"pyfms clocks: {len(gathered)} PEs",
+        f"{'clock':<34s}{'PEs':>6s}{'calls':>10s}"
+        f"{'tmin(s)':>12s}{'tmax(s)':>12s}{'tavg(s)':>12s}",
+    ]
+    for name in names:
+        timed = np.array(
+            [pe_clocks[name] for pe_clocks in gathered if name in pe_clocks]
+        )
+        calls, total = timed[:, 0], timed[:, 1]
+        lines.append(
+            f"{name:<34s}{len(timed):>6d}{int(calls.sum()):>10d}"
+            f"{total.min():>12.4e}{total.max():>12.4e}{total.mean():>12.4e}"
+        )
+
+    return "\n".join(lines)
+
+
+def _clock_end():
+
+    """
+    Prints the clock report on the root PE.  Called by
+    fms.end before FMS terminates
+    """
+
+    text = clock_report()
+    if text is not None:
+        print(text)
+
+
+def chksum(
+    array: npt.NDArray,
+    domain: Any = None,
+    position: int = None,
+    pelist: list[int] = None,
+    mask_val: Any = None,
+) -> int:
+
+    """
+    Returns the checksum of a field decomposed over the PEs in
+    pelist or in the current pelist, as mpp_chksum computes it:
+    the 64-bit integer sum of the bit patterns of the elements,
+    with 32-bit elements sign extended.  The sum is independent of
+    the decomposition of the field and costs one reduction.  If
+    domain is provided, array is a data domain array and its
+    compute domain is summed.  Elements equal to mask_val are
+    excluded
+    """
+
+    if domain is not None:
+        array = domain.compute_view(array, position)
+
+    itemsize = array.dtype.itemsize
+    if itemsize not in (4, 8):
+        raise RuntimeError(f"mpp.chksum: {array.dtype.name} not supported")
+    bits = array.view(np.int32 if itemsize == 4 else np.int64)
+
+    if mask_val is not None:
+        bits = np.where(array == mask_val, 0, bits)
+
+    # integer overflow wraps around as in FMS
+    local = np.array([np.sum(bits, dtype=np.int64)])
+    sum(local.view(np.uint64), pelist=pelist)
+
+    return int(local[0])
 
 
 def declare_pelist(
@@ -171,19 +1019,83 @@ def declare_pelist(
     The size of the passed pelist must match the current number
     of npes; pelist(npes)
 
+    Declared pelists are registered by their PEs and name.  Declaring
+    a registered pelist again returns its commID without declaring
+    it, and a registered name can be passed to set_current_pelist
+
     Returns: commID is returned, and the object passed to the method should be
     set to the result of the call
     """
 
-    arglist = []
-    set_c_int(len(pelist), arglist)
-    set_list(pelist, np.int32, arglist)
-    set_c_str(name, arglist)
-    commID = set_c_int(0, arglist)
+    key = tuple(int(ipe) for ipe in pelist)
+
+    declared = _declared_pelists.get(key)
+    if declared is not None:
+        _pelist_stats["avoided"] += 1
+    else:
+        arglist = []
+        set_c_int(len(pelist), arglist)
+        set_list(pelist, np.int32, arglist)
+        set_c_str(name, arglist)
+        commID = set_c_int(0, arglist)
+
+        _cFMS_declare_pelist(*arglist)
+        clear_pelist_cache()
+
+        array = np.array(key, dtype=np.int32)
+        array.flags.writeable = False
+        declared = _declared_pelists[key] = (array, commID.value)
+        _pelist_stats["declared"] += 1
+
+    if name is not None:
+        _pelist_names[name] = key
+
+    return declared[1]
+
+
+def get_declared_pelist(name: str) -> list[int]:
+
+    """
+    Returns the pelist declared with name
+    """
+
+    return _get_declared(name)[0].tolist()
 
-    _cFMS_declare_pelist(*arglist)
 
-    return commID
+def get_pelist_stats() -> dict:
+
+    """
+    Returns the number of pelists declared with cFMS and the
+    number of declarations avoided by the pelist registry
+    """
+
+    return dict(_pelist_stats, names=len(_pelist_names))
+
+
+def clear_pelist_registry():
+
+    """
+    Clears the registry of declared pelists, its statistics and
+    the communicators of the pelists.  Pelists declared afterwards
+    are declared with cFMS again
+    """
+
+    _declared_pelists.clear()
+    _pelist_comms.clear()
+    _pelist_names.clear()
+    _pelist_stats.update(declared=0, avoided=0)
+
+
+def _get_declared(name: str) -> tuple:
+
+    """
+    Returns the pelist and commID declared with name
+    """
+
+    try:
+        return _declared_pelists[_pelist_names[name]]
+    except KeyError:
+        raise RuntimeError(f"mpp: no pelist declared with name {name}")
 
 
 def error(errortype: int, errormsg: str = None):
@@ -212,9 +1124,14 @@ def get_current_pelist(
     """
     Returns the current pelist.
     npes specifies the length of the pelist and must be
-    specified to correctly retrieve the current pelist
+    specified to correctly retrieve the current pelist.
+    The cached pelist is returned when npes is the
+    cached number of pes
     """
 
+    if not (get_name or get_commID) and npes == _pelist_cache.get("npes"):
+        return get_current_pelist_array().tolist()
+
     arglist = []
     set_c_int(npes, arglist)
     pelist = set_list([0] * npes, np.int32, arglist)
@@ -234,13 +1151,48 @@ def get_current_pelist(
     return pelist.tolist()
 
 
+def get_current_pelist_array() -> npt.NDArray:
+
+    """
+    Returns the current pelist as a read-only int32 array.
+    The array is cached until the current pelist changes
+    """
+
+    pelist = _pelist_cache.get("pelist")
+    if pelist is None:
+        arglist = []
+        set_c_int(npes(), arglist)
+        pelist = set_list([0] * npes(), np.int32, arglist)
+        set_c_str(None, arglist)
+        set_c_int(None, arglist)
+        _cFMS_get_current_pelist(*arglist)
+        pelist.flags.writeable = False
+        _pelist_cache["pelist"] = pelist
+    return pelist
+
+
+def clear_pelist_cache():
+
+    """
+    Clears the cached pe, npes, root_pe and current pelist.
+    The cache is cleared by set_current_pelist and declare_pelist,
+    and only needs to be cleared directly if the current pelist
+    is changed outside of pyfms
+    """
+
+    _pelist_cache.clear()
+
+
 def npes() -> int:
 
     """
     Returns: number of pes in use
     """
 
-    return _cFMS_npes()
+    value = _pelist_cache.get("npes")
+    if value is None:
+        value = _pelist_cache["npes"] = _cFMS_npes()
+    return value
 
 
 def pe() -> int:
@@ -249,7 +1201,10 @@ def pe() -> int:
     Returns: pe number of calling pe
     """
 
-    return _cFMS_pe()
+    value = _pelist_cache.get("pe")
+    if value is None:
+        value = _pelist_cache["pe"] = _cFMS_pe()
+    return value
 
 
 def root_pe() -> int:
@@ -257,24 +1212,43 @@ def root_pe() -> int:
     """
     Returns the root pe in the current pelist
     """
-    return _cFMS_root_pe()
+
+    value = _pelist_cache.get("root_pe")
+    if value is None:
+        value = _pelist_cache["root_pe"] = _cFMS_root_pe()
+    return value
 
 
-def set_current_pelist(pelist: list[int] = None, no_sync: bool = None):
+def set_current_pelist(
+    pelist: list[int] = None,
+    no_sync: bool = None,
+    name: str = None,
+):
 
     """
-    Sets the current pelist
+    Sets the current pelist, or the pelist declared
+    with name if name is provided
     """
 
     arglist = []
-    if pelist is None:
+    if name is not None:
+        pelist = _get_declared(name)[0]
+        set_c_int(len(pelist), arglist)
+        arglist.append(pelist)
+    elif pelist is None:
         set_c_int(None, arglist)
+        set_list(pelist, np.int32, arglist)
     else:
         set_c_int(len(pelist), arglist)
-    set_list(pelist, np.int32, arglist)
+        set_list(pelist, np.int32, arglist)
     set_c_bool(no_sync, arglist)
 
     _cFMS_set_current_pelist(*arglist)
+    clear_pelist_cache()
+
+    if name is not None:
+        _pelist_cache["npes"] = len(pelist)
+        _pelist_cache["pelist"] = pelist
 
 
 def _init_functions():
@@ -349,3 +1323,9 @@ def _init(libpath: str, lib: Any):
     _lib = lib
 
     _init_functions()
+    _clocks.clear()
+    clear_pelist_cache()
+    clear_pelist_registry()
+
+
+cfms._bind(__name__, _init)
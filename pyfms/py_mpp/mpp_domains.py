@@ -1,18 +1,27 @@
+import json
+import os
+import time
 from typing import Any
 
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
 
 import pyfms.py_mpp.mpp as mpp
+from pyfms import cfms
+from pyfms.py_fms import fms
 from pyfms.py_mpp import _mpp_domains_functions
 from pyfms.py_mpp.domain import Domain
+from pyfms.py_mpp.group_update import GroupUpdate
+from pyfms.py_mpp.update_handle import UpdateHandle
 from pyfms.utils.ctypes_utils import (
+    CallPlan,
     check_str,
+    copy_back,
     get_constant_int,
-    set_array,
     set_c_bool,
     set_c_int,
     set_c_str,
+    set_cf_arrays,
     set_list,
 )
 
@@ -20,6 +29,13 @@ from pyfms.utils.ctypes_utils import (
 _libpath = None
 _lib = None
 
+# layouts returned by autotune_layout, keyed by the
+# grid, halos and fields the layouts were timed for
+_tuned_layouts: dict = {}
+
+# number of domains defined in cFMS, which cannot be freed
+_ndomains_defined = 0
+
 GLOBAL_DATA_DOMAIN = None
 BGRID_NE = None
 CGRID_NE = None
@@ -82,6 +98,17 @@ _cFMS_v_update_domains_float_5d = None
 _cFMS_v_update_domains_double_5d = None
 _cFMS_v_update_domains = {}
 
+# halo exchange plans keyed by the domain id, the position
+# and halo widths of the fields, and the tag of their messages
+_halo_plans: dict = {}
+_HALO_TAG = 118
+
+# redistribution plans keyed by the ids of the domains, the position
+# of the fields and the communicator of the current pelist, and the
+# tag of their messages
+_redistributions: dict = {}
+_REDISTRIBUTE_TAG = 117
+
 
 def get_compute_domain(
     domain_id: int,
@@ -211,14 +238,15 @@ def define_domains(
     Creates a domain.  Automatically queries the newly formed
     compute and data domains and returns a pyDomain object with
     queried domain information. The returned domain_id
-    corresponds to the saved FmsMppDomain2D derived type in cFMS
+    corresponds to the saved FmsMppDomain2D derived type in cFMS.
+    Without a layout, the layout is given by define_layout
     """
 
+    global _ndomains_defined
+
     if layout is None:
-        if pelist is None:
-            layout = define_layout(global_indices, mpp.npes())
-        else:
-            layout = define_layout(global_indices, len(pelist))
+        ndivs = mpp.npes() if pelist is None else len(pelist)
+        layout = define_layout(global_indices, ndivs)
 
     arglist = []
     set_list(global_indices, np.int32, arglist)
@@ -247,6 +275,7 @@ def define_domains(
     set_c_int(y_cyclic_offset, arglist)
 
     domain_id = _cFMS_define_domains(*arglist)
+    _ndomains_defined += 1
 
     compute = get_compute_domain(
         domain_id=domain_id, tile_count=tile_count, whalo=whalo, shalo=shalo
@@ -268,6 +297,11 @@ def define_domains(
     domain.xsize_g = global_indices[1] + 1
     domain.ysize_g = global_indices[3] + 1
 
+    # the boundaries of single tile domains, for the halo exchanges
+    if not is_mosaic and not x_cyclic_offset and not y_cyclic_offset:
+        domain.xflags = 0 if xflags is None else xflags
+        domain.yflags = 0 if yflags is None else yflags
+
     return domain
 
 
@@ -300,6 +334,144 @@ def define_layout(global_indices: list[int], ndivs: int) -> list:
     return layout.tolist()
 
 
+def autotune_layout(
+    global_indices: list[int],
+    ndivs: int = None,
+    whalo: int = None,
+    ehalo: int = None,
+    shalo: int = None,
+    nhalo: int = None,
+    nz: int = None,
+    nfields: int = 1,
+    dtype: DTypeLike = np.float64,
+    xflags: int = None,
+    yflags: int = None,
+    ncalls: int = 10,
+    cache: str = None,
+    get_domain: bool = False,
+) -> Any:
+
+    """
+    Returns the layout of ndivs divisions, ndivs defaulting to the
+    number of PEs in the current pelist, for which updating the halos
+    of nfields fields of shape (x, y) or (x, y, nz) is fastest.  A
+    domain is defined for each candidate layout, and update_domains is
+    timed on all PEs; the slowest PE gives the cost of a layout.  One
+    cFMS domain is used per candidate and cannot be freed, so fms.init
+    must be called with enough domains.  With get_domain, the domain
+    of the returned layout is returned after it, so that no other
+    domain is defined for it.
+
+    Layouts are kept for the grid, halos and fields they were timed
+    for, and are reused by later calls.  If cache is the path to a JSON
+    file, layouts found in the file are also reused without timing and
+    new layouts are added by the root PE.  The layout is passed to
+    define_domains by the caller
+    """
+
+    whoami = "mpp_domains.autotune_layout"
+
+    if ndivs is None:
+        ndivs = mpp.npes()
+    halos = dict(whalo=whalo, ehalo=ehalo, shalo=shalo, nhalo=nhalo)
+    flags = dict(xflags=xflags, yflags=yflags)
+
+    key = json.dumps(
+        dict(
+            global_indices=list(global_indices),
+            ndivs=ndivs,
+            nz=nz,
+            nfields=nfields,
+            dtype=np.dtype(dtype).name,
+            **flags,
+            **halos,
+        ),
+        sort_keys=True,
+    )
+
+    layout = _tuned_layouts.get(key)
+
+    layouts = {}
+    if layout is None and cache is not None and os.path.isfile(cache):
+        with open(cache) as f:
+            layouts = json.load(f)
+        layout = layouts.get(key)
+
+    # the layouts are timed on all PEs unless every PE found the layout
+    domain = None
+    if mpp.max(float(layout is None)) > 0.0:
+        candidates = _candidate_layouts(global_indices, ndivs, halos)
+        if not candidates:
+            raise RuntimeError(
+                f"{whoami}: no layout of {ndivs} divisions fits the grid and halos"
+            )
+
+        if fms._ndomain is not None:
+            available = fms._ndomain - _ndomains_defined
+            if len(candidates) > available:
+                raise RuntimeError(
+                    f"{whoami}: timing {len(candidates)} candidate layouts needs "
+                    f"{len(candidates)} domains, only {available} of the "
+                    f"ndomain={fms._ndomain} domains given to fms.init are left"
+                )
+
+        timings, domains = {}, {}
+        for candidate in candidates:
+            candidate_domain = define_domains(
+                global_indices, candidate, **flags, **halos
+            )
+            fields = [candidate_domain.zeros(nz, dtype=dtype) for _ in range(nfields)]
+
+            def update():
+                for field in fields:
+                    update_domains(field, candidate_domain.domain_id, **halos)
+
+            update()
+            start = time.perf_counter()
+            for _ in range(ncalls):
+                update()
+            timings[tuple(candidate)] = mpp.max(time.perf_counter() - start)
+            domains[tuple(candidate)] = candidate_domain
+
+        layout = list(min(timings, key=timings.get))
+        domain = domains[tuple(layout)]
+
+        if cache is not None and mpp.pe() == mpp.root_pe():
+            layouts[key] = layout
+            with open(cache + ".tmp", "w") as f:
+                json.dump(layouts, f, indent=2)
+            os.replace(cache + ".tmp", cache)
+
+    _tuned_layouts[key] = layout
+
+    if get_domain:
+        if domain is None:
+            domain = define_domains(global_indices, layout, **flags, **halos)
+        return layout, domain
+    return layout
+
+
+def _candidate_layouts(global_indices: list[int], ndivs: int, halos: dict) -> list:
+
+    """
+    Returns the layouts of ndivs divisions whose compute
+    domains are at least as wide as the halos
+    """
+
+    nx = global_indices[1] - global_indices[0] + 1
+    ny = global_indices[3] - global_indices[2] + 1
+    xhalo = max(halos["whalo"] or 1, halos["ehalo"] or 1)
+    yhalo = max(halos["shalo"] or 1, halos["nhalo"] or 1)
+
+    return [
+        [idivs, ndivs // idivs]
+        for idivs in range(1, ndivs + 1)
+        if ndivs % idivs == 0
+        and nx // idivs >= xhalo
+        and ny // (ndivs // idivs) >= yhalo
+    ]
+
+
 def define_nest_domains(
     num_nest: int,
     ntiles: int,
@@ -361,6 +533,8 @@ def define_cubic_mosaic(
     FmsMPPDomain2D type saved in cFMS.
     """
 
+    global _ndomains_defined
+
     arglist = []
     set_list(ni, np.int32, arglist)
     set_list(nj, np.int32, arglist)
@@ -370,7 +544,9 @@ def define_cubic_mosaic(
     set_c_int(halo, arglist)
     set_c_bool(use_memsize, arglist)
 
-    return _cFMS_define_cubic_mosaic(*arglist)
+    domain_id = _cFMS_define_cubic_mosaic(*arglist)
+    _ndomains_defined += 1
+    return domain_id
 
 
 def domain_is_initialized(domain_id: int) -> bool:
@@ -411,7 +587,7 @@ def get_layout(domain_id: int) -> list[int]:
     layout = set_list([0] * 2, np.int32, arglist)
     set_c_int(domain_id, arglist)
 
-    _cFMS_get_layout(layout, domain_id)
+    _cFMS_get_layout(*arglist)
 
     return layout.tolist()
 
@@ -579,6 +755,7 @@ def update_domains(
     """
     Updates the field values for the halo regions
     in the data domain associated with domain_id
+    Fortran ordered fields are passed to cFMS without a copy
     """
 
     try:
@@ -592,22 +769,26 @@ def update_domains(
 
     check_str(name, 64, "mpp_domains.update")
 
-    arglist = []
-    set_list(field.shape, np.int32, arglist)
-    set_array(field, arglist)
-    set_c_int(domain_id, arglist)
-    set_c_int(flags, arglist)
-    set_c_bool(complete, arglist)
-    set_c_int(position, arglist)
-    set_c_int(whalo, arglist)
-    set_c_int(ehalo, arglist)
-    set_c_int(shalo, arglist)
-    set_c_int(nhalo, arglist)
-    set_c_str(name, arglist)
-    set_c_int(tile_count, arglist)
-    set_c_bool(convert_cf_order, arglist)
+    copyback = []
+    (field,), convert_cf_order = set_cf_arrays([field], convert_cf_order, copyback)
+
+    cFMS_update_this(
+        field.shape,
+        field,
+        domain_id,
+        flags,
+        complete,
+        position,
+        whalo,
+        ehalo,
+        shalo,
+        nhalo,
+        name,
+        tile_count,
+        convert_cf_order,
+    )
 
-    cFMS_update_this(*arglist)
+    copy_back(copyback)
 
 
 def vector_update_domains(
@@ -636,24 +817,824 @@ def vector_update_domains(
         )
     check_str(name, 64, "mpp_domains.vector_update")
 
-    arglist = []
-    set_list(fieldx.shape, np.int32, arglist)
-    set_array(fieldx, arglist)
-    set_list(fieldy.shape, np.int32, arglist)
-    set_array(fieldy, arglist)
-    set_c_int(domain_id, arglist)
-    set_c_int(flags, arglist)
-    set_c_int(gridtype, arglist)
-    set_c_bool(complete, arglist)
-    set_c_int(whalo, arglist)
-    set_c_int(ehalo, arglist)
-    set_c_int(shalo, arglist)
-    set_c_int(nhalo, arglist)
-    set_c_str(name, arglist)
-    set_c_int(tile_count, arglist)
-    set_c_bool(convert_cf_order, arglist)
+    copyback = []
+    (fieldx, fieldy), convert_cf_order = set_cf_arrays(
+        [fieldx, fieldy], convert_cf_order, copyback
+    )
+
+    cFMS_v_update_this(
+        fieldx.shape,
+        fieldx,
+        fieldy.shape,
+        fieldy,
+        domain_id,
+        flags,
+        gridtype,
+        complete,
+        whalo,
+        ehalo,
+        shalo,
+        nhalo,
+        name,
+        tile_count,
+        convert_cf_order,
+    )
+
+    copy_back(copyback)
+
+
+def start_update_domains(
+    field: NDArray,
+    domain: Domain,
+    flags: int = None,
+    position: int = None,
+    whalo: int = None,
+    ehalo: int = None,
+    shalo: int = None,
+    nhalo: int = None,
+) -> UpdateHandle:
+
+    """
+    Starts the update of the halo regions of field, a 2D to 5D
+    data domain array of domain, as mpp_start_update_domains and
+    returns an UpdateHandle.  The messages are posted with
+    Isend/Irecv; the halos are valid once the handle is completed,
+    either with complete_update_domains or by leaving a with block.
+    The compute domain of field must not be modified and its halos
+    not read until the update completes
+    """
+
+    whoami = "mpp_domains.start_update_domains"
+
+    plan = _halo_plan(domain, position, flags, whalo, ehalo, shalo, nhalo, whoami)
+    _check_halo_field(field, plan, whoami)
+
+    return _start_update_handle(domain, [(field, plan)])
+
+
+def start_vector_update_domains(
+    fieldx: NDArray,
+    fieldy: NDArray,
+    domain: Domain,
+    flags: int = None,
+    gridtype: int = None,
+    whalo: int = None,
+    ehalo: int = None,
+    shalo: int = None,
+    nhalo: int = None,
+) -> UpdateHandle:
+
+    """
+    Starts the update of the halo regions of the vector field
+    (fieldx, fieldy) at the positions of gridtype and returns an
+    UpdateHandle as start_update_domains.  The halos are updated
+    as those of scalars, which holds on single tile domains
+    without folds
+    """
+
+    whoami = "mpp_domains.start_vector_update_domains"
+
+    if fieldx.dtype != fieldy.dtype:
+        raise RuntimeError(f"{whoami}: fieldx and fieldy must have the same dtype")
+
+    fields = []
+    for field, position in zip([fieldx, fieldy], _vector_positions(gridtype, whoami)):
+        plan = _halo_plan(domain, position, flags, whalo, ehalo, shalo, nhalo, whoami)
+        _check_halo_field(field, plan, whoami)
+        fields.append((field, plan))
+
+    return _start_update_handle(domain, fields)
+
+
+def complete_update_domains(handle: UpdateHandle):
+
+    """
+    Waits for the halo update started with start_update_domains
+    or start_vector_update_domains to complete
+    """
+
+    handle.complete()
+
+
+def _start_update_handle(domain: Domain, fields: list[tuple]) -> UpdateHandle:
+
+    """
+    Starts the halo update of fields, (field, plan) pairs of domain,
+    with buffers of its own, and returns the UpdateHandle completing it
+    """
+
+    requests, received = _start_halo_update(fields)
+
+    def complete():
+        _complete_halo_update(requests, received)
+
+    return UpdateHandle(complete, domain, [field for field, _ in fields])
+
+
+def create_group_update(
+    domain: Domain,
+    fields: list[NDArray] = None,
+    vector_fields: list[tuple[NDArray, NDArray]] = None,
+    positions: list[int] = None,
+    flags: int = None,
+    gridtype: int = None,
+    whalo: int = None,
+    ehalo: int = None,
+    shalo: int = None,
+    nhalo: int = None,
+) -> GroupUpdate:
+
+    """
+    Registers fields and (x, y) vector field pairs of domain, a
+    Domain returned by define_domains, for a group halo update as
+    mpp_create_group_update, and returns the GroupUpdate to pass
+    to do_group_update.  positions gives the position of each field
+    in fields and gridtype the positions of the vector fields.
+    Fields are 2D to 5D data domain arrays of the same dtype with
+    x and y as their first two dimensions, in any memory order.
+    The halos of vector fields are updated as those of scalars at
+    their positions, which holds on single tile domains without folds
+    """
+
+    whoami = "mpp_domains.create_group_update"
+
+    fields = [] if fields is None else list(fields)
+    vector_fields = [] if vector_fields is None else list(vector_fields)
+    if positions is None:
+        positions = [None] * len(fields)
+    if len(positions) != len(fields):
+        raise RuntimeError(f"{whoami}: one position is required for each field")
+    if len(fields) + len(vector_fields) == 0:
+        raise RuntimeError(f"{whoami}: no fields to register")
+
+    halos = (whalo, ehalo, shalo, nhalo)
+    xposition, yposition = _vector_positions(gridtype, whoami)
+
+    group = GroupUpdate(domain=domain, dtype=None)
+    registered = list(zip(fields, positions))
+    for fieldx, fieldy in vector_fields:
+        registered += [(fieldx, xposition), (fieldy, yposition)]
+
+    for field, position in registered:
+        if group.dtype is None:
+            group.dtype = field.dtype.name
+        if field.dtype.name != group.dtype:
+            raise RuntimeError(f"{whoami}: all fields must be of type {group.dtype}")
+        plan = _halo_plan(domain, position, flags, *halos, whoami)
+        _check_halo_field(field, plan, whoami)
+        group.fields.append((field, plan))
+
+    return group
+
+
+def do_group_update(group: GroupUpdate):
+
+    """
+    Updates the halos of all fields registered in group with
+    one message to and from each PE of the domain
+    """
+
+    if group.domain is None:
+        raise RuntimeError("mpp_domains.do_group_update: group has been cleared")
+
+    _complete_halo_update(*_start_halo_update(group.fields, group._buffers))
+
+
+def clear_group_update(group: GroupUpdate):
+
+    """
+    Releases the fields registered in group
+    and the buffers of its messages
+    """
+
+    group.domain = None
+    group.fields = []
+    group._buffers.clear()
+
+
+class _HaloPlan:
+
+    """
+    Messages of the halo update of the fields at a position of
+    a domain on this PE: the data domain slices of the compute
+    domain sent to each rank of comm, of the halos received from
+    each rank, and of the compute domain copied to the halos of
+    this PE across cyclic boundaries
+    """
+
+    def __init__(self, comm: Any, extents: tuple):
+        self.comm = comm
+        self.extents = extents  # x and y extents of the data domain
+        self.sends = {}  # rank: [(x slice, y slice)]
+        self.recvs = {}  # rank: [(x slice, y slice)]
+        self.copies = []  # (compute slices, halo slices)
+
+
+def _halo_plan(
+    domain: Domain,
+    position: int,
+    flags: int,
+    whalo: int,
+    ehalo: int,
+    shalo: int,
+    nhalo: int,
+    whoami: str,
+) -> _HaloPlan:
+
+    """
+    Returns the plan of the halo update of fields at position,
+    created on first use from the compute domains and halos of
+    all PEs of the domain.  Halo widths default to the halos of
+    the data domain, and flags select the halos updated as the
+    XUPDATE, YUPDATE, EUPDATE and NUPDATE flags of FMS
+    """
+
+    if not isinstance(domain, Domain) or domain.xflags is None:
+        raise RuntimeError(
+            f"{whoami}: domain must be a single tile Domain returned by define_domains"
+        )
+    if (domain.xflags | domain.yflags) & ~CYCLIC_GLOBAL_DOMAIN:
+        raise RuntimeError(
+            f"{whoami}: only cyclic and non-cyclic boundaries are supported"
+        )
+
+    key = (domain.domain_id, position, flags, whalo, ehalo, shalo, nhalo)
+    plan = _halo_plans.get(key)
+    if plan is not None:
+        return plan
+
+    bounds = domain.bounds(position)
+    isc, iec, jsc, jec = bounds["isc"], bounds["iec"], bounds["jsc"], bounds["jec"]
+    isd, jsd = bounds["isd"], bounds["jsd"]
+
+    widths = [
+        isc - isd if whalo is None else whalo,
+        bounds["ied"] - iec if ehalo is None else ehalo,
+        jsc - jsd if shalo is None else shalo,
+        bounds["jed"] - jec if nhalo is None else nhalo,
+    ]
+    if flags is not None:
+        sides = [XUPDATE & ~EUPDATE, EUPDATE, YUPDATE & ~NUPDATE, NUPDATE]
+        widths = [width if flags & side else 0 for width, side in zip(widths, sides)]
+    w, e, s, n = widths
+
+    comm, _ = mpp._get_comm(get_domain_pelist(domain.domain_id))
+    plan = _HaloPlan(comm, (bounds["xsize_d"], bounds["ysize_d"]))
+
+    # the halos of a PE are the 8 rectangles around its compute domain
+    xs = [(isc - w, isc - 1), (isc, iec), (iec + 1, iec + e)]
+    ys = [(jsc - s, jsc - 1), (jsc, jec), (jec + 1, jec + n)]
+    halos = [x + y for y in ys for x in xs if (x, y) != (xs[1], ys[1])]
+    compute = (isc, iec, jsc, jec)
+
+    # compute domains are shifted by the global domain across cyclic boundaries
+    nx = domain.ieg - domain.isg + 1
+    ny = domain.jeg - domain.jsg + 1
+    xshifts = [0, -nx, nx] if domain.xflags & CYCLIC_GLOBAL_DOMAIN else [0]
+    yshifts = [0, -ny, ny] if domain.yflags & CYCLIC_GLOBAL_DOMAIN else [0]
+    shifts = [(xshift, yshift) for yshift in yshifts for xshift in xshifts]
+
+    # the parts of halos in the shifted compute domain of a PE,
+    # listed in the same order on the sending and receiving PEs
+    def overlaps(halos, compute):
+        for xshift, yshift in shifts:
+            for i0, i1, j0, j1 in halos:
+                i0, i1 = max(i0, compute[0] + xshift), min(i1, compute[1] + xshift)
+                j0, j1 = max(j0, compute[2] + yshift), min(j1, compute[3] + yshift)
+                if i0 <= i1 and j0 <= j1:
+                    yield (i0, i1, j0, j1), xshift, yshift
+
+    def slices(box, xshift=0, yshift=0):
+        i0, i1, j0, j1 = box
+        return (
+            slice(i0 - xshift - isd, i1 - xshift - isd + 1),
+            slice(j0 - yshift - jsd, j1 - yshift - jsd + 1),
+        )
+
+    rank = comm.Get_rank()
+    for other, (other_compute, other_halos) in enumerate(
+        comm.allgather((compute, halos))
+    ):
+        if other == rank:
+            for box, xshift, yshift in overlaps(halos, compute):
+                plan.copies.append((slices(box, xshift, yshift), slices(box)))
+            continue
+        for box, xshift, yshift in overlaps(other_halos, compute):
+            plan.sends.setdefault(other, []).append(slices(box, xshift, yshift))
+        for box, _, _ in overlaps(halos, other_compute):
+            plan.recvs.setdefault(other, []).append(slices(box))
+
+    _halo_plans[key] = plan
+    return plan
+
+
+def _check_halo_field(field: NDArray, plan: _HaloPlan, whoami: str):
+
+    """
+    Raises if field is not a 2D to 5D data domain array
+    """
+
+    if field.ndim not in range(2, 6):
+        raise RuntimeError(f"{whoami}: fields must have 2 to 5 dimensions")
+    if field.shape[:2] != plan.extents:
+        raise RuntimeError(
+            f"{whoami}: field of shape {field.shape} is not on the data domain"
+        )
+
+
+def _vector_positions(gridtype: int, whoami: str) -> tuple:
+
+    """
+    Returns the positions of the x and y
+    components of vector fields on gridtype
+    """
 
-    cFMS_v_update_this(*arglist)
+    if gridtype is None or gridtype == AGRID:
+        return None, None
+    if gridtype == BGRID_NE:
+        return CORNER, CORNER
+    if gridtype == CGRID_NE:
+        return EAST, NORTH
+    if gridtype == DGRID_NE:
+        return NORTH, EAST
+    raise RuntimeError(f"{whoami}: gridtype {gridtype} not supported")
+
+
+def _start_halo_update(fields: list[tuple], buffers: dict = None) -> tuple:
+
+    """
+    Copies the halos of fields, (field, plan) pairs of one domain,
+    across the cyclic boundaries of this PE and posts the messages
+    of their halo update, the blocks of all fields for a rank packed
+    in one buffer.  buffers keeps the buffers between updates; new
+    buffers are allocated if buffers is None.  Returns the requests
+    and the receive buffers to unpack once the requests complete
+    """
+
+    comm = fields[0][1].comm
+    dtype = fields[0][0].dtype
+
+    sends, recvs = {}, {}
+    for field, plan in fields:
+        for rank, blocks in plan.sends.items():
+            sends.setdefault(rank, []).extend((field, block) for block in blocks)
+        for rank, blocks in plan.recvs.items():
+            recvs.setdefault(rank, []).extend((field, block) for block in blocks)
+        for compute, halo in plan.copies:
+            field[halo] = field[compute]
+
+    requests, received = [], []
+    for rank, blocks in recvs.items():
+        buffer = _halo_buffer(buffers, ("recv", rank), blocks, dtype)
+        requests.append(comm.Irecv(buffer, source=rank, tag=_HALO_TAG))
+        received.append((buffer, blocks))
+
+    for rank, blocks in sends.items():
+        buffer = _halo_buffer(buffers, ("send", rank), blocks, dtype)
+        offset = 0
+        for field, block in blocks:
+            data = field[block]
+            buffer[offset : offset + data.size].reshape(data.shape)[...] = data
+            offset += data.size
+        requests.append(comm.Isend(buffer, dest=rank, tag=_HALO_TAG))
+
+    return requests, received
+
+
+def _complete_halo_update(requests: list, received: list):
+
+    """
+    Waits for the messages of a halo update started
+    with _start_halo_update and unpacks the halos
+    """
+
+    from mpi4py import MPI
+
+    MPI.Request.Waitall(requests)
+
+    for buffer, blocks in received:
+        offset = 0
+        for field, block in blocks:
+            halo = field[block]
+            halo[...] = buffer[offset : offset + halo.size].reshape(halo.shape)
+            offset += halo.size
+
+
+def _halo_buffer(buffers: dict, key: tuple, blocks: list, dtype: DTypeLike):
+
+    """
+    Returns the buffer of the message of blocks, (field, slices)
+    pairs, kept in buffers under key unless buffers is None
+    """
+
+    size = 0
+    for field, (i, j) in blocks:
+        size += (i.stop - i.start) * (j.stop - j.start) * int(np.prod(field.shape[2:]))
+
+    buffer = None if buffers is None else buffers.get(key)
+    if buffer is None or buffer.size != size or buffer.dtype != dtype:
+        buffer = np.empty(size, dtype=dtype)
+        if buffers is not None:
+            buffers[key] = buffer
+    return buffer
+
+
+def global_sum(
+    field: NDArray,
+    domain: Any,
+    bitwise_exact: bool = False,
+    position: int = None,
+    tile_count: int = None,
+    per_level: bool = False,
+) -> Any:
+
+    """
+    Returns the sum of field over the domain, a Domain or a domain
+    id, and over the PEs of the current pelist.  field is a 2D to 4D
+    compute or data domain array with x and y as its first two
+    dimensions; halos are excluded from the sum.  With bitwise_exact,
+    floating point fields are summed in extended fixed precision as
+    mpp_reproducing_sum does, so that the sum is reproducible across
+    layouts and PE counts.  Returns a numpy scalar, or with per_level
+    an array of the sums of each level of shape field.shape[2:]
+    """
+
+    whoami = "mpp_domains.global_sum"
+
+    field = _compute_field(field, domain, position, tile_count, whoami)
+    axis = (0, 1) if per_level else None
+
+    if field.dtype.kind == "f":
+        if bitwise_exact:
+            result = _reproducing_sum(field, per_level)
+        else:
+            result = mpp.sum(np.atleast_1d(field.sum(axis=axis, dtype=np.float64)))
+    else:
+        result = mpp.sum(np.atleast_1d(field.sum(axis=axis, dtype=np.int64)))
+
+    return _global_result(result, field, per_level)
+
+
+def global_max(
+    field: NDArray,
+    domain: Any,
+    position: int = None,
+    tile_count: int = None,
+    per_level: bool = False,
+) -> Any:
+
+    """
+    Returns the maximum of field over the domain,
+    as a numpy scalar or per level as global_sum
+    """
+
+    field = _compute_field(
+        field, domain, position, tile_count, "mpp_domains.global_max"
+    )
+    result = np.atleast_1d(field.max(axis=(0, 1) if per_level else None))
+    return _global_result(mpp.max(result), field, per_level)
+
+
+def global_min(
+    field: NDArray,
+    domain: Any,
+    position: int = None,
+    tile_count: int = None,
+    per_level: bool = False,
+) -> Any:
+
+    """
+    Returns the minimum of field over the domain,
+    as a numpy scalar or per level as global_sum
+    """
+
+    field = _compute_field(
+        field, domain, position, tile_count, "mpp_domains.global_min"
+    )
+    result = np.atleast_1d(field.min(axis=(0, 1) if per_level else None))
+    return _global_result(mpp.min(result), field, per_level)
+
+
+def _compute_field(
+    field: NDArray,
+    domain: Any,
+    position: int,
+    tile_count: int,
+    whoami: str,
+) -> NDArray:
+
+    """
+    Returns the view of the compute domain
+    of a compute or data domain field
+    """
+
+    return _compute_view(field, _domain_bounds(domain, position, tile_count), whoami)
+
+
+def _domain_bounds(domain: Any, position: int, tile_count: int) -> dict:
+
+    """
+    Returns the compute and data domain bounds
+    of a Domain or of a domain id
+    """
+
+    if isinstance(domain, Domain):
+        return domain.bounds(position, tile_count)
+
+    bounds = get_compute_domain(domain, position=position, tile_count=tile_count)
+    bounds.update(get_data_domain(domain, position=position, tile_count=tile_count))
+    return bounds
+
+
+def _compute_view(field: NDArray, bounds: dict, whoami: str) -> NDArray:
+
+    """
+    Returns the view of the compute domain of a compute or
+    data domain field on the domain of bounds
+    """
+
+    if field.ndim not in (2, 3, 4):
+        raise RuntimeError(f"{whoami}: field must be a 2D to 4D array")
+
+    shape = field.shape[:2]
+    if shape == (bounds["xsize_c"], bounds["ysize_c"]):
+        return field
+    if shape == (bounds["xsize_d"], bounds["ysize_d"]):
+        isd, jsd = bounds["isd"], bounds["jsd"]
+        return field[
+            bounds["isc"] - isd : bounds["iec"] - isd + 1,
+            bounds["jsc"] - jsd : bounds["jec"] - jsd + 1,
+        ]
+    raise RuntimeError(
+        f"{whoami}: field of shape {field.shape} is not on the compute "
+        "or data domain"
+    )
+
+
+def _global_result(result: NDArray, field: NDArray, per_level: bool) -> Any:
+
+    """
+    Returns the reduction result of all PEs in the dtype of field,
+    per level or as a numpy scalar
+    """
+
+    if per_level and field.ndim > 2:
+        return result.astype(field.dtype).reshape(field.shape[2:])
+    return field.dtype.type(result[0])
+
+
+# extended fixed precision of reproducing sums: each value is split
+# into digits of _EFP_BITS bits, the first digit keeping _EFP_HEADROOM
+# bits free so that the digits of any number of values can be summed
+_EFP_BITS = 46
+_EFP_DIGITS = 6
+_EFP_HEADROOM = 17
+_EFP_CHUNK = 2**16
+
+
+def _reproducing_sum(field: NDArray, per_level: bool) -> NDArray:
+
+    """
+    Returns the sum of field over all PEs, or of each level of field
+    with per_level, independent of the decomposition.  The values are
+    scaled by the largest exponent over all PEs and split into integer
+    digits, which are summed exactly, so that the sum only depends on
+    the values summed.  Values smaller than the largest by more than
+    2**-(_EFP_DIGITS * _EFP_BITS - _EFP_HEADROOM) are truncated
+    """
+
+    nlevels = int(np.prod(field.shape[2:])) if per_level else 1
+    values = field.reshape(field.shape[0] * field.shape[1], -1)
+    if not per_level:
+        values = values.reshape(-1, 1)
+
+    _, exponent = np.frexp(np.abs(values).max(axis=0, initial=0.0))
+    exponent = mpp.max(exponent.astype(np.int32))
+    shift = _EFP_BITS - _EFP_HEADROOM - exponent
+
+    digits = np.zeros((_EFP_DIGITS, nlevels), dtype=np.int64)
+    for start in range(0, values.shape[0], _EFP_CHUNK):
+        scaled = np.ldexp(values[start : start + _EFP_CHUNK].astype(np.float64), shift)
+        for k in range(_EFP_DIGITS):
+            digit = np.trunc(scaled)
+            digits[k] += digit.astype(np.int64).sum(axis=0)
+            scaled = np.ldexp(scaled - digit, _EFP_BITS)
+        _carry(digits)
+
+    mpp.sum(digits)
+    _carry(digits)
+
+    result = np.zeros(nlevels)
+    for k in reversed(range(_EFP_DIGITS)):
+        result += np.ldexp(digits[k].astype(np.float64), -shift - k * _EFP_BITS)
+    return result
+
+
+def _carry(digits: NDArray):
+
+    """
+    Carries the digits of reproducing sums in place, leaving every
+    digit but the first in [0, 2**_EFP_BITS).  The digits of a sum
+    are then the same however the sum was accumulated
+    """
+
+    for k in range(_EFP_DIGITS - 1, 0, -1):
+        carry = digits[k] >> _EFP_BITS
+        digits[k] -= carry << _EFP_BITS
+        digits[k - 1] += carry
+
+
+def redistribute(
+    domain_in: Any,
+    field_in: NDArray,
+    domain_out: Any,
+    field_out: NDArray,
+    position: int = None,
+) -> NDArray:
+
+    """
+    Copies field_in on domain_in to field_out on domain_out, as
+    mpp_redistribute, for single tile domains of the same global
+    domain decomposed differently over the PEs of the current
+    pelist.  Domains are Domains or domain ids.  Fields are 2D to 4D
+    compute or data domain arrays with x and y as their first two
+    dimensions, the same levels and the same dtype on all PEs; a PE
+    outside of a domain passes None for its field.  The messages
+    between the PEs are planned on the first call for the domains,
+    position and current pelist, which gathers
+    the compute domains of all PEs, and later calls only exchange
+    the planned messages through buffers kept with the plan.
+    Returns field_out
+    """
+
+    from mpi4py import MPI
+
+    whoami = "mpp_domains.redistribute"
+
+    if field_in is not None and field_out is not None:
+        if field_in.dtype != field_out.dtype:
+            raise RuntimeError(
+                f"{whoami}: field_in of dtype {field_in.dtype} and field_out "
+                f"of dtype {field_out.dtype} must have the same dtype"
+            )
+
+    plan = _redistribution(domain_in, field_in, domain_out, field_out, position)
+
+    if field_in is not None:
+        field_in = _compute_view(field_in, plan.bounds_in, whoami)
+    if field_out is not None:
+        compute_out = _compute_view(field_out, plan.bounds_out, whoami)
+
+    requests, received = [], []
+    for rank, islice, jslice in plan.recvs:
+        shape = (islice.stop - islice.start, jslice.stop - jslice.start)
+        buffer = plan.buffer(
+            ("recv", rank), shape + field_out.shape[2:], field_out.dtype
+        )
+        requests.append(plan.comm.Irecv(buffer, source=rank, tag=_REDISTRIBUTE_TAG))
+        received.append((buffer, islice, jslice))
+
+    for rank, islice, jslice in plan.sends:
+        data = field_in[islice, jslice]
+        buffer = plan.buffer(("send", rank), data.shape, data.dtype)
+        buffer[...] = data
+        requests.append(plan.comm.Isend(buffer, dest=rank, tag=_REDISTRIBUTE_TAG))
+
+    for slices_in, slices_out in plan.copies:
+        compute_out[slices_out] = field_in[slices_in]
+
+    MPI.Request.Waitall(requests)
+
+    for buffer, islice, jslice in received:
+        compute_out[islice, jslice] = buffer
+
+    return field_out
+
+
+def clear_redistribute(domain_in: Any, domain_out: Any, position: int = None):
+
+    """
+    Frees the redistributions planned for the domains
+    and position given to redistribute, on all pelists
+    """
+
+    key = _redistribution_key(domain_in, domain_out, position)
+    for planned in [planned for planned in _redistributions if planned[0] == key]:
+        del _redistributions[planned]
+
+
+class _Redistribution:
+
+    """
+    Messages of a redistribution on this PE: the compute domain
+    slices of field_in sent to and of field_out received from
+    each rank of comm, the slices copied on this PE, and the
+    message buffers, allocated on first use
+    """
+
+    def __init__(self, comm: Any, bounds_in: dict, bounds_out: dict):
+        self.comm = comm
+        self.bounds_in = bounds_in
+        self.bounds_out = bounds_out
+        self.sends = []  # (rank, x slice, y slice) of field_in
+        self.recvs = []  # (rank, x slice, y slice) of field_out
+        self.copies = []  # (field_in slices, field_out slices)
+        self._buffers = {}
+
+    def buffer(self, key: tuple, shape: tuple, dtype: DTypeLike) -> NDArray:
+
+        """
+        Returns the buffer of message key,
+        reallocated if shape or dtype changed
+        """
+
+        buffer = self._buffers.get(key)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = self._buffers[key] = np.empty(shape, dtype=dtype)
+        return buffer
+
+
+def _redistribution(
+    domain_in: Any,
+    field_in: NDArray,
+    domain_out: Any,
+    field_out: NDArray,
+    position: int,
+) -> _Redistribution:
+
+    """
+    Returns the plan of the redistribution between domain_in
+    and domain_out, created on first use from the compute
+    domains of all PEs in the current pelist.  Plans are kept
+    for each communicator of the current pelist
+    """
+
+    comm, _ = mpp._get_comm()
+
+    key = (_redistribution_key(domain_in, domain_out, position), comm.py2f())
+    plan = _redistributions.get(key)
+    if plan is not None:
+        return plan
+
+    bounds_in = None if field_in is None else _domain_bounds(domain_in, position, None)
+    bounds_out = (
+        None if field_out is None else _domain_bounds(domain_out, position, None)
+    )
+    plan = _Redistribution(comm, bounds_in, bounds_out)
+
+    def box(bounds):
+        if bounds is None:
+            return None
+        return bounds["isc"], bounds["iec"], bounds["jsc"], bounds["jec"]
+
+    # the part of the compute domain of a field on this PE
+    # overlapping the compute domain of the other field on rank
+    def overlap(bounds, other):
+        isc, iec, jsc, jec = box(bounds)
+        i0, i1 = max(isc, other[0]), min(iec, other[1])
+        j0, j1 = max(jsc, other[2]), min(jec, other[3])
+        if i0 > i1 or j0 > j1:
+            return None
+        return slice(i0 - isc, i1 - isc + 1), slice(j0 - jsc, j1 - jsc + 1)
+
+    rank = comm.Get_rank()
+    boxes = comm.allgather((box(bounds_in), box(bounds_out)))
+
+    for other, (box_in, box_out) in enumerate(boxes):
+        send = (
+            None
+            if bounds_in is None or box_out is None
+            else overlap(bounds_in, box_out)
+        )
+        recv = (
+            None
+            if bounds_out is None or box_in is None
+            else overlap(bounds_out, box_in)
+        )
+        if other == rank:
+            if send is not None:
+                plan.copies.append((send, recv))
+            continue
+        if send is not None:
+            plan.sends.append((other, *send))
+        if recv is not None:
+            plan.recvs.append((other, *recv))
+
+    _redistributions[key] = plan
+    return plan
+
+
+def _redistribution_key(domain_in: Any, domain_out: Any, position: int) -> tuple:
+
+    """
+    Returns the key of the plan of a redistribution
+    """
+
+    return (
+        getattr(domain_in, "domain_id", domain_in),
+        getattr(domain_out, "domain_id", domain_out),
+        position,
+    )
 
 
 def _init_constants():
@@ -776,46 +1757,49 @@ def _init_functions():
 
     _cFMS_update_domains = {
         2: {
-            "int": _cFMS_update_domains_int_2d,
-            "float32": _cFMS_update_domains_float_2d,
-            "float64": _cFMS_update_domains_double_2d,
+            "int32": CallPlan(_cFMS_update_domains_int_2d),
+            "float32": CallPlan(_cFMS_update_domains_float_2d),
+            "float64": CallPlan(_cFMS_update_domains_double_2d),
         },
         3: {
-            "int": _cFMS_update_domains_int_3d,
-            "float32": _cFMS_update_domains_float_3d,
-            "float64": _cFMS_update_domains_double_3d,
+            "int32": CallPlan(_cFMS_update_domains_int_3d),
+            "float32": CallPlan(_cFMS_update_domains_float_3d),
+            "float64": CallPlan(_cFMS_update_domains_double_3d),
         },
         4: {
-            "int": _cFMS_update_domains_int_4d,
-            "float32": _cFMS_update_domains_float_4d,
-            "float64": _cFMS_update_domains_double_4d,
+            "int32": CallPlan(_cFMS_update_domains_int_4d),
+            "float32": CallPlan(_cFMS_update_domains_float_4d),
+            "float64": CallPlan(_cFMS_update_domains_double_4d),
         },
         5: {
-            "int": _cFMS_update_domains_int_5d,
-            "float32": _cFMS_update_domains_float_5d,
-            "float64": _cFMS_update_domains_double_5d,
+            "int32": CallPlan(_cFMS_update_domains_int_5d),
+            "float32": CallPlan(_cFMS_update_domains_float_5d),
+            "float64": CallPlan(_cFMS_update_domains_double_5d),
         },
     }
 
     _cFMS_v_update_domains = {
         2: {
-            "float32": _cFMS_v_update_domains_float_2d,
-            "float64": _cFMS_v_update_domains_double_2d,
+            "float32": CallPlan(_cFMS_v_update_domains_float_2d),
+            "float64": CallPlan(_cFMS_v_update_domains_double_2d),
         },
         3: {
-            "float32": _cFMS_v_update_domains_float_3d,
-            "float64": _cFMS_v_update_domains_double_3d,
+            "float32": CallPlan(_cFMS_v_update_domains_float_3d),
+            "float64": CallPlan(_cFMS_v_update_domains_double_3d),
         },
         4: {
-            "float32": _cFMS_v_update_domains_float_4d,
-            "float64": _cFMS_v_update_domains_double_4d,
+            "float32": CallPlan(_cFMS_v_update_domains_float_4d),
+            "float64": CallPlan(_cFMS_v_update_domains_double_4d),
         },
         5: {
-            "float32": _cFMS_v_update_domains_float_5d,
-            "float64": _cFMS_v_update_domains_double_5d,
+            "float32": CallPlan(_cFMS_v_update_domains_float_5d),
+            "float64": CallPlan(_cFMS_v_update_domains_double_5d),
         },
     }
 
+    _halo_plans.clear()
+    _redistributions.clear()
+
 
 def _init(libpath: str, lib: Any):
 
@@ -825,10 +1809,15 @@ def _init(libpath: str, lib: Any):
     to be used internally by the cfms module
     """
 
-    global _libpath, _lib
+    global _libpath, _lib, _ndomains_defined
 
     _libpath = libpath
     _lib = lib
 
     _init_constants()
     _init_functions()
+    _tuned_layouts.clear()
+    _ndomains_defined = 0
+
+
+cfms._bind(__name__, _init)
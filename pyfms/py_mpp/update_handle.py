@@ -0,0 +1,52 @@
+from typing import Callable
+
+
+class UpdateHandle:
+    """
+    Halo update in flight.  pyfms.mpp_domains.start_update_domains
+    and pyfms.mpp_domains.start_vector_update_domains return an
+    instance of UpdateHandle.  The halos of the fields are valid once
+    complete has been called.  Used as a context manager, the update
+    is completed when the with block exits:
+
+        with mpp_domains.start_update_domains(field, domain):
+            compute the interior of field
+        compute near the halos of field
+    """
+
+    def __init__(self, complete: Callable, domain: object, fields: list):
+        self.domain = domain  # Domain of the fields
+        self.fields = fields  # fields being updated
+        self._complete = complete
+
+    @property
+    def completed(self) -> bool:
+        return self._complete is None
+
+    def complete(self):
+
+        """
+        Waits for the halo update to complete.
+        Calling complete again has no effect
+        """
+
+        if self._complete is not None:
+            complete, self._complete = self._complete, None
+            complete()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.complete()
+        return False
+
+    def __repr__(self):
+
+        repr_str = f"""
+            domain_id: {self.domain.domain_id}
+            nfields: {len(self.fields)}
+            completed: {self.completed}
+        """
+
+        return repr_str
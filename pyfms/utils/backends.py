@@ -0,0 +1,270 @@
+import ctypes
+
+import numpy as np
+
+
+# binding backends accepted by cfms.init
+backends = ["ctypes", "cffi"]
+
+_scalars = {
+    ctypes.c_int: "int",
+    ctypes.c_bool: "bool",
+    ctypes.c_float: "float",
+    ctypes.c_double: "double",
+}
+
+_arrays = {
+    np.dtype(np.int32): "int",
+    np.dtype(bool): "bool",
+    np.dtype(np.float32): "float",
+    np.dtype(np.float64): "double",
+}
+
+
+def load(libpath: str, backend: str = "ctypes"):
+
+    """
+    Loads the cFMS library at libpath with the binding backend.
+    The ctypes backend returns a ctypes.CDLL object.  The cffi
+    backend returns a CffiLibrary which binds the same restype
+    and argtypes through cffi in ABI mode
+    """
+
+    if backend == "ctypes":
+        return ctypes.cdll.LoadLibrary(libpath)
+    if backend == "cffi":
+        return CffiLibrary(libpath)
+    raise RuntimeError(f"backend must be one of {backends}, not {backend}")
+
+
+def get_ndpointer(argtype):
+
+    """
+    Returns the numpy ndpointer class describing an array
+    argtype, or None if argtype does not describe an array
+    """
+
+    for ndpointer in [
+        argtype,
+        getattr(argtype, "ndpointer", None),
+        getattr(argtype, "thispointer", None),
+    ]:
+        if getattr(ndpointer, "_dtype_", None) is not None:
+            return ndpointer
+    return None
+
+
+def c_type(argtype) -> str:
+
+    """
+    Returns the C declaration of a ctypes restype or argtype
+    """
+
+    if argtype is None:
+        return "void"
+    if argtype is ctypes.c_char_p:
+        return "char *"
+    if argtype in _scalars:
+        return _scalars[argtype]
+    if getattr(argtype, "_type_", None) in _scalars:
+        return _scalars[argtype._type_] + " *"
+    ndpointer = get_ndpointer(argtype)
+    if ndpointer is not None:
+        return _arrays[np.dtype(ndpointer._dtype_)] + " *"
+    return "void *"
+
+
+def _address(arg) -> int:
+
+    """
+    Returns the address of the memory held by a ctypes object
+    """
+
+    if isinstance(arg, ctypes.c_char_p):
+        return ctypes.cast(arg, ctypes.c_void_p).value
+    return ctypes.addressof(arg)
+
+
+class CffiLibrary:
+
+    """
+    cFMS library bound with cffi in ABI mode.  Attributes are
+    CffiFunctions that accept the restype and argtypes set by the
+    pyfms define functions, so the same definitions drive both
+    backends.  Constants are read through ctypes
+    """
+
+    def __init__(self, libpath: str):
+
+        try:
+            import cffi
+        except ImportError:
+            raise RuntimeError("the cffi backend requires the cffi package")
+
+        self._cdll = ctypes.CDLL(libpath)
+        self._handle = self._cdll._handle
+        self._ffi = cffi.FFI()
+        self._lib = self._ffi.dlopen(libpath)
+        self._functions = {}
+
+    def __getattr__(self, name: str):
+
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        function = self._functions.get(name)
+        if function is None:
+            # raises AttributeError if the symbol does not exist
+            getattr(self._cdll, name)
+            function = self._functions[name] = CffiFunction(self, name)
+        return function
+
+
+class CffiFunction:
+
+    """
+    cFMS function bound with cffi.  The function is declared to
+    cffi from restype and argtypes on the first call.  Arguments
+    are passed as the ctypes backend accepts them: numpy arrays
+    (checked against the ndpointer argtypes), ctypes scalars and
+    strings created by the set_c_* functions, or None
+    """
+
+    def __init__(self, library: CffiLibrary, name: str):
+        self.__name__ = name
+        self._library = library
+        self._argtypes = []
+        self._restype = ctypes.c_int
+        self._call = None
+        self._converters = []
+
+    @property
+    def argtypes(self):
+        return self._argtypes
+
+    @argtypes.setter
+    def argtypes(self, argtypes):
+        self._argtypes = argtypes
+        self._call = None
+
+    @property
+    def restype(self):
+        return self._restype
+
+    @restype.setter
+    def restype(self, restype):
+        self._restype = restype
+        self._call = None
+
+    def __call__(self, *args):
+        return (self._call or self._declare())(*args)
+
+    def convert(self, arg, index: int):
+
+        """
+        Returns arg converted to the cffi argument at index.
+        Converted arguments are passed to the function unchanged,
+        which lets CallPlans convert the objects they hold once
+        """
+
+        if self._call is None:
+            self._declare()
+        return self._converters[index](arg)
+
+    def _declare(self):
+
+        """
+        Declares the function to cffi and returns the
+        function converting and passing the arguments
+        """
+
+        name = self.__name__
+        ffi = self._library._ffi
+        argtypes = self._argtypes or []
+
+        ctypes_ = [c_type(argtype) for argtype in argtypes]
+        ffi.cdef(
+            f"{c_type(self._restype)} {name}({', '.join(ctypes_) or 'void'});",
+            override=True,
+        )
+        cfunction = getattr(self._library._lib, name)
+
+        converters = [
+            _converter(ffi, argtype, ctype, name, i)
+            for i, (argtype, ctype) in enumerate(zip(argtypes, ctypes_))
+        ]
+        nargs = len(converters)
+        self._converters = converters
+
+        def call(*args):
+            if len(args) != nargs:
+                raise TypeError(
+                    f"{name}: {nargs} arguments required, {len(args)} given"
+                )
+            return cfunction(*[convert(arg) for convert, arg in zip(converters, args)])
+
+        self._call = call
+        return call
+
+
+def _converter(ffi, argtype, ctype: str, name: str, index: int):
+
+    """
+    Returns the function converting an argument
+    of argtype to the cffi argument of ctype
+    """
+
+    NULL = ffi.NULL
+    addressof = ctypes.addressof
+    CData = ffi.CData
+    cast = ffi.cast
+    ndpointer = get_ndpointer(argtype)
+
+    if ndpointer is not None:
+
+        from_buffer = ffi.from_buffer
+        buffertype = ctype[:-1] + "[]"
+        dtype = np.dtype(ndpointer._dtype_)
+        ndim = ndpointer._ndim_
+        shape = ndpointer._shape_
+
+        def convert(arg):
+            if arg is None:
+                return NULL
+            if isinstance(arg, CData):
+                return arg
+            if (
+                not isinstance(arg, np.ndarray)
+                or arg.dtype != dtype
+                or not arg.flags.c_contiguous
+                or (ndim is not None and arg.ndim != ndim)
+                or (shape is not None and arg.shape != shape)
+            ):
+                raise TypeError(
+                    f"{name}: argument {index + 1} must be a C contiguous "
+                    f"{dtype.name} array"
+                )
+            return from_buffer(buffertype, arg)
+
+    elif ctype == "char *":
+
+        def convert(arg):
+            if arg is None or type(arg) is bytes or isinstance(arg, CData):
+                return NULL if arg is None else arg
+            return cast(ctype, _address(arg))
+
+    elif ctype.endswith("*"):
+
+        def convert(arg):
+            if arg is None:
+                return NULL
+            if isinstance(arg, CData):
+                return arg
+            return cast(ctype, addressof(arg))
+
+    else:
+
+        def convert(arg):
+            return getattr(arg, "value", arg)
+
+    return convert
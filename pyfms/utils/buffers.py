@@ -0,0 +1,180 @@
+import sys
+from collections import OrderedDict
+
+import numpy as np
+import numpy.typing as npt
+
+
+_pool = None
+
+
+def _refcount(buffers: list, i: int) -> int:
+    return sys.getrefcount(buffers[i])
+
+
+# reference count of a pooled buffer that is not held by the caller
+_FREE = _refcount([np.empty(0)], 0)
+
+
+class BufferPool:
+
+    """
+    Pool of C contiguous numpy arrays keyed by shape and dtype.
+    A buffer handed out by get is reused once the caller no longer
+    holds a reference to it or to any view of it.  The pool holds at
+    most maxbytes; the least recently used free buffers are evicted
+    when the bound is exceeded
+    """
+
+    def __init__(self, maxbytes: int = 256 * 1024**2):
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._buffers: OrderedDict = OrderedDict()
+
+    def get(self, shape: tuple, dtype: npt.DTypeLike) -> npt.NDArray:
+
+        """
+        Returns a free buffer of shape and dtype filled with zeros,
+        as the arrays allocated by the wrappers without the pool
+        """
+
+        key = (tuple(shape), np.dtype(dtype).str)
+        buffers = self._buffers.get(key)
+
+        if buffers is not None:
+            self._buffers.move_to_end(key)
+            for i in range(len(buffers)):
+                if _refcount(buffers, i) <= _FREE:
+                    self.hits += 1
+                    buffers[i].fill(0)
+                    return buffers[i]
+
+        self.misses += 1
+        buffer = np.zeros(key[0], dtype=dtype)
+
+        self._evict(self.maxbytes - buffer.nbytes)
+        if self.nbytes + buffer.nbytes <= self.maxbytes:
+            self._buffers.setdefault(key, []).append(buffer)
+            self._buffers.move_to_end(key)
+            self.nbytes += buffer.nbytes
+
+        return buffer
+
+    def clear(self):
+
+        """
+        Removes all buffers from the pool
+        """
+
+        self._buffers.clear()
+        self.nbytes = 0
+
+    def _evict(self, maxbytes: int):
+
+        """
+        Removes free buffers, least recently used first,
+        until the pool holds at most maxbytes
+        """
+
+        for key in list(self._buffers):
+            if self.nbytes <= maxbytes:
+                return
+            buffers = self._buffers[key]
+            for i in reversed(range(len(buffers))):
+                if self.nbytes <= maxbytes:
+                    break
+                if _refcount(buffers, i) <= _FREE:
+                    self.nbytes -= buffers.pop(i).nbytes
+                    self.evictions += 1
+            if not buffers:
+                del self._buffers[key]
+
+
+def empty_aligned(
+    shape: tuple,
+    dtype: npt.DTypeLike = np.float64,
+    order: str = "C",
+    alignment: int = 64,
+) -> npt.NDArray:
+
+    """
+    Returns an uninitialized array of shape, dtype and order
+    whose data starts at a multiple of alignment bytes
+    """
+
+    dtype = np.dtype(dtype)
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+
+    raw = np.empty(nbytes + alignment, dtype=np.uint8)
+    offset = -raw.ctypes.data % alignment
+    return raw[offset : offset + nbytes].view(dtype).reshape(shape, order=order)
+
+
+def enable_pool(maxbytes: int = 256 * 1024**2) -> BufferPool:
+
+    """
+    Enables the buffer pool used by the pyfms wrappers
+    to allocate results when no out array is provided.
+    Returns the pool
+    """
+
+    global _pool
+
+    _pool = BufferPool(maxbytes)
+    return _pool
+
+
+def disable_pool():
+
+    """
+    Disables the buffer pool.  Wrappers allocate a
+    new array for every result
+    """
+
+    global _pool
+
+    _pool = None
+
+
+def get_pool() -> BufferPool:
+
+    """
+    Returns the buffer pool, or None if the pool is disabled
+    """
+
+    return _pool
+
+
+def get_buffer(
+    shape: tuple,
+    dtype: npt.DTypeLike,
+    out: npt.NDArray = None,
+    whoami: str = None,
+) -> npt.NDArray:
+
+    """
+    Returns the array a wrapper writes its result into:
+    out if it is provided, or an array of zeros, taken from
+    the pool if the pool is enabled.  out must be
+    C contiguous with the given shape and dtype
+    """
+
+    if out is not None:
+        if (
+            out.shape != tuple(shape)
+            or out.dtype != np.dtype(dtype)
+            or not out.flags.c_contiguous
+        ):
+            raise RuntimeError(
+                f"{whoami}: out must be a contiguous array of shape "
+                f"{tuple(shape)} and dtype {np.dtype(dtype).name}"
+            )
+        return out
+
+    if _pool is not None:
+        return _pool.get(shape, dtype)
+
+    return np.zeros(shape, dtype=dtype)
@@ -1,5 +1,6 @@
 from typing import Any
 
+from pyfms import cfms
 from pyfms.utils.ctypes_utils import get_constant_double
 
 
@@ -135,3 +136,6 @@ def _init(libpath: str, lib: Any):
     _libpath = libpath
 
     _init_constants()
+
+
+cfms._bind(__name__, _init)
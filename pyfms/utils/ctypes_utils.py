@@ -1,3 +1,4 @@
+import sys
 from ctypes import CDLL, POINTER, c_bool, c_char_p, c_double, c_float, c_int
 from typing import Union
 
@@ -9,6 +10,9 @@ ctypelist = Union[type(c_int), type(c_float), type(c_double), type(c_bool)]
 
 nptypelist = Union[np.int32, np.int64, np.float32, np.float64, bool]
 
+# number of arrays copied to C order and total bytes copied, keyed by caller
+_array_copies: dict = {}
+
 
 def setNone(arglist) -> None:
     arglist.append(None)
@@ -77,18 +81,135 @@ def set_c_str(arg: str | None, arglist: list) -> type(c_char_p) | None:
     return arg_c
 
 
-def set_array(arg: npt.ArrayLike | None, arglist: list) -> npt.ArrayLike | None:
+def set_array(
+    arg: npt.ArrayLike | None,
+    arglist: list,
+    copyback: list = None,
+    whoami: str = None,
+) -> npt.ArrayLike | None:
+
+    """
+    Appends arg to arglist.  Arrays that are not C contiguous are copied
+    to a C contiguous array and the copy is counted under whoami
+    (the calling function by default).  If copyback is provided,
+    the (arg, copy) pair is appended so that values set by cFMS can be
+    copied back into arg with copy_back(copyback) after the call
+    """
 
     if arg is None:
         return setNone(arglist)
 
     if not arg.flags["C"]:
-        arglist.append(np.ascontiguousarray(arg))
+        arg_c = np.ascontiguousarray(arg)
+        count_copy(arg_c.nbytes, whoami or _caller())
+        if copyback is not None:
+            copyback.append((arg, arg_c))
+        arglist.append(arg_c)
     else:
         arglist.append(arg)
     return arg
 
 
+def set_cf_arrays(
+    arrays: list,
+    convert_cf_order: bool,
+    copyback: list = None,
+    whoami: str = None,
+) -> tuple[list, bool]:
+
+    """
+    Returns the arrays in arrays laid out as cFMS expects and the
+    convert_cf_order flag to pass to cFMS.
+
+    If every array is Fortran contiguous and at least one is not also C
+    contiguous, the transposed (C contiguous) views are returned with the
+    convert_cf_order flag inverted so that cFMS reads the buffers in place.
+    Otherwise, arrays that are not C contiguous are copied as in set_array;
+    the copies are counted and, if copyback is provided, recorded to be
+    copied back into the original arrays with copy_back.  None entries are
+    returned as None
+    """
+
+    given = [array for array in arrays if array is not None]
+
+    if all(array.flags["F"] for array in given) and not all(
+        array.flags["C"] for array in given
+    ):
+        return [
+            None if array is None else array.T for array in arrays
+        ], not convert_cf_order
+
+    carrays = []
+    for array in arrays:
+        if array is None or array.flags["C"]:
+            carrays.append(array)
+            continue
+        array_c = np.ascontiguousarray(array)
+        count_copy(array_c.nbytes, whoami or _caller())
+        if copyback is not None:
+            copyback.append((array, array_c))
+        carrays.append(array_c)
+
+    return carrays, convert_cf_order
+
+
+def copy_back(copyback: list):
+
+    """
+    Copies data from the C contiguous copies made by set_array
+    or set_cf_arrays back into the original arrays
+    """
+
+    for array, array_c in copyback:
+        array[...] = array_c
+
+
+def count_copy(nbytes: int, whoami: str):
+
+    """
+    Records a copy of nbytes made for whoami
+    """
+
+    counts = _array_copies.setdefault(whoami, [0, 0])
+    counts[0] += 1
+    counts[1] += nbytes
+
+
+def get_array_copies() -> dict:
+
+    """
+    Returns a dictionary of the number of arrays and the number
+    of bytes copied to C order since the last reset, keyed by
+    the pyfms function that made the copy
+    """
+
+    return {
+        whoami: dict(copies=counts[0], nbytes=counts[1])
+        for whoami, counts in _array_copies.items()
+    }
+
+
+def reset_array_copies():
+
+    """
+    Resets the array copy counts
+    """
+
+    _array_copies.clear()
+
+
+def _caller(depth: int = 2) -> str:
+
+    """
+    Returns module.function of the pyfms function that
+    called the function calling _caller
+    """
+
+    frame = sys._getframe(depth)
+    module = frame.f_globals.get("__name__", "").rsplit(".", 1)[-1]
+    return f"{module}.{frame.f_code.co_name}"
+
+
 def get_constant_int(lib: type[CDLL], constant: str) -> int:
     return int(c_int.in_dll(lib, constant).value)
 
@@ -177,3 +298,144 @@ class NDPOINTER:
         if obj is None:
             return POINTER(self.ctypes).from_param(obj)
         return self.ndpointer.from_param(obj)
+
+
+# ctypes scalar type to allocate for each pointer argtype
+_box_dict = {
+    POINTER(c_int): c_int,
+    POINTER(c_bool): c_bool,
+    POINTER(c_float): c_float,
+    POINTER(c_double): c_double,
+}
+
+
+def _get_nptype(argtype) -> np.dtype | None:
+
+    """
+    Returns the numpy dtype expected by an array argtype
+    or None if argtype does not describe an array
+    """
+
+    for ndpointer in [
+        argtype,
+        getattr(argtype, "ndpointer", None),
+        getattr(argtype, "thispointer", None),
+    ]:
+        nptype = getattr(ndpointer, "_dtype_", None)
+        if nptype is not None:
+            return nptype
+    return None
+
+
+class CallPlan:
+
+    """
+    Binds a cFMS function once and holds reusable ctypes objects
+    for all scalar pointer arguments.  Calling the plan with python
+    values sets the value of the held ctypes objects and calls the
+    function, instead of allocating a new arglist and new ctypes objects
+    on every call.
+
+    Arguments are given in the order of the function argtypes, which
+    must be set before the plan is created.
+    None is passed to cFMS as a NULL pointer, lists and tuples
+    are converted to numpy arrays of the expected dtype, and str are
+    converted to c_char_p.  Scalar outputs set by cFMS can be retrieved
+    with CallPlan.value(index) after the call.
+
+    A CallPlan is not reentrant and must not be shared across threads.
+    Functions bound by backends other than ctypes provide convert(arg, index),
+    which is used to convert the held objects once, at creation.
+    """
+
+    _max_cached_shapes = 64
+
+    def __init__(self, function):
+        if function.argtypes is None:
+            raise RuntimeError(
+                f"CallPlan: the argtypes of {getattr(function, '__name__', function)}"
+                " are not set, bind the function before creating a plan"
+            )
+        self.function = function
+        self.argtypes = list(function.argtypes)
+        self.boxes = [
+            _box_dict[argtype]() if argtype in _box_dict else None
+            for argtype in self.argtypes
+        ]
+        self.nptypes = [_get_nptype(argtype) for argtype in self.argtypes]
+        self.arglist = [None] * len(self.argtypes)
+        self._tuples = {}
+        self._convert = getattr(function, "convert", None)
+        self.params = [
+            self._convert(box, i) if box is not None and self._convert else box
+            for i, box in enumerate(self.boxes)
+        ]
+
+    def __call__(self, *args):
+
+        arglist = self.arglist
+        boxes = self.boxes
+        params = self.params
+
+        if len(args) != len(arglist):
+            raise TypeError(
+                f"CallPlan: {len(arglist)} arguments required, {len(args)} given"
+            )
+
+        for i, arg in enumerate(args):
+            box = boxes[i]
+            if arg is None:
+                arglist[i] = None
+            elif box is not None:
+                box.value = arg
+                arglist[i] = params[i]
+            elif self.nptypes[i] is not None:
+                arglist[i] = self._array(arg, i)
+            elif isinstance(arg, str):
+                arglist[i] = c_char_p(arg.encode("utf-8"))
+            else:
+                arglist[i] = arg
+
+        return self.function(*arglist)
+
+    def _array(self, arg, index: int) -> npt.NDArray:
+
+        """
+        Returns arg as a C contiguous array of the type expected
+        by argument index.  Arrays made from tuples, such as field
+        shapes, are cached and reused
+        """
+
+        nptype = self.nptypes[index]
+
+        if isinstance(arg, np.ndarray):
+            if arg.flags["C"]:
+                return arg
+            arg_c = np.ascontiguousarray(arg)
+            count_copy(arg_c.nbytes, _caller(3))
+            return arg_c
+
+        if isinstance(arg, tuple):
+            key = (arg, nptype)
+            try:
+                return self._tuples[key]
+            except KeyError:
+                if len(self._tuples) >= self._max_cached_shapes:
+                    self._tuples.clear()
+                array = np.array(arg, dtype=nptype)
+                array.flags.writeable = False
+                if self._convert is not None:
+                    array = self._convert(array, index)
+                self._tuples[key] = array
+                return array
+
+        return np.array(arg, dtype=nptype)
+
+    def value(self, index: int):
+
+        """
+        Returns the value of the scalar argument at index
+        as set by cFMS during the last call
+        """
+
+        return self.boxes[index].value
@@ -3,7 +3,9 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 
+from pyfms import cfms
 from pyfms.utils import _grid_utils_functions
+from pyfms.utils.buffers import get_buffer
 from pyfms.utils.ctypes_utils import set_array, set_c_int
 
 
@@ -17,11 +19,14 @@ def get_grid_area(
     lon: npt.NDArray[np.float64],
     lat: npt.NDArray[np.float64],
     convert_cf_order: bool = True,
+    out: npt.NDArray[np.float64] = None,
 ) -> npt.NDArray[np.float64]:
 
     """
     Returns the cell areas of grids defined
-    on lon and lat
+    on lon and lat.  The areas are written
+    to out if provided.  out must have the shape
+    and memory order of the returned array
     """
 
     if convert_cf_order:
@@ -40,7 +45,11 @@ def get_grid_area(
     else:
         set_array(lon, arglist)
         set_array(lat, arglist)
-    area = set_array(np.zeros((nlat, nlon), dtype=np.float64), arglist)
+    if out is not None and convert_cf_order:
+        out = out.T
+    area = set_array(
+        get_buffer((nlat, nlon), np.float64, out, "grid_utils.get_grid_area"), arglist
+    )
 
     _cFMS_get_grid_area(*arglist)
 
@@ -72,3 +81,6 @@ def _init(libpath: str, lib: Any):
     _lib = lib
 
     _init_functions()
+
+
+cfms._bind(__name__, _init)
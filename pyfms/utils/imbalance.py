@@ -0,0 +1,355 @@
+import inspect
+import os
+import sys
+from functools import wraps
+from time import perf_counter
+
+import numpy as np
+
+
+# collectives whose wait is measured with a barrier before the call
+_collectives = {
+    "pyfms.py_mpp.mpp": [
+        "broadcast",
+        "gather",
+        "gather_to_file",
+        "gatherv",
+        "max",
+        "min",
+        "scatter",
+        "sum",
+    ],
+    "pyfms.py_mpp.mpp_domains": [
+        "complete_update_domains",
+        "do_group_update",
+        "global_max",
+        "global_min",
+        "global_sum",
+        "update_domains",
+        "vector_update_domains",
+    ],
+}
+
+# arguments giving the domain of the domain collectives, a Domain,
+# a domain id, or an object holding the Domain, whose wait is measured
+# on the pelist of the domain
+_domain_arguments = {
+    "complete_update_domains": "handle",
+    "do_group_update": "group",
+    "update_domains": "domain_id",
+    "vector_update_domains": "domain_id",
+}
+
+# calls synchronizing the PEs, whose time is all wait
+_syncs = {
+    "pyfms.py_mpp.mpp": ["declare_pelist", "set_current_pelist"],
+}
+
+# statistics recorded for each call site
+_CALLS, _WAIT, _COMM = range(3)
+_NSTATS = 3
+
+_enabled = False
+_depth = 0
+_step = 0
+_step_start = 0.0
+_stats: dict = {}
+_step_stats: dict = {}
+_restore: list = []
+
+
+def enable():
+
+    """
+    Starts recording, on each PE and for each call site, the
+    time spent in the pyfms collectives and the time spent waiting
+    for the other PEs before them.  The wait is measured with an
+    MPI barrier on the PEs of the collective, the PEs of the domain
+    for halo updates, before the call, and
+    the time of calls synchronizing the PEs, set_current_pelist
+    without no_sync and declare_pelist, is counted as wait.
+    When disabled, no wrappers are installed
+    """
+
+    global _enabled
+
+    import pyfms.py_mpp.mpp  # noqa: F401
+    import pyfms.py_mpp.mpp_domains  # noqa: F401
+
+    _unwrap()
+    _enabled = True
+
+    for modname, names in _collectives.items():
+        for name in names:
+            _wrap(sys.modules[modname], name, sync=False)
+    for modname, names in _syncs.items():
+        for name in names:
+            _wrap(sys.modules[modname], name, sync=True)
+
+    reset()
+
+
+def disable():
+
+    """
+    Stops recording and restores the pyfms collectives.
+    Recorded statistics are kept until reset() is called
+    """
+
+    global _enabled
+
+    _unwrap()
+    _enabled = False
+
+
+def is_enabled() -> bool:
+
+    """
+    Returns True if recording is enabled
+    """
+
+    return _enabled
+
+
+def reset():
+
+    """
+    Resets the recorded statistics and starts a new step
+    """
+
+    global _step, _step_start
+
+    _stats.clear()
+    _step_stats.clear()
+    _step = 0
+    _step_start = perf_counter()
+
+
+def get_stats() -> dict:
+
+    """
+    Returns the number of calls and the cumulative wait and
+    collective times recorded on the calling PE, keyed by
+    (function, call site)
+    """
+
+    return {
+        key: dict(calls=int(record[_CALLS]), wait=record[_WAIT], comm=record[_COMM])
+        for key, record in sorted(_stats.items())
+    }
+
+
+def step() -> str | None:
+
+    """
+    Ends the current step.  The step time and the wait and
+    collective times of each call site recorded during the step
+    on all PEs in the current pelist are gathered to the root PE,
+    which returns the imbalance summary of the step.  Returns None
+    on all other PEs.  This function must be called by all PEs
+    in the current pelist
+    """
+
+    global _step, _step_start
+
+    from pyfms.py_mpp import mpp
+
+    elapsed = perf_counter() - _step_start
+    local = (elapsed, dict(_step_stats))
+
+    comm, is_root_pe = mpp._get_comm()
+    gathered = comm.gather(local, root=0)
+
+    _step += 1
+    _step_stats.clear()
+    _step_start = perf_counter()
+
+    if not is_root_pe:
+        return None
+    return _summary(_step, gathered)
+
+
+def _summary(nstep: int, gathered: list) -> str:
+
+    """
+    Returns the imbalance summary of a step from the
+    (step time, per call site statistics) of every PE
+    """
+
+    npes = len(gathered)
+    elapsed = np.array([pe_elapsed for pe_elapsed, _ in gathered])
+    keys = sorted(set().union(*[pe_stats for _, pe_stats in gathered]))
+
+    stats = np.zeros((npes, len(keys), _NSTATS))
+    for ipe, (_, pe_stats) in enumerate(gathered):
+        for i, key in enumerate(keys):
+            if key in pe_stats:
+                stats[ipe, i] = pe_stats[key]
+
+    wait = stats[:, :, _WAIT].sum(axis=1)
+    comm = stats[:, :, _COMM].sum(axis=1)
+    compute = elapsed - wait - comm
+
+    # the slowest PE computes the longest and waits the least
+    slowest = int(np.argmax(compute))
+    imbalance = 0.0
+    if compute.max() > 0.0:
+        imbalance = (compute.max() - compute.mean()) / compute.max()
+
+    lines = [
+        f"pyfms imbalance: step {nstep}, {npes} PEs",
+        f"step time max {elapsed.max():.4e} s, slowest PE {slowest}, "
+        f"compute imbalance {imbalance * 100.0:.1f}%",
+        f"{'':<30s}{'min(s)':>12s}{'mean(s)':>12s}{'max(s)':>12s}{'max PE':>8s}",
+    ]
+    for name, values in [("compute", compute), ("wait", wait), ("collective", comm)]:
+        lines.append(
+            f"{name:<30s}{values.min():>12.4e}{values.mean():>12.4e}"
+            f"{values.max():>12.4e}{int(np.argmax(values)):>8d}"
+        )
+
+    lines.append(
+        f"{'function, call site':<50s}{'calls':>8s}{'wait min(s)':>12s}"
+        f"{'wait max(s)':>12s}{'comm max(s)':>12s}"
+    )
+    order = np.argsort(-stats[:, :, _WAIT].max(axis=0), kind="stable")
+    for i in order:
+        function, site = keys[i]
+        lines.append(
+            f"{function + ', ' + site:<50s}{int(stats[:, i, _CALLS].max()):>8d}"
+            f"{stats[:, i, _WAIT].min():>12.4e}{stats[:, i, _WAIT].max():>12.4e}"
+            f"{stats[:, i, _COMM].max():>12.4e}"
+        )
+
+    return "\n".join(lines)
+
+
+def _wrap(module, name: str, sync: bool):
+
+    """
+    Replaces the function name of module with a wrapper recording
+    the wait and collective times of the outermost call
+    """
+
+    function = getattr(module, name)
+    qualname = f"{module.__name__.split('.')[-1]}.{name}"
+    parameters = list(inspect.signature(function).parameters)
+    domain_argument = _domain_arguments.get(name)
+
+    def argument(args: tuple, kwargs: dict, argname: str):
+        if argname in kwargs:
+            return kwargs[argname]
+        if argname in parameters and parameters.index(argname) < len(args):
+            return args[parameters.index(argname)]
+        return None
+
+    @wraps(function)
+    def recorded(*args, **kwargs):
+
+        global _depth
+
+        if _depth > 0:
+            return function(*args, **kwargs)
+
+        frame = sys._getframe(1)
+        key = (
+            qualname,
+            f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno}",
+        )
+
+        if sync:
+            barrier = None
+        elif domain_argument is not None:
+            pelist = _domain_pelist(argument(args, kwargs, domain_argument))
+            barrier = None if pelist is None else _get_barrier(pelist)
+        else:
+            barrier = _get_barrier(argument(args, kwargs, "pelist"))
+
+        _depth += 1
+        try:
+            start = perf_counter()
+            if barrier is not None:
+                barrier()
+            ready = perf_counter()
+            result = function(*args, **kwargs)
+            end = perf_counter()
+        finally:
+            _depth -= 1
+
+        if sync and not argument(args, kwargs, "no_sync"):
+            wait, comm = end - start, 0.0
+        else:
+            wait, comm = ready - start, end - ready
+        _record(_stats, key, wait, comm)
+        _record(_step_stats, key, wait, comm)
+
+        return result
+
+    setattr(module, name, recorded)
+    _restore.append((module, name, function, recorded))
+
+
+def _record(stats: dict, key: tuple, wait: float, comm: float):
+    record = stats.get(key)
+    if record is None:
+        record = stats[key] = [0, 0.0, 0.0]
+    record[_CALLS] += 1
+    record[_WAIT] += wait
+    record[_COMM] += comm
+
+
+def _domain_pelist(domain) -> list | None:
+
+    """
+    Returns the pelist of domain, a Domain, a domain id, or an
+    object holding its Domain as a GroupUpdate or an UpdateHandle.
+    Returns None if the object holds no Domain
+    """
+
+    from pyfms.py_mpp import mpp_domains
+
+    if hasattr(domain, "domain"):
+        domain = domain.domain
+        if domain is None:
+            return None
+    return mpp_domains.get_domain_pelist(getattr(domain, "domain_id", domain))
+
+
+def _get_barrier(pelist: list = None):
+
+    """
+    Returns the barrier of the PEs of a collective over pelist,
+    or over the current pelist if pelist is None.  Returns None
+    if pelist is not the current pelist and has not been declared,
+    as declaring it would need the PEs outside of pelist, or on
+    the PEs outside of pelist
+    """
+
+    from pyfms.py_mpp import mpp
+
+    current = tuple(int(ipe) for ipe in mpp.get_current_pelist_array())
+    key = current if pelist is None else tuple(int(ipe) for ipe in pelist)
+
+    if len(key) == 1:
+        return None
+    if (
+        key != current
+        and key not in mpp._pelist_comms
+        and key not in mpp._declared_pelists
+    ):
+        return None
+    comm, _ = mpp._get_comm(list(key))
+    return None if comm is None else comm.Barrier
+
+
+def _unwrap():
+
+    """
+    Restores the wrapped functions unless they
+    have been replaced since they were wrapped
+    """
+
+    for module, name, original, wrapper in reversed(_restore):
+        if getattr(module, name) is wrapper:
+            setattr(module, name, original)
+    _restore.clear()
@@ -0,0 +1,274 @@
+import ctypes
+import sys
+from time import perf_counter
+
+import numpy as np
+
+from pyfms.utils.backends import CffiFunction
+from pyfms.utils.ctypes_utils import CallPlan
+
+
+# wrapper modules holding the bound cFMS functions
+_modules = [
+    "pyfms.utils.grid_utils",
+    "pyfms.py_data_override.data_override",
+    "pyfms.py_fms.fms",
+    "pyfms.py_diag_manager.diag_manager",
+    "pyfms.py_horiz_interp.horiz_interp",
+    "pyfms.py_mpp.mpp",
+    "pyfms.py_mpp.mpp_domains",
+]
+
+# statistics recorded for each cFMS symbol
+_CALLS, _TOTAL, _MAX, _NBYTES = range(4)
+_NSTATS = 4
+
+_enabled = False
+_report_at_end = True
+_stats: dict = {}
+_restore: list = []
+
+
+class _ProfiledFunction:
+
+    """
+    Wraps a bound cFMS function to record the number of calls,
+    the cumulative and maximum wall time spent in the call, and
+    the number of bytes of numpy array arguments marshalled
+    """
+
+    def __init__(self, function, record: list):
+        self.function = function
+        self.record = record
+        self.argtypes = function.argtypes
+        self.restype = function.restype
+        self.__name__ = function.__name__
+
+    def __call__(self, *args):
+
+        start = perf_counter()
+        result = self.function(*args)
+        elapsed = perf_counter() - start
+
+        record = self.record
+        record[_CALLS] += 1
+        record[_TOTAL] += elapsed
+        if elapsed > record[_MAX]:
+            record[_MAX] = elapsed
+        for arg in args:
+            if isinstance(arg, np.ndarray):
+                record[_NBYTES] += arg.nbytes
+
+        return result
+
+
+def enable(report_at_end: bool = True):
+
+    """
+    Starts profiling all cFMS functions bound in pyfms.
+    Every bound function is replaced by a wrapper recording
+    statistics on the calling PE.  Modules imported after
+    profiling is enabled are wrapped when they are bound.
+    If report_at_end is True, the merged report is printed
+    on the root PE in fms.end().
+    When profiling is disabled, no wrappers are installed and
+    profiling adds no overhead
+    """
+
+    global _enabled, _report_at_end
+
+    _unwrap()
+
+    _enabled = True
+    _report_at_end = report_at_end
+
+    for name in _modules:
+        module = sys.modules.get(name)
+        if module is not None:
+            _wrap_namespace(module.__dict__, nested=False)
+
+
+def disable():
+
+    """
+    Stops profiling and restores the bound cFMS functions.
+    Recorded statistics are kept until reset() is called
+    """
+
+    global _enabled
+
+    _unwrap()
+    _enabled = False
+
+
+def is_enabled() -> bool:
+
+    """
+    Returns True if profiling is enabled
+    """
+
+    return _enabled
+
+
+def reset():
+
+    """
+    Resets the recorded statistics to zero
+    """
+
+    for record in _stats.values():
+        record[:] = [0] * _NSTATS
+
+
+def get_stats() -> dict:
+
+    """
+    Returns the statistics recorded on the calling PE
+    for each cFMS function that has been called
+    """
+
+    return {
+        name: dict(
+            calls=int(record[_CALLS]),
+            total=record[_TOTAL],
+            max=record[_MAX],
+            nbytes=int(record[_NBYTES]),
+        )
+        for name, record in sorted(_stats.items())
+        if record[_CALLS] > 0
+    }
+
+
+def report() -> str | None:
+
+    """
+    Gathers the statistics of all PEs in the current pelist
+    to the root PE and returns a formatted report on the root PE.
+    Returns None on all other PEs.  This function must be
+    called by all PEs in the current pelist
+    """
+
+    from pyfms.py_mpp import mpp
+
+    # PEs may have bound and called different functions,
+    # so the names are gathered with the statistics
+    comm, is_root_pe = mpp._get_comm()
+    gathered = comm.gather(dict(_stats), root=0)
+
+    if not is_root_pe:
+        return None
+
+    npes = len(gathered)
+    names = sorted(set().union(*gathered))
+
+    stats = np.zeros((npes, len(names), _NSTATS))
+    for ipe, pe_stats in enumerate(gathered):
+        for i, name in enumerate(names):
+            if name in pe_stats:
+                stats[ipe, i] = pe_stats[name]
+
+    calls = stats[:, :, _CALLS].sum(axis=0)
+    total = stats[:, :, _TOTAL].sum(axis=0)
+    tmin = stats[:, :, _TOTAL].min(axis=0)
+    tmax = stats[:, :, _TOTAL].max(axis=0)
+    cmax = stats[:, :, _MAX].max(axis=0)
+    nbytes = stats[:, :, _NBYTES].sum(axis=0)
+
+    lines = [
+        f"pyfms profile: {npes} PEs",
+        f"{'cFMS function':<40s}{'calls':>10s}{'total(s)':>12s}"
+        f"{'pe min(s)':>12s}{'pe max(s)':>12s}{'max call(s)':>12s}{'MB':>10s}",
+    ]
+    for i in np.argsort(-total, kind="stable"):
+        if calls[i] == 0:
+            continue
+        lines.append(
+            f"{names[i]:<40s}{int(calls[i]):>10d}{total[i]:>12.4e}"
+            f"{tmin[i]:>12.4e}{tmax[i]:>12.4e}{cmax[i]:>12.4e}"
+            f"{nbytes[i] / 1.0e6:>10.2f}"
+        )
+
+    return "\n".join(lines)
+
+
+def _end():
+
+    """
+    Prints the report on the root PE.  Called by fms.end
+    before FMS terminates
+    """
+
+    if _enabled and _report_at_end:
+        text = report()
+        if text is not None:
+            print(text)
+
+
+def _register(name: str):
+
+    """
+    Adds name to the statistics with no calls.  Used by
+    pyfms.mpp clocks so that the PEs creating a clock
+    report it whether or not they time a region
+    """
+
+    _stats.setdefault(name, [0] * _NSTATS)
+
+
+def _record(name: str, elapsed: float):
+
+    """
+    Records a call of elapsed seconds under name.  Used by
+    pyfms.mpp clocks to report python regions in the profile
+    """
+
+    record = _stats.setdefault(name, [0] * _NSTATS)
+    record[_CALLS] += 1
+    record[_TOTAL] += elapsed
+    if elapsed > record[_MAX]:
+        record[_MAX] = elapsed
+
+
+def _wrap(function):
+
+    """
+    Returns the profiled wrapper of function
+    """
+
+    name = function.__name__
+    record = _stats.setdefault(name, [0] * _NSTATS)
+    return _ProfiledFunction(function, record)
+
+
+def _wrap_namespace(namespace: dict, nested: bool = True):
+
+    """
+    Replaces the bound cFMS functions held in namespace,
+    including functions held by CallPlans and by the _cFMS
+    dispatch dictionaries, with profiled wrappers
+    """
+
+    for key, value in namespace.items():
+        if isinstance(value, (ctypes._CFuncPtr, CffiFunction)):
+            namespace[key] = _wrap(value)
+            _restore.append((namespace, key, value, namespace[key]))
+        elif isinstance(value, CallPlan):
+            if not isinstance(value.function, _ProfiledFunction):
+                original = value.function
+                value.function = _wrap(original)
+                _restore.append((value.__dict__, "function", original, value.function))
+        elif isinstance(value, dict) and (nested or key.startswith("_c")):
+            _wrap_namespace(value)
+
+
+def _unwrap():
+
+    """
+    Restores the wrapped functions unless they have been
+    rebound by cfms.init since they were wrapped
+    """
+
+    for namespace, key, original, wrapper in reversed(_restore):
+        if namespace.get(key) is wrapper:
+            namespace[key] = original
+    _restore.clear()
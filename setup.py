@@ -17,6 +17,7 @@ develop_requirements = test_requirements + ["pre-commit"]
 extras_requires = {
     "test": test_requirements,
     "develop": develop_requirements,
+    "cffi": ["cffi"],
 }
 
 requirements = [
@@ -0,0 +1,66 @@
+import json
+import os
+
+import pytest
+
+import pyfms
+
+
+@pytest.mark.create
+def test_create_input_nml():
+    inputnml = open("input.nml", "w")
+    inputnml.close()
+    assert os.path.isfile("input.nml")
+
+
+@pytest.mark.parallel
+def test_autotune_layout():
+
+    """
+    autotune_layout returns a layout of npes divisions, caches it
+    to disk and in memory for the grid, halos and fields it was
+    timed for, and returns the domain of the layout on request
+    """
+
+    nx = 16
+    ny = 16
+    npes = 4
+    halo = 2
+    cache = "autotune_layout.json"
+
+    pyfms.fms.init(ndomain=6)
+
+    global_indices = [0, (nx - 1), 0, (ny - 1)]
+    halos = dict(whalo=halo, ehalo=halo, shalo=halo, nhalo=halo)
+
+    layout = pyfms.mpp_domains.autotune_layout(
+        global_indices, nz=2, nfields=2, ncalls=2, cache=cache, **halos
+    )
+    assert layout[0] * layout[1] == npes
+
+    if pyfms.mpp.pe() == pyfms.mpp.root_pe():
+        with open(cache) as f:
+            assert list(json.load(f).values()) == [layout]
+
+    # the cached layout is reused without defining candidate domains
+    ndomains = pyfms.mpp_domains._ndomains_defined
+    tuned, domain = pyfms.mpp_domains.autotune_layout(
+        global_indices, nz=2, nfields=2, ncalls=2, get_domain=True, **halos
+    )
+    assert tuned == layout
+    assert pyfms.mpp_domains._ndomains_defined == ndomains + 1
+    assert pyfms.mpp_domains.get_layout(domain.domain_id) == layout
+
+    # layouts timed for other halos are not reused, and the
+    # candidates must fit in the domains left
+    with pytest.raises(RuntimeError):
+        pyfms.mpp_domains.autotune_layout(global_indices, nz=2, nfields=2, ncalls=2)
+
+    pyfms.fms.end()
+
+
+@pytest.mark.remove
+def test_remove_input_nml():
+    os.remove("input.nml")
+    os.remove("autotune_layout.json")
+    assert not os.path.isfile("input.nml")
@@ -0,0 +1,49 @@
+import numpy as np
+
+import pyfms
+
+
+def test_chksum():
+
+    pyfms.fms.init(ndomain=2)
+
+    nx, ny, nz, halo = 12, 8, 3, 2
+    global_indices = [0, nx - 1, 0, ny - 1]
+    npes = pyfms.mpp.npes()
+
+    # the checksum of the global field on each PE alone
+    for ipe in range(npes):
+        pyfms.mpp.declare_pelist([ipe])
+
+    # the checksum does not depend on the layout or on the halos
+    domains = [
+        pyfms.mpp_domains.define_domains(
+            global_indices,
+            layout,
+            whalo=halo,
+            ehalo=halo,
+            shalo=halo,
+            nhalo=halo,
+        )
+        for layout in [[npes, 1], [1, npes]]
+    ]
+
+    for dtype in [np.float64, np.float32, np.int32]:
+
+        global_data = (np.arange(nx * ny * nz) - 7).reshape(nx, ny, nz).astype(dtype)
+        answer = pyfms.mpp.chksum(global_data, pelist=[pyfms.mpp.pe()])
+
+        for domain in domains:
+            field = domain.zeros(nz, dtype=dtype)
+            field[...] = 99
+            field.compute[...] = global_data[
+                domain.isc : domain.iec + 1, domain.jsc : domain.jec + 1
+            ]
+
+            assert pyfms.mpp.chksum(field, domain=domain) == answer
+
+    # masked elements are excluded
+    data = np.array([pyfms.mpp.pe(), 99.0])
+    assert pyfms.mpp.chksum(data, mask_val=99.0) == pyfms.mpp.chksum(data[:1])
+
+    pyfms.fms.end()
@@ -0,0 +1,63 @@
+import numpy as np
+
+import pyfms
+
+
+def test_clock(capsys):
+
+    pyfms.fms.init()
+
+    mpp = pyfms.mpp
+    is_root_pe = mpp.pe() == mpp.root_pe()
+
+    clock = mpp.clock("test clock")
+    assert mpp.clock("test clock") is clock
+
+    root_clock = mpp.clock("test clock root")
+
+    @mpp.clock("test clock decorated")
+    def work(n):
+        return np.arange(n).sum()
+
+    pyfms.profile.enable(report_at_end=False)
+    pyfms.profile.reset()
+
+    for _ in range(3):
+        with clock:
+            assert work(10) == 45
+    assert clock.calls == 3
+    assert clock.total > 0
+
+    if is_root_pe:
+        with root_clock:
+            np.arange(10).sum()
+
+    stats = pyfms.profile.get_stats()
+    assert stats["clock test clock"]["calls"] == 3
+    assert stats["clock test clock decorated"]["calls"] == 3
+    assert stats["clock test clock"]["total"] >= stats["clock test clock"]["max"]
+
+    # a clock timed on the root PE only is reported
+    report = pyfms.profile.report()
+    if is_root_pe:
+        assert "clock test clock root" in report
+
+    pyfms.profile.disable()
+
+    # the clocks of all PEs are reported on the root PE
+    report = mpp.clock_report()
+    if is_root_pe:
+        # clock name, PEs, calls, tmin, tmax, tavg
+        rows = [line.rsplit(maxsplit=5) for line in report.split("\n")[2:]]
+        rows = {row[0]: row[1:3] for row in rows}
+        npes = mpp.npes()
+        assert rows["test clock"] == [str(npes), str(3 * npes)]
+        assert rows["test clock root"] == [str(npes), "1"]
+    else:
+        assert report is None
+
+    # and printed by fms.end whether or not profiling is enabled
+    capsys.readouterr()
+    pyfms.fms.end()
+    if is_root_pe:
+        assert "test clock decorated" in capsys.readouterr().out
@@ -0,0 +1,137 @@
+import numpy as np
+import pytest
+
+import pyfms
+
+
+def test_reductions():
+
+    pyfms.fms.init()
+
+    pe = pyfms.mpp.pe()
+    npes = pyfms.mpp.npes()
+    pes = np.arange(npes)
+
+    for dtype in [np.int32, np.float32, np.float64]:
+        array = np.array([[pe, 2 * pe], [-pe, 1]], dtype=dtype)
+        assert pyfms.mpp.sum(array) is array
+        assert np.array_equal(
+            array, np.array([[pes.sum(), 2 * pes.sum()], [-pes.sum(), npes]])
+        )
+
+        array = np.array([pe, -pe], dtype=dtype)
+        pyfms.mpp.max(array)
+        assert np.array_equal(array, [npes - 1, 0])
+        array = np.array([pe, -pe], dtype=dtype)
+        pyfms.mpp.min(array)
+        assert np.array_equal(array, [0, 1 - npes])
+
+    # non-contiguous arrays are reduced in place
+    array = np.zeros((4, 2))
+    array[::2] = pe
+    pyfms.mpp.sum(array[::2])
+    assert np.all(array[::2] == pes.sum())
+    assert np.all(array[1::2] == 0)
+
+    assert pyfms.mpp.sum(1.0) == npes
+    assert pyfms.mpp.max(pe) == npes - 1
+
+    # pelists are declared before their collectives,
+    # which return the array unchanged outside of the pelist
+    pelist = [0, 1]
+    with pytest.raises(RuntimeError):
+        pyfms.mpp.sum(1, pelist=pelist)
+    pyfms.mpp.declare_pelist(pelist, name="test collectives")
+    total = len(pelist) if pe in pelist else 1
+    assert pyfms.mpp.sum(1, pelist=pelist) == total
+    assert pyfms.mpp.isum(1, pelist=pelist).wait() == total
+
+    pyfms.fms.end()
+
+
+def test_broadcast():
+
+    pyfms.fms.init()
+
+    pe = pyfms.mpp.pe()
+    from_pe = pyfms.mpp.npes() - 1
+
+    array = np.full((3, 2), pe, dtype=np.float32)
+    assert pyfms.mpp.broadcast(array, from_pe=from_pe) is array
+    assert np.all(array == from_pe)
+
+    array = np.full(4, pe, dtype=np.int32)
+    pyfms.mpp.broadcast(array)
+    assert np.all(array == pyfms.mpp.root_pe())
+
+    pyfms.fms.end()
+
+
+def test_scatter():
+
+    pyfms.fms.init(ndomain=2)
+
+    nx, ny = 12, 24
+    global_indices = [0, nx - 1, 0, ny - 1]
+    layout = pyfms.mpp_domains.define_layout(global_indices, pyfms.mpp.npes())
+    domain = pyfms.mpp_domains.define_domains(global_indices, layout)
+
+    is_root_pe = pyfms.mpp.pe() == pyfms.mpp.root_pe()
+    global_data = np.array(
+        [[i * 100 + j for j in range(ny)] for i in range(nx)], dtype=np.float64
+    )
+    answer = global_data[domain.isc : domain.iec + 1, domain.jsc : domain.jec + 1]
+
+    for sbuf in [global_data, np.asfortranarray(global_data)]:
+        segment = pyfms.mpp.scatter(
+            sbuf if is_root_pe else None, domain, dtype=np.float64
+        )
+        assert np.array_equal(segment, answer)
+
+    out = np.zeros(answer.shape, dtype=np.float64)
+    pyfms.mpp.scatter(global_data if is_root_pe else None, domain, out=out)
+    assert np.array_equal(out, answer)
+
+    pyfms.fms.end()
+
+
+def test_nonblocking_collectives():
+
+    pyfms.fms.init()
+
+    pe = pyfms.mpp.pe()
+    npes = pyfms.mpp.npes()
+    is_root_pe = pe == pyfms.mpp.root_pe()
+
+    rbuf_size = 3 * npes if is_root_pe else None
+    gather = pyfms.mpp.igather(np.arange(3.0) + 10 * pe, rbuf_size=rbuf_size)
+    with pytest.raises(RuntimeError):
+        pyfms.mpp.igather(np.zeros((3, 2)), rbuf_size=rbuf_size)
+
+    rsize = [ipe + 1 for ipe in range(npes)] if is_root_pe else None
+    gatherv = pyfms.mpp.igatherv(np.full((pe + 1, 2), pe, dtype=np.int32), rsize=rsize)
+
+    array = np.array([pe, -pe], dtype=np.float64)
+    with pyfms.mpp.isum(array) as total:
+        pass
+    assert total.completed and total.result is array
+    assert np.array_equal(array, [sum(range(npes)), -sum(range(npes))])
+
+    assert pyfms.mpp.imax(pe).wait() == npes - 1
+    assert pyfms.mpp.imin(pe).wait() == 0
+
+    gathered = gather.wait()
+    gatheredv = gatherv.wait()
+    assert gather.test() and gatherv.test()
+
+    if is_root_pe:
+        answer = np.concatenate([np.arange(3.0) + 10 * ipe for ipe in range(npes)])
+        np.testing.assert_array_equal(gathered, answer)
+        answer = np.concatenate(
+            [np.full((ipe + 1, 2), ipe, dtype=np.int32) for ipe in range(npes)]
+        )
+        np.testing.assert_array_equal(gatheredv, answer)
+    else:
+        assert gathered is None and gatheredv is None
+
+    pyfms.fms.end()
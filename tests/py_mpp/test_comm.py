@@ -0,0 +1,28 @@
+import numpy as np
+from mpi4py import MPI
+
+import pyfms
+
+
+def test_get_comm():
+
+    pyfms.fms.init(localcomm=MPI.COMM_WORLD)
+
+    pe = pyfms.mpp.pe()
+    npes = pyfms.mpp.npes()
+
+    comm = pyfms.mpp.get_comm()
+    assert comm.Get_size() == npes
+    assert comm.allreduce(1) == npes
+
+    pelist = [0, 1]
+    commID = pyfms.mpp.declare_pelist(pelist, name="test comm")
+    if pe in pelist:
+        comm = pyfms.mpp.get_comm(commID)
+        assert comm.Get_size() == len(pelist)
+        assert comm.Get_rank() == pelist.index(pe)
+        array = np.full(3, pe, dtype=np.float64)
+        comm.Allreduce(MPI.IN_PLACE, array)
+        np.testing.assert_array_equal(array, sum(pelist))
+
+    pyfms.fms.end()
@@ -0,0 +1,169 @@
+import os
+
+import numpy as np
+import pytest
+
+import pyfms
+from pyfms.utils.ctypes_utils import get_array_copies, reset_array_copies
+
+
+@pytest.mark.create
+def test_create_input_nml():
+    inputnml = open("input.nml", "w")
+    inputnml.close()
+    assert os.path.isfile("input.nml")
+
+
+@pytest.mark.parallel
+def test_domain_arrays():
+
+    """
+    Domain.empty and Domain.zeros return aligned, Fortran ordered
+    data domain arrays whose halos are updated without a copy
+    """
+
+    nx = 8
+    ny = 8
+    npes = 4
+    halo = 2
+
+    pyfms.fms.init()
+
+    global_indices = [0, (nx - 1), 0, (ny - 1)]
+    layout = pyfms.mpp_domains.define_layout(global_indices=global_indices, ndivs=npes)
+
+    domain = pyfms.mpp_domains.define_domains(
+        global_indices=global_indices,
+        layout=layout,
+        whalo=halo,
+        ehalo=halo,
+        shalo=halo,
+        nhalo=halo,
+        symmetry=True,
+        xflags=pyfms.mpp_domains.CYCLIC_GLOBAL_DOMAIN,
+        yflags=pyfms.mpp_domains.CYCLIC_GLOBAL_DOMAIN,
+    )
+
+    field = domain.zeros(nz=3, dtype=np.float32)
+
+    assert isinstance(field, pyfms.DomainArray)
+    assert field.shape == (domain.xsize_d, domain.ysize_d, 3)
+    assert field.dtype == np.float32
+    assert field.flags["F"]
+    assert field.ctypes.data % 64 == 0
+    assert np.all(field == 0)
+
+    compute = field.compute
+    assert compute.shape == (domain.xsize_c, domain.ysize_c, 3)
+    assert np.shares_memory(compute, field)
+
+    halos = field.halo
+    assert halos["west"].shape == (halo, domain.ysize_d, 3)
+    assert halos["east"].shape == (halo, domain.ysize_d, 3)
+    assert halos["south"].shape == (domain.xsize_c, halo, 3)
+    assert halos["north"].shape == (domain.xsize_c, halo, 3)
+
+    compute[...] = pyfms.mpp.pe() + 1
+    assert field.sum() == compute.sum()
+
+    reset_array_copies()
+    pyfms.mpp_domains.update_domains(
+        field, domain.domain_id, whalo=halo, ehalo=halo, shalo=halo, nhalo=halo
+    )
+    assert get_array_copies() == {}
+    for view in field.halo.values():
+        assert np.all(view > 0)
+
+    for position in [
+        pyfms.mpp_domains.EAST,
+        pyfms.mpp_domains.NORTH,
+        pyfms.mpp_domains.CORNER,
+    ]:
+        data = pyfms.mpp_domains.get_data_domain(domain.domain_id, position=position)
+        compute = pyfms.mpp_domains.get_compute_domain(
+            domain.domain_id, position=position
+        )
+        field = domain.empty(position=position)
+        assert field.shape == (data["xsize_d"], data["ysize_d"])
+        assert field.compute.shape == (compute["xsize_c"], compute["ysize_c"])
+
+    with pytest.raises(RuntimeError):
+        field.T.compute
+
+    pyfms.fms.end()
+
+
+@pytest.mark.parallel
+def test_domain_bounds():
+
+    """
+    Domain caches the bounds of each position
+    and returns views of the compute domain
+    """
+
+    nx = 8
+    ny = 8
+    npes = 4
+    halo = 2
+
+    pyfms.fms.init()
+
+    global_indices = [0, (nx - 1), 0, (ny - 1)]
+    layout = pyfms.mpp_domains.define_layout(global_indices=global_indices, ndivs=npes)
+
+    domain = pyfms.mpp_domains.define_domains(
+        global_indices=global_indices,
+        layout=layout,
+        whalo=halo,
+        ehalo=halo,
+        shalo=halo,
+        nhalo=halo,
+        symmetry=True,
+    )
+
+    bounds = domain.bounds()
+    assert domain.bounds() is bounds
+    for key in ["isc", "iec", "jsc", "jec", "isd", "ied", "jsd", "jed", "ieg"]:
+        assert bounds[key] == getattr(domain, key)
+
+    for position in [
+        pyfms.mpp_domains.EAST,
+        pyfms.mpp_domains.NORTH,
+        pyfms.mpp_domains.CORNER,
+    ]:
+        bounds = domain.bounds(position)
+        assert domain.bounds(position) is bounds
+
+        answer = pyfms.mpp_domains.get_compute_domain(
+            domain.domain_id, position=position
+        )
+        answer.update(
+            pyfms.mpp_domains.get_data_domain(domain.domain_id, position=position)
+        )
+        for key in answer:
+            if key != "domain_id":
+                assert bounds[key] == answer[key]
+
+        ishift = bounds["ied"] - domain.ied
+        jshift = bounds["jed"] - domain.jed
+        assert bounds["ieg"] == nx - 1 + ishift
+        assert bounds["jeg"] == ny - 1 + jshift
+
+        field = np.zeros((bounds["xsize_d"], bounds["ysize_d"], 2), order="F")
+        compute = domain.compute_view(field, position)
+        assert compute.shape == (bounds["xsize_c"], bounds["ysize_c"], 2)
+        assert np.shares_memory(compute, field)
+
+    with pytest.raises(RuntimeError):
+        domain.compute_view(np.zeros((1, 1)))
+
+    domain.update({})
+    assert domain._bounds == {}
+
+    pyfms.fms.end()
+
+
+@pytest.mark.remove
+def test_remove_input_nml():
+    os.remove("input.nml")
+    assert not os.path.isfile("input.nml")
@@ -1,3 +1,5 @@
+import os
+
 import numpy as np
 
 import pyfms
@@ -82,6 +84,16 @@ def test_gather_1d():
     else:
         assert receive is None
 
+    # gather into a caller provided buffer
+    out = np.zeros(sbuf_size * npes, dtype=np.float64) if is_root_pe else None
+    receive = pyfms.mpp.gather(send, out=out)
+
+    if is_root_pe:
+        assert receive is out
+        np.testing.assert_array_equal(out, answers)
+    else:
+        assert receive is None
+
     pyfms.fms.end()
 
 
@@ -111,3 +123,161 @@ def test_gatherv_1d():
         assert receive is None
 
     pyfms.fms.end()
+
+
+def test_gather_levels():
+
+    pyfms.fms.init()
+
+    nx, ny = 12, 24
+    global_indices = [0, nx - 1, 0, ny - 1]
+
+    layout = pyfms.mpp_domains.define_layout(global_indices, pyfms.mpp.npes())
+    domain = pyfms.mpp_domains.define_domains(global_indices, layout)
+
+    is_root_pe = pyfms.mpp.pe() == pyfms.mpp.root_pe()
+
+    for levels in [(5,), (5, 3)]:
+
+        shape = (nx, ny) + levels
+        global_data = np.arange(np.prod(shape), dtype=np.float64).reshape(shape)
+        send = global_data[domain.isc : domain.iec + 1, domain.jsc : domain.jec + 1]
+
+        for sbuf in [np.ascontiguousarray(send), np.asfortranarray(send)]:
+
+            rbuf_shape = list(shape) if is_root_pe else None
+            gathered = pyfms.mpp.gather(sbuf, rbuf_shape=rbuf_shape, domain=domain)
+
+            if is_root_pe:
+                np.testing.assert_array_equal(gathered, global_data)
+                assert gathered.flags.f_contiguous == sbuf.flags.f_contiguous
+            else:
+                assert gathered is None
+
+    pyfms.fms.end()
+
+
+def test_gather_levels_fortran():
+
+    """
+    a Fortran ordered 3D field decomposed along y on
+    every PE gathers to the Fortran ordered global field
+    """
+
+    pyfms.fms.init()
+
+    nx, ny, nz = 6, 16, 3
+    npes = pyfms.mpp.npes()
+    global_indices = [0, nx - 1, 0, ny - 1]
+    domain = pyfms.mpp_domains.define_domains(global_indices, [1, npes])
+
+    is_root_pe = pyfms.mpp.pe() == pyfms.mpp.root_pe()
+
+    global_data = np.asfortranarray(
+        np.arange(nx * ny * nz, dtype=np.float64).reshape(nx, ny, nz)
+    )
+    sbuf = np.asfortranarray(
+        global_data[domain.isc : domain.iec + 1, domain.jsc : domain.jec + 1]
+    )
+    assert not sbuf.flags.c_contiguous
+
+    gathered = pyfms.mpp.gather(
+        sbuf, rbuf_shape=[nx, ny, nz] if is_root_pe else None, domain=domain
+    )
+
+    if is_root_pe:
+        assert gathered.flags.f_contiguous
+        np.testing.assert_array_equal(gathered, global_data)
+    else:
+        assert gathered is None
+
+    pyfms.fms.end()
+
+
+def test_gatherv_levels():
+
+    nz = 4
+
+    def buffer(ipe):
+        return np.array(
+            [[ipe * 100 + i * 10 + k for k in range(nz)] for i in range(ipe + 2)],
+            dtype=np.float64,
+        )
+
+    pyfms.fms.init()
+    pe = pyfms.mpp.pe()
+    npes = pyfms.mpp.npes()
+    is_root_pe = pe == pyfms.mpp.root_pe()
+
+    rsize = [ipe + 2 for ipe in range(npes)] if is_root_pe else None
+    receive = pyfms.mpp.gatherv(buffer(pe), ssize=pe + 2, rsize=rsize)
+
+    if is_root_pe:
+        answers = np.concatenate([buffer(ipe) for ipe in range(npes)])
+        np.testing.assert_array_equal(receive, answers)
+    else:
+        assert receive is None
+
+    pyfms.fms.end()
+
+
+def test_gather_to_file():
+
+    pyfms.fms.init()
+
+    nx, ny, nz = 12, 24, 3
+    global_indices = [0, nx - 1, 0, ny - 1]
+
+    layout = pyfms.mpp_domains.define_layout(global_indices, pyfms.mpp.npes())
+    domain = pyfms.mpp_domains.define_domains(global_indices, layout)
+
+    is_root_pe = pyfms.mpp.pe() == pyfms.mpp.root_pe()
+
+    for shape in [(nx, ny), (nx, ny, nz)]:
+
+        global_data = np.arange(np.prod(shape), dtype=np.float64).reshape(shape)
+        send = global_data[domain.isc : domain.iec + 1, domain.jsc : domain.jec + 1]
+
+        # bands of 5 rows do not line up with the compute domains
+        chunk_bytes = 5 * global_data[0].nbytes
+        path = pyfms.mpp.gather_to_file(
+            send, domain, "gathered.npy", chunk_bytes=chunk_bytes
+        )
+
+        if is_root_pe:
+            np.testing.assert_array_equal(np.load(path), global_data)
+            os.remove(path)
+        else:
+            assert path is None
+
+    pyfms.fms.end()
+
+
+def test_gatherv_exchange_sizes():
+    def buffer(ipe):
+        return np.arange(ipe + 2, dtype=np.float64) + ipe * 10
+
+    pyfms.fms.init()
+    pe = pyfms.mpp.pe()
+    npes = pyfms.mpp.npes()
+    is_root_pe = pe == pyfms.mpp.root_pe()
+
+    receive, views, offsets = pyfms.mpp.gatherv(
+        buffer(pe), exchange_sizes=True, get_views=True, get_offsets=True
+    )
+
+    if is_root_pe:
+        np.testing.assert_array_equal(
+            receive, np.concatenate([buffer(ipe) for ipe in range(npes)])
+        )
+        np.testing.assert_array_equal(
+            offsets, np.cumsum([0] + [ipe + 2 for ipe in range(npes)])
+        )
+        assert len(views) == npes
+        for ipe, view in enumerate(views):
+            assert np.shares_memory(view, receive)
+            np.testing.assert_array_equal(view, buffer(ipe))
+    else:
+        assert receive is None and views is None and offsets is None
+
+    pyfms.fms.end()
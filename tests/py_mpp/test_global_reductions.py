@@ -0,0 +1,99 @@
+import os
+
+import numpy as np
+import pytest
+
+import pyfms
+
+
+@pytest.mark.create
+def test_create_input_nml():
+    inputnml = open("input.nml", "w")
+    inputnml.close()
+    assert os.path.isfile("input.nml")
+
+
+@pytest.mark.parallel
+def test_global_reductions():
+
+    """
+    global_sum, global_max and global_min of data domain fields
+    match the reductions of the global field, halos excluded
+    """
+
+    nx = 8
+    ny = 8
+    nz = 3
+    npes = 4
+    halo = 2
+
+    pyfms.fms.init(ndomain=3)
+
+    global_indices = [0, (nx - 1), 0, (ny - 1)]
+    layout = pyfms.mpp_domains.define_layout(global_indices=global_indices, ndivs=npes)
+
+    domain = pyfms.mpp_domains.define_domains(
+        global_indices=global_indices,
+        layout=layout,
+        whalo=halo,
+        ehalo=halo,
+        shalo=halo,
+        nhalo=halo,
+    )
+
+    global_data = np.arange(nx * ny * nz, dtype=np.float64).reshape(nx, ny, nz)
+
+    field = domain.empty(nz=nz)
+    field.fill(1.0e6)
+    field.compute[...] = global_data[
+        domain.isc : domain.iec + 1, domain.jsc : domain.jec + 1
+    ]
+
+    for bitwise_exact in [False, True]:
+        total = pyfms.mpp_domains.global_sum(
+            field, domain.domain_id, bitwise_exact=bitwise_exact
+        )
+        assert isinstance(total, np.float64)
+        assert total == global_data.sum()
+
+    levels = pyfms.mpp_domains.global_sum(field, domain.domain_id, per_level=True)
+    assert np.array_equal(levels, global_data.sum(axis=(0, 1)))
+
+    assert pyfms.mpp_domains.global_max(field.compute, domain.domain_id) == (
+        global_data.max()
+    )
+    assert np.array_equal(
+        pyfms.mpp_domains.global_min(field, domain.domain_id, per_level=True),
+        global_data.min(axis=(0, 1)),
+    )
+
+    idata = np.ascontiguousarray(field[:, :, 0], dtype=np.int32)
+    assert pyfms.mpp_domains.global_max(idata, domain.domain_id) == (
+        global_data[:, :, 0].max()
+    )
+
+    # reproducing sums do not depend on the layout
+    rng = np.random.default_rng(0)
+    values = rng.standard_normal((nx, ny, nz)) * 10.0 ** rng.integers(-8, 8, nz)
+
+    totals = []
+    for layout in [[npes, 1], [1, npes]]:
+        domain = pyfms.mpp_domains.define_domains(
+            global_indices=global_indices, layout=layout
+        )
+        local = values[domain.isc : domain.iec + 1, domain.jsc : domain.jec + 1]
+        totals.append(
+            pyfms.mpp_domains.global_sum(
+                local, domain, bitwise_exact=True, per_level=True
+            )
+        )
+    assert np.array_equal(totals[0], totals[1])
+    assert np.allclose(totals[0], values.sum(axis=(0, 1)), rtol=1.0e-10, atol=0)
+
+    pyfms.fms.end()
+
+
+@pytest.mark.remove
+def test_remove_input_nml():
+    os.remove("input.nml")
+    assert not os.path.isfile("input.nml")
@@ -0,0 +1,101 @@
+import os
+
+import numpy as np
+import pytest
+
+import pyfms
+
+
+@pytest.mark.create
+def test_create_input_nml():
+    inputnml = open("input.nml", "w")
+    inputnml.close()
+    assert os.path.isfile("input.nml")
+
+
+@pytest.mark.parallel
+def test_group_update():
+
+    """
+    A group update of 2D to 5D fields in C and Fortran order
+    gives the same halos as updating each field separately,
+    and a group update can be repeated
+    """
+
+    nx = 8
+    ny = 8
+    npes = 4
+    halo = 2
+
+    pyfms.fms.init()
+
+    global_indices = [0, (nx - 1), 0, (ny - 1)]
+    layout = pyfms.mpp_domains.define_layout(global_indices=global_indices, ndivs=npes)
+
+    domain = pyfms.mpp_domains.define_domains(
+        global_indices=global_indices,
+        layout=layout,
+        whalo=halo,
+        ehalo=halo,
+        shalo=halo,
+        nhalo=halo,
+        xflags=pyfms.mpp_domains.CYCLIC_GLOBAL_DOMAIN,
+        yflags=pyfms.mpp_domains.CYCLIC_GLOBAL_DOMAIN,
+    )
+    halos = dict(whalo=halo, ehalo=halo, shalo=halo, nhalo=halo)
+
+    def field(shape, order="C"):
+        data = np.zeros((domain.xsize_d, domain.ysize_d) + shape, order=order)
+        compute = data[halo:-halo, halo:-halo]
+        compute[...] = pyfms.mpp.pe() * 1000 + np.arange(compute.size).reshape(
+            compute.shape
+        )
+        return data
+
+    fields = [
+        field(()),
+        field((3,), order="F"),
+        field((2, 3)),
+        field((2, 2, 2), order="F"),
+    ]
+    fieldx, fieldy = field((3,)), field((3,))
+
+    answers = [data.copy(order="K") for data in fields]
+    for answer in answers:
+        pyfms.mpp_domains.update_domains(answer, domain.domain_id, **halos)
+    answerx, answery = fieldx.copy(), fieldy.copy()
+    pyfms.mpp_domains.vector_update_domains(answerx, answery, domain.domain_id, **halos)
+
+    group = pyfms.mpp_domains.create_group_update(
+        domain, fields, vector_fields=[(fieldx, fieldy)], **halos
+    )
+    assert len(group) == 6
+
+    for _ in range(2):
+        pyfms.mpp_domains.do_group_update(group)
+
+        for data, answer in zip(fields, answers):
+            assert np.array_equal(data, answer)
+        assert np.array_equal(fieldx, answerx)
+        assert np.array_equal(fieldy, answery)
+
+    pyfms.mpp_domains.clear_group_update(group)
+    assert len(group) == 0
+    with pytest.raises(RuntimeError):
+        pyfms.mpp_domains.do_group_update(group)
+
+    # fields must be on the data domain and of the same dtype
+    with pytest.raises(RuntimeError):
+        pyfms.mpp_domains.create_group_update(domain, [fields[0][::2]])
+    with pytest.raises(RuntimeError):
+        pyfms.mpp_domains.create_group_update(
+            domain, [fields[0], fields[0].astype(np.float32)]
+        )
+
+    pyfms.fms.end()
+
+
+@pytest.mark.remove
+def test_remove_input_nml():
+    os.remove("input.nml")
+    assert not os.path.isfile("input.nml")
@@ -0,0 +1,60 @@
+import os
+
+import numpy as np
+import pytest
+
+import pyfms
+
+
+@pytest.mark.create
+def test_create_input_nml():
+    inputnml = open("input.nml", "w")
+    inputnml.close()
+    assert os.path.isfile("input.nml")
+
+
+@pytest.mark.parallel
+def test_pelist_cache():
+
+    """
+    pe, npes, root_pe and the current pelist are cached
+    and refreshed when the current pelist is set
+    """
+
+    pyfms.fms.init()
+
+    npes = pyfms.mpp.npes()
+    pe = pyfms.mpp.pe()
+    assert npes == 4
+
+    pelist = pyfms.mpp.get_current_pelist_array()
+    assert pelist.dtype == np.int32
+    assert not pelist.flags.writeable
+    assert pelist.tolist() == list(range(npes))
+    assert pyfms.mpp.get_current_pelist_array() is pelist
+    assert pyfms.mpp.get_current_pelist(npes) == pelist.tolist()
+
+    subpelist = [2, 3] if pe >= 2 else [0, 1]
+    pyfms.mpp.declare_pelist([0, 1], name="test pelist 0")
+    pyfms.mpp.declare_pelist([2, 3], name="test pelist 1")
+    pyfms.mpp.set_current_pelist(subpelist)
+
+    assert pyfms.mpp.npes() == 2
+    assert pyfms.mpp.pe() == pe
+    assert pyfms.mpp.root_pe() == subpelist[0]
+    assert pyfms.mpp.get_current_pelist_array().tolist() == subpelist
+    assert pyfms.mpp.get_current_pelist(2) == subpelist
+
+    pyfms.mpp.set_current_pelist()
+
+    assert pyfms.mpp.npes() == npes
+    assert pyfms.mpp.root_pe() == 0
+    assert pyfms.mpp.get_current_pelist_array().tolist() == list(range(npes))
+
+    pyfms.fms.end()
+
+
+@pytest.mark.remove
+def test_remove_input_nml():
+    os.remove("input.nml")
+    assert not os.path.isfile("input.nml")
@@ -0,0 +1,68 @@
+import os
+
+import pytest
+
+import pyfms
+
+
+@pytest.mark.create
+def test_create_input_nml():
+    inputnml = open("input.nml", "w")
+    inputnml.close()
+    assert os.path.isfile("input.nml")
+
+
+@pytest.mark.parallel
+def test_pelist_registry():
+
+    """
+    Declaring a pelist again returns its commID without declaring
+    it, and declared pelists can be set current by name
+    """
+
+    pyfms.fms.init()
+
+    pe = pyfms.mpp.pe()
+    npes = pyfms.mpp.npes()
+    assert npes == 4
+
+    commIDs = [
+        pyfms.mpp.declare_pelist([0, 1], name="test registry 0"),
+        pyfms.mpp.declare_pelist([2, 3], name="test registry 1"),
+    ]
+    assert pyfms.mpp.get_pelist_stats() == dict(declared=2, avoided=0, names=2)
+
+    # declared again, for another component
+    assert pyfms.mpp.declare_pelist([0, 1], name="test registry 2") == commIDs[0]
+    assert pyfms.mpp.declare_pelist([2, 3]) == commIDs[1]
+    assert pyfms.mpp.get_pelist_stats() == dict(declared=2, avoided=2, names=3)
+    assert pyfms.mpp.get_declared_pelist("test registry 2") == [0, 1]
+
+    name = "test registry 1" if pe >= 2 else "test registry 2"
+    subpelist = [2, 3] if pe >= 2 else [0, 1]
+    pyfms.mpp.set_current_pelist(name=name)
+
+    assert pyfms.mpp.npes() == 2
+    assert pyfms.mpp.root_pe() == subpelist[0]
+    assert pyfms.mpp.get_current_pelist_array().tolist() == subpelist
+
+    pyfms.mpp.set_current_pelist()
+    assert pyfms.mpp.npes() == npes
+
+    with pytest.raises(RuntimeError):
+        pyfms.mpp.set_current_pelist(name="not declared")
+
+    # the communicators of the pelists are cleared with the registry
+    pyfms.mpp.sum(pe, pelist=[0, 1] if pe < 2 else [2, 3])
+    assert pyfms.mpp._pelist_comms
+    pyfms.mpp.clear_pelist_registry()
+    assert not pyfms.mpp._pelist_comms
+    assert pyfms.mpp.get_pelist_stats() == dict(declared=0, avoided=0, names=0)
+
+    pyfms.fms.end()
+
+
+@pytest.mark.remove
+def test_remove_input_nml():
+    os.remove("input.nml")
+    assert not os.path.isfile("input.nml")
@@ -0,0 +1,84 @@
+import os
+
+import numpy as np
+import pytest
+
+import pyfms
+
+
+@pytest.mark.create
+def test_create_input_nml():
+    inputnml = open("input.nml", "w")
+    inputnml.close()
+    assert os.path.isfile("input.nml")
+
+
+@pytest.mark.parallel
+def test_redistribute():
+
+    """
+    data domain fields redistributed from a layout of
+    npes x 1 to a layout of 1 x npes match the global field
+    """
+
+    nx = 8
+    ny = 8
+    nz = 3
+    npes = 4
+    halo = 1
+
+    pyfms.fms.init(ndomain=2)
+
+    global_indices = [0, (nx - 1), 0, (ny - 1)]
+    domains = [
+        pyfms.mpp_domains.define_domains(
+            global_indices=global_indices,
+            layout=layout,
+            whalo=halo,
+            ehalo=halo,
+            shalo=halo,
+            nhalo=halo,
+        )
+        for layout in [[npes, 1], [1, npes]]
+    ]
+    domain_in, domain_out = domains
+
+    global_data = np.arange(nx * ny * nz, dtype=np.float64).reshape(nx, ny, nz)
+
+    def compute(domain):
+        return global_data[domain.isc : domain.iec + 1, domain.jsc : domain.jec + 1]
+
+    field_in = domain_in.zeros(nz=nz)
+    field_out = domain_out.zeros(nz=nz)
+
+    # the second iteration reuses the planned redistribution
+    for step in range(2):
+        field_in.compute[...] = compute(domain_in) + step
+        result = pyfms.mpp_domains.redistribute(
+            domain_in, field_in, domain_out, field_out
+        )
+        assert result is field_out
+        assert np.array_equal(field_out.compute, compute(domain_out) + step)
+
+    # Fortran ordered compute domain fields of other dtypes
+    field_in = np.asfortranarray(compute(domain_in), dtype=np.float32)
+    field_out = np.zeros_like(np.asfortranarray(compute(domain_out)), dtype=np.float32)
+    pyfms.mpp_domains.redistribute(domain_in, field_in, domain_out, field_out)
+    assert np.array_equal(field_out, compute(domain_out))
+
+    # the fields must have the same dtype
+    with pytest.raises(RuntimeError):
+        pyfms.mpp_domains.redistribute(
+            domain_in, field_in, domain_out, field_out.astype(np.float64)
+        )
+
+    pyfms.mpp_domains.clear_redistribute(domain_in, domain_out)
+    assert not pyfms.mpp_domains._redistributions
+
+    pyfms.fms.end()
+
+
+@pytest.mark.remove
+def test_remove_input_nml():
+    os.remove("input.nml")
+    assert not os.path.isfile("input.nml")
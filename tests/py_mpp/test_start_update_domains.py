@@ -0,0 +1,84 @@
+import os
+
+import numpy as np
+import pytest
+
+import pyfms
+
+
+@pytest.mark.create
+def test_create_input_nml():
+    inputnml = open("input.nml", "w")
+    inputnml.close()
+    assert os.path.isfile("input.nml")
+
+
+@pytest.mark.parallel
+def test_start_update_domains():
+
+    """
+    Non-blocking scalar and vector updates give the
+    same halos as the blocking updates
+    """
+
+    nx = 8
+    ny = 8
+    npes = 4
+    halo = 2
+
+    pyfms.fms.init()
+
+    global_indices = [0, (nx - 1), 0, (ny - 1)]
+    layout = pyfms.mpp_domains.define_layout(global_indices=global_indices, ndivs=npes)
+
+    domain = pyfms.mpp_domains.define_domains(
+        global_indices=global_indices,
+        layout=layout,
+        whalo=halo,
+        ehalo=halo,
+        shalo=halo,
+        nhalo=halo,
+        xflags=pyfms.mpp_domains.CYCLIC_GLOBAL_DOMAIN,
+        yflags=pyfms.mpp_domains.CYCLIC_GLOBAL_DOMAIN,
+    )
+    halos = dict(whalo=halo, ehalo=halo, shalo=halo, nhalo=halo)
+
+    def field(order="C"):
+        data = np.zeros((domain.xsize_d, domain.ysize_d, 3), order=order)
+        compute = data[halo:-halo, halo:-halo]
+        compute[...] = pyfms.mpp.pe() * 1000 + np.arange(compute.size).reshape(
+            compute.shape
+        )
+        return data
+
+    for order in ["C", "F"]:
+
+        data, fieldx, fieldy = field(order), field(order), field(order)
+
+        answer = data.copy(order="K")
+        pyfms.mpp_domains.update_domains(answer, domain.domain_id, **halos)
+        answerx, answery = fieldx.copy(order="K"), fieldy.copy(order="K")
+        pyfms.mpp_domains.vector_update_domains(
+            answerx, answery, domain.domain_id, **halos
+        )
+
+        with pyfms.mpp_domains.start_update_domains(data, domain, **halos) as handle:
+            assert not handle.completed
+        assert handle.completed
+        assert np.array_equal(data, answer)
+
+        handle = pyfms.mpp_domains.start_vector_update_domains(
+            fieldx, fieldy, domain, **halos
+        )
+        pyfms.mpp_domains.complete_update_domains(handle)
+        pyfms.mpp_domains.complete_update_domains(handle)
+        assert np.array_equal(fieldx, answerx)
+        assert np.array_equal(fieldy, answery)
+
+    pyfms.fms.end()
+
+
+@pytest.mark.remove
+def test_remove_input_nml():
+    os.remove("input.nml")
+    assert not os.path.isfile("input.nml")
@@ -4,6 +4,7 @@ import numpy as np
 import pytest
 
 import pyfms
+from pyfms.utils.ctypes_utils import get_array_copies, reset_array_copies
 
 
 @pytest.mark.create
@@ -100,16 +101,23 @@ def test_update_domains():
         for j in range(domain.ysize_c):
             idata[whalo + i][shalo + j] = global_data[isc + i][jsc + j]
 
-    pyfms.mpp_domains.update_domains(
-        field=idata,
-        domain_id=domain.domain_id,
-        whalo=whalo,
-        ehalo=ehalo,
-        shalo=shalo,
-        nhalo=nhalo,
-    )
+    # Fortran ordered data is updated in place without a copy
+    fdata = np.asfortranarray(idata)
+    reset_array_copies()
+
+    for field in [idata, fdata]:
+        pyfms.mpp_domains.update_domains(
+            field=field,
+            domain_id=domain.domain_id,
+            whalo=whalo,
+            ehalo=ehalo,
+            shalo=shalo,
+            nhalo=nhalo,
+        )
+
+        assert np.array_equal(field, answers[pyfms.mpp.pe()])
 
-    assert np.array_equal(idata, answers[pyfms.mpp.pe()])
+    assert get_array_copies() == {}
 
     pyfms.fms.end()
 
@@ -28,7 +28,8 @@ function run_test() {
 
 test="test_fms.py"
 create_input $test
-run_test "python -m pytest $flags -m parallel $test"
+run_test "python -m pytest $flags -m parallel $test::test_pyfms_init"
+run_test "python -m pytest $flags -m parallel $test::test_pyfms_init_mpi4py_comm"
 remove_input $test
 
 test="py_mpp/test_define_domains.py"
@@ -47,16 +48,62 @@ create_input $test
 run_test "mpirun -n 4 $oversubscribe pytest $flags -m 'parallel' $test"
 remove_input $test
 
+test="py_mpp/test_autotune_layout.py"
+create_input $test
+run_test "mpirun -n 4 $oversubscribe pytest $flags -m 'parallel' $test"
+remove_input $test
+
+test="py_mpp/test_domain_arrays.py"
+create_input $test
+run_test "mpirun -n 4 $oversubscribe pytest $flags -m 'parallel' $test::test_domain_arrays"
+run_test "mpirun -n 4 $oversubscribe pytest $flags -m 'parallel' $test::test_domain_bounds"
+remove_input $test
+
 test="py_mpp/test_update_domains.py"
 create_input $test
 run_test "mpirun -n 4 $oversubscribe pytest $flags -m 'parallel' $test"
 remove_input $test
 
+test="py_mpp/test_group_update.py"
+create_input $test
+run_test "mpirun -n 4 $oversubscribe pytest $flags -m 'parallel' $test"
+remove_input $test
+
+test="py_mpp/test_start_update_domains.py"
+create_input $test
+run_test "mpirun -n 4 $oversubscribe pytest $flags -m 'parallel' $test"
+remove_input $test
+
+touch -a input.nml
+run_test "mpirun -n 4 $oversubscribe python ../benchmarks/bench_overlap.py --nsteps 5"
+run_test "mpirun -n 4 $oversubscribe python ../benchmarks/bench_gather_levels.py --nsteps 5"
+rm -f input.nml
+
+test="py_mpp/test_global_reductions.py"
+create_input $test
+run_test "mpirun -n 4 $oversubscribe pytest $flags -m 'parallel' $test"
+remove_input $test
+
+test="py_mpp/test_redistribute.py"
+create_input $test
+run_test "mpirun -n 4 $oversubscribe pytest $flags -m 'parallel' $test"
+remove_input $test
+
 test="py_mpp/test_vector_update_domains.py"
 create_input $test
 run_test "mpirun -n 2 $oversubscribe pytest $flags -m 'parallel' $test"
 remove_input $test
 
+test="py_mpp/test_pelist_cache.py"
+create_input $test
+run_test "mpirun -n 4 $oversubscribe pytest $flags -m 'parallel' $test"
+remove_input $test
+
+test="py_mpp/test_pelist_registry.py"
+create_input $test
+run_test "mpirun -n 4 $oversubscribe pytest $flags -m 'parallel' $test"
+remove_input $test
+
 touch -a input.nml
 test="py_mpp/test_gather.py"
 run_test "mpirun -n 4 $oversubscribe pytest $flags $test::test_gather_2d"
@@ -72,6 +119,54 @@ test="py_mpp/test_gather.py"
 run_test "mpirun -n 4 $oversubscribe pytest $flags $test::test_gatherv_1d"
 rm -f input.nml
 
+touch -a input.nml
+test="py_mpp/test_gather.py"
+run_test "mpirun -n 4 $oversubscribe pytest $flags $test::test_gather_levels"
+rm -f input.nml
+
+touch -a input.nml
+test="py_mpp/test_gather.py"
+run_test "mpirun -n 4 $oversubscribe pytest $flags $test::test_gather_levels_fortran"
+rm -f input.nml
+
+touch -a input.nml
+test="py_mpp/test_gather.py"
+run_test "mpirun -n 4 $oversubscribe pytest $flags $test::test_gatherv_levels"
+rm -f input.nml
+
+touch -a input.nml
+test="py_mpp/test_gather.py"
+run_test "mpirun -n 4 $oversubscribe pytest $flags $test::test_gatherv_exchange_sizes"
+rm -f input.nml
+
+touch -a input.nml
+test="py_mpp/test_gather.py"
+run_test "mpirun -n 4 $oversubscribe pytest $flags $test::test_gather_to_file"
+rm -f input.nml
+
+touch -a input.nml
+test="py_mpp/test_collectives.py"
+run_test "mpirun -n 4 $oversubscribe pytest $flags $test::test_reductions"
+run_test "mpirun -n 4 $oversubscribe pytest $flags $test::test_broadcast"
+run_test "mpirun -n 4 $oversubscribe pytest $flags $test::test_scatter"
+run_test "mpirun -n 4 $oversubscribe pytest $flags $test::test_nonblocking_collectives"
+rm -f input.nml
+
+touch -a input.nml
+test="py_mpp/test_comm.py"
+run_test "mpirun -n 4 $oversubscribe pytest $flags $test"
+rm -f input.nml
+
+touch -a input.nml
+test="py_mpp/test_clock.py"
+run_test "mpirun -n 4 $oversubscribe pytest $flags $test"
+rm -f input.nml
+
+touch -a input.nml
+test="py_mpp/test_chksum.py"
+run_test "mpirun -n 4 $oversubscribe pytest $flags $test"
+rm -f input.nml
+
 test="py_horiz_interp/test_horiz_interp.py"
 create_input $test
 run_test "pytest $flags  ${test}::test_create_xgrid"
@@ -91,6 +186,21 @@ run_test "mpirun -n 1 pytest $flags py_diag_manager/test_diag_manager.py"
 
 run_test "pytest $flags utils/test_constants.py"
 run_test "pytest $flags utils/test_get_grid_area.py"
+run_test "pytest $flags utils/test_call_plan.py"
+run_test "pytest $flags utils/test_set_cf_arrays.py"
+run_test "pytest $flags utils/test_buffers.py"
+run_test "pytest $flags utils/test_backends.py"
+
+test="utils/test_profile.py"
+create_input $test
+run_test "mpirun -n 2 $oversubscribe pytest $flags -m 'parallel' $test"
+remove_input $test
+
+test="utils/test_imbalance.py"
+create_input $test
+run_test "mpirun -n 4 $oversubscribe pytest $flags -m 'parallel' $test::test_imbalance"
+run_test "mpirun -n 4 $oversubscribe pytest $flags -m 'parallel' $test::test_imbalance_domain_pelist"
+remove_input $test
 
 run_test "pytest $flags test_init.py"
 
@@ -24,6 +24,15 @@ def test_pyfms_init():
     pyfms.fms.end()
 
 
+@pytest.mark.parallel
+def test_pyfms_init_mpi4py_comm():
+
+    pyfms.fms.init(localcomm=MPI.COMM_WORLD)
+    assert pyfms.fms.module_is_initialized()
+
+    pyfms.fms.end()
+
+
 @pytest.mark.remove
 def test_remove_input_nml():
     os.remove("input.nml")
@@ -1,15 +1,38 @@
+import subprocess
+import sys
+
 import pytest
 
 import pyfms
 
 
+def test_lazy_import():
+
+    """
+    Test to ensure importing pyfms does not load the
+    library and only the accessed modules are bound
+    """
+
+    code = (
+        "import sys, pyfms\n"
+        "assert pyfms.cfms._lib is None\n"
+        "assert 'pyfms.py_mpp.mpp_domains' not in sys.modules\n"
+        "pyfms.mpp.npes\n"
+        "assert pyfms.cfms._lib is not None\n"
+        "assert 'pyfms.py_mpp.mpp' in pyfms.cfms._bound\n"
+        "assert 'pyfms.py_mpp.mpp_domains' not in pyfms.cfms._bound\n"
+        "assert 'pyfms.py_horiz_interp.horiz_interp' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
 def test_library_loaded():
 
     """
     Test to ensure library loaded automatically
     """
 
-    assert pyfms.cfms._lib is not None
+    assert pyfms.cfms.lib() is not None
 
 
 def test_share_same_library():
@@ -19,7 +42,8 @@ def test_share_same_library():
     ctypes CDLL library object
     """
 
-    assert id(pyfms.cfms._lib) == id(pyfms.mpp_domains._lib)
+    mpp_domains = pyfms.mpp_domains
+    assert id(pyfms.cfms._lib) == id(mpp_domains._lib)
 
 
 @pytest.mark.xfail
@@ -0,0 +1,55 @@
+import ctypes
+
+import numpy as np
+import pytest
+from numpy.ctypeslib import ndpointer
+
+from pyfms.utils.backends import _converter, c_type, load
+
+
+def test_c_type():
+
+    assert c_type(None) == "void"
+    assert c_type(ctypes.c_int) == "int"
+    assert c_type(ctypes.c_char_p) == "char *"
+    assert c_type(ctypes.POINTER(ctypes.c_double)) == "double *"
+    assert c_type(ctypes.POINTER(ctypes.c_bool)) == "bool *"
+    assert c_type(ndpointer(dtype=np.float32, ndim=2, flags="C")) == "float *"
+    assert c_type(ndpointer(dtype=np.int32, ndim=1, flags="C")) == "int *"
+
+
+def test_unknown_backend():
+
+    with pytest.raises(RuntimeError):
+        load("libcFMS.so", backend="swig")
+
+
+def test_cffi_converters():
+
+    cffi = pytest.importorskip("cffi")
+    ffi = cffi.FFI()
+
+    argtype = ndpointer(dtype=np.float64, ndim=2, flags="C")
+    convert = _converter(ffi, argtype, c_type(argtype), "test", 0)
+
+    array = np.arange(6, dtype=np.float64).reshape(2, 3)
+    pointer = convert(array)
+    assert pointer[5] == 5.0
+    assert convert(pointer) is pointer
+    assert convert(None) == ffi.NULL
+
+    for bad in [array.astype(np.float32), np.asfortranarray(array), array[0]]:
+        with pytest.raises(TypeError):
+            convert(bad)
+
+    argtype = ctypes.POINTER(ctypes.c_int)
+    convert = _converter(ffi, argtype, c_type(argtype), "test", 0)
+
+    box = ctypes.c_int(3)
+    pointer = convert(box)
+    box.value = 4
+    assert pointer[0] == 4
+
+    argtype = ctypes.c_char_p
+    convert = _converter(ffi, argtype, c_type(argtype), "test", 0)
+    assert ffi.string(convert(ctypes.c_char_p(b"pyfms"))) == b"pyfms"
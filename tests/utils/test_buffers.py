@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from pyfms.utils.buffers import (
+    BufferPool,
+    disable_pool,
+    empty_aligned,
+    enable_pool,
+    get_buffer,
+)
+
+
+def test_buffer_pool():
+
+    pool = BufferPool(maxbytes=1000)
+
+    # a buffer held by the caller is not reused
+    a = pool.get((10,), np.float64)
+    b = pool.get((10,), np.float64)
+    assert a is not b
+    assert pool.nbytes == 160
+
+    # a released buffer is reused and zeroed
+    a.fill(1.0)
+    a_id = id(a)
+    del a
+    c = pool.get((10,), np.float64)
+    assert id(c) == a_id
+    assert pool.hits == 1
+    assert np.all(c == 0)
+
+    # a buffer is in use while a view of it is held
+    view = c.T[2:]
+    del c
+    d = pool.get((10,), np.float64)
+    assert id(d) != a_id
+
+    # free buffers are evicted to keep the pool bounded
+    del view, b, d
+    e = pool.get((100,), np.float64)
+    assert pool.nbytes <= pool.maxbytes
+    assert pool.evictions == 1
+
+    # buffers larger than the pool are not pooled
+    f = pool.get((200,), np.float64)
+    assert f.shape == (200,)
+    assert pool.nbytes == e.nbytes
+
+
+def test_get_buffer():
+
+    out = np.zeros((4, 5), dtype=np.float32)
+    assert get_buffer((4, 5), np.float32, out) is out
+
+    with pytest.raises(RuntimeError):
+        get_buffer((5, 4), np.float32, out)
+    with pytest.raises(RuntimeError):
+        get_buffer((4, 5), np.float64, out)
+    with pytest.raises(RuntimeError):
+        get_buffer((5, 4), np.float32, out.T)
+
+    pool = enable_pool()
+    buffer = get_buffer((4, 5), np.float32)
+    assert pool.misses == 1
+    buffer.fill(1.0)
+    del buffer
+    assert np.all(get_buffer((4, 5), np.float32) == 0)
+    assert pool.hits == 1
+    disable_pool()
+
+    assert np.all(get_buffer((4, 5), np.float32) == 0)
+
+
+def test_empty_aligned():
+
+    for order in ["C", "F"]:
+        array = empty_aligned((5, 7, 3), np.float32, order=order)
+        assert array.shape == (5, 7, 3)
+        assert array.dtype == np.float32
+        assert array.flags[order]
+        assert array.ctypes.data % 64 == 0
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+import pyfms
+from pyfms.utils.ctypes_utils import CallPlan
+
+
+def test_call_plan():
+
+    """
+    Test CallPlan by calling cFMS_define_layout
+    with a plan and comparing to mpp_domains.define_layout
+    """
+
+    # accessing mpp_domains binds the argtypes of cFMS_define_layout
+    mpp_domains = pyfms.mpp_domains
+    plan = CallPlan(pyfms.cfms.lib().cFMS_define_layout)
+
+    global_indices = (0, 95, 0, 47)
+    answer = mpp_domains.define_layout(list(global_indices), 8)
+
+    for _ in range(3):
+        layout = np.zeros(2, dtype=np.int32)
+        plan(global_indices, 8, layout)
+        assert layout.tolist() == answer
+
+    # the global_indices array is built once and reused
+    assert len(plan._tuples) == 1
+
+    with pytest.raises(TypeError):
+        plan(global_indices, 8)
+
+    # a fresh function pointer has no argtypes and cannot be planned
+    with pytest.raises(RuntimeError):
+        CallPlan(pyfms.cfms.lib()["cFMS_define_layout"])
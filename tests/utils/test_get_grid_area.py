@@ -19,3 +19,9 @@ def test_get_grid_area():
     area_true = pyfms.grid_utils.get_grid_area(x_true, y_true, convert_cf_order=True)
 
     np.testing.assert_array_equal(area_false, area_true.T)
+
+    # results are written to out
+    out = np.empty_like(area_true)
+    area = pyfms.grid_utils.get_grid_area(x_true, y_true, out=out)
+    assert np.shares_memory(area, out)
+    np.testing.assert_array_equal(out, area_true)
@@ -0,0 +1,112 @@
+import os
+import time
+
+import numpy as np
+import pytest
+
+import pyfms
+
+
+@pytest.mark.create
+def test_create_input_nml():
+    inputnml = open("input.nml", "w")
+    inputnml.close()
+    assert os.path.isfile("input.nml")
+
+
+@pytest.mark.parallel
+def test_imbalance():
+
+    pyfms.fms.init()
+
+    pe = pyfms.mpp.pe()
+    npes = pyfms.mpp.npes()
+    is_root_pe = pe == pyfms.mpp.root_pe()
+    slowest = npes - 1
+
+    pyfms.imbalance.enable()
+    assert pyfms.imbalance.is_enabled()
+
+    # the slowest PE computes longer before the gather
+    time.sleep(0.2 if pe == slowest else 0.01)
+    pyfms.mpp.gather(np.arange(3.0), rbuf_size=3 * npes if is_root_pe else None)
+
+    stats = pyfms.imbalance.get_stats()
+    ((function, site),) = stats
+    assert function == "mpp.gather"
+    assert site.startswith("test_imbalance.py:")
+    assert stats[(function, site)]["calls"] == 1
+    if pe != slowest:
+        assert stats[(function, site)]["wait"] > 0.1
+
+    summary = pyfms.imbalance.step()
+    if is_root_pe:
+        assert f"slowest PE {slowest}" in summary
+        assert "mpp.gather, test_imbalance.py" in summary
+    else:
+        assert summary is None
+
+    pyfms.imbalance.disable()
+    assert not pyfms.imbalance.is_enabled()
+    assert pyfms.mpp.gather.__name__ == "gather"
+    assert not hasattr(pyfms.mpp.gather, "__wrapped__")
+
+    pyfms.fms.end()
+
+
+@pytest.mark.parallel
+def test_imbalance_domain_pelist():
+
+    """
+    The wait before a halo update is measured on the pelist of the
+    domain, so a domain on part of the current pelist is updated
+    without the other PEs
+    """
+
+    pyfms.fms.init()
+
+    pe = pyfms.mpp.pe()
+    npes = pyfms.mpp.npes()
+    pelist = list(range(max(npes // 2, 1)))
+
+    pyfms.mpp.declare_pelist(pelist)
+    if pe in pelist:
+        pyfms.mpp.set_current_pelist(pelist)
+        domain = pyfms.mpp_domains.define_domains(
+            [0, 15, 0, 15],
+            [1, len(pelist)],
+            whalo=1,
+            ehalo=1,
+            shalo=1,
+            nhalo=1,
+        )
+    pyfms.mpp.set_current_pelist()
+
+    pyfms.imbalance.enable()
+
+    if pe in pelist:
+        field = np.zeros((domain.xsize_d, domain.ysize_d))
+        pyfms.mpp_domains.update_domains(field, domain.domain_id)
+        group = pyfms.mpp_domains.create_group_update(domain, [field])
+        pyfms.mpp_domains.do_group_update(group)
+
+        stats = pyfms.imbalance.get_stats()
+        functions = sorted(function for function, _ in stats)
+        assert functions == [
+            "mpp_domains.do_group_update",
+            "mpp_domains.update_domains",
+        ]
+
+    summary = pyfms.imbalance.step()
+    if pe == pyfms.mpp.root_pe():
+        assert "mpp_domains.update_domains, test_imbalance.py" in summary
+
+    pyfms.imbalance.disable()
+
+    pyfms.fms.end()
+
+
+@pytest.mark.remove
+def test_remove_input_nml():
+    os.remove("input.nml")
+    assert not os.path.isfile("input.nml")
@@ -0,0 +1,61 @@
+import ctypes
+import os
+
+import pytest
+
+import pyfms
+
+
+@pytest.mark.create
+def test_create_input_nml():
+    inputnml = open("input.nml", "w")
+    inputnml.close()
+    assert os.path.isfile("input.nml")
+
+
+@pytest.mark.parallel
+def test_profile():
+
+    pyfms.fms.init()
+
+    pyfms.profile.enable(report_at_end=False)
+    assert pyfms.profile.is_enabled()
+    assert not isinstance(pyfms.mpp._cFMS_npes, ctypes._CFuncPtr)
+
+    # npes is cached by mpp until the cache is cleared
+    pyfms.profile.reset()
+    for _ in range(10):
+        pyfms.mpp.clear_pelist_cache()
+        pyfms.mpp.npes()
+
+    stats = pyfms.profile.get_stats()
+    assert stats["cFMS_npes"]["calls"] == 10
+    assert stats["cFMS_npes"]["total"] >= stats["cFMS_npes"]["max"]
+
+    # statistics recorded on one PE only are reported
+    name = f"region of pe {pyfms.mpp.pe()}"
+    pyfms.profile._record(name, 1.0)
+
+    text = pyfms.profile.report()
+    if pyfms.mpp.pe() == pyfms.mpp.root_pe():
+        assert "cFMS_npes" in text
+        for pe in pyfms.mpp.get_current_pelist_array():
+            assert f"region of pe {pe}" in text
+    else:
+        assert text is None
+
+    pyfms.profile.disable()
+    assert not pyfms.profile.is_enabled()
+    assert isinstance(pyfms.mpp._cFMS_npes, ctypes._CFuncPtr)
+    assert isinstance(
+        pyfms.mpp_domains._cFMS_update_domains[2]["float64"].function,
+        ctypes._CFuncPtr,
+    )
+
+    pyfms.fms.end()
+
+
+@pytest.mark.remove
+def test_remove_input_nml():
+    os.remove("input.nml")
+    assert not os.path.isfile("input.nml")
@@ -0,0 +1,69 @@
+import numpy as np
+
+from pyfms.utils.ctypes_utils import (
+    copy_back,
+    get_array_copies,
+    reset_array_copies,
+    set_array,
+    set_cf_arrays,
+)
+
+
+def test_set_cf_arrays_fortran():
+
+    """
+    Fortran ordered arrays are passed through as
+    C ordered views with convert_cf_order flipped
+    """
+
+    reset_array_copies()
+
+    field = np.asfortranarray(np.arange(12, dtype=np.float64).reshape(3, 4))
+    mask = np.asfortranarray(np.ones((3, 4), dtype=np.float64))
+
+    (cfield, cmask, none), convert_cf_order = set_cf_arrays(
+        [field, mask, None], convert_cf_order=True
+    )
+
+    assert convert_cf_order is False
+    assert none is None
+    assert cfield.flags["C"] and cmask.flags["C"]
+    assert np.shares_memory(cfield, field)
+    assert cfield.shape == (4, 3)
+    assert get_array_copies() == {}
+
+
+def test_set_cf_arrays_copy():
+
+    """
+    Arrays that cannot be passed without a copy are copied,
+    counted, and copied back into the original array
+    """
+
+    reset_array_copies()
+
+    data = np.zeros((6, 8), dtype=np.float32)
+    field = data[::2, ::2]
+    copyback = []
+
+    (cfield,), convert_cf_order = set_cf_arrays(
+        [field], convert_cf_order=True, copyback=copyback, whoami="test"
+    )
+
+    assert convert_cf_order is True
+    assert cfield.flags["C"]
+    assert not np.shares_memory(cfield, data)
+
+    cfield[...] = 1.0
+    copy_back(copyback)
+
+    assert np.all(data[::2, ::2] == 1.0)
+    assert np.all(data[1::2, :] == 0.0)
+    assert get_array_copies() == {"test": dict(copies=1, nbytes=cfield.nbytes)}
+
+    arglist = []
+    set_array(np.zeros((4, 4)).T[:, ::2], arglist)
+    assert "test_set_cf_arrays.test_set_cf_arrays_copy" in get_array_copies()
+
+    reset_array_copies()
+    assert get_array_copies() == {}